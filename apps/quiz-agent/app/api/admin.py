@@ -4,6 +4,7 @@ Secured endpoints for importing and managing questions.
 Requires ADMIN_API_KEY for authentication.
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
 from pydantic import BaseModel, Field
@@ -19,10 +20,15 @@ from quiz_shared.database.question_store import QuestionStore
 from ..rate_limit import limiter
 
 
-from .deps import get_question_store
+from .deps import get_question_store, invalidate_served_questions
 
 router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
 
+# Admin store writes in flight at once (forced imports, review-status flips).
+# Each is a pooled Postgres write (plus an embedding round trip for
+# `store.add`); kept under the pool size.
+IMPORT_WRITE_CONCURRENCY = 4
+
 
 def verify_admin_key(
     x_admin_key: str = Header(..., description="Admin API key for authentication"),
@@ -146,6 +152,8 @@ class ReviewStatusUpdateResponse(BaseModel):
     unchanged_count: int
     not_found_count: int
     not_found_ids: List[str] = []
+    failed_count: int = 0
+    failed_ids: List[str] = []
 
 
 class QuestionStats(BaseModel):
@@ -171,16 +179,30 @@ async def import_questions(
     failed = 0
     skipped_ids = []
     failed_ids = []
+    # Forced imports skip the similarity check, so their writes are independent
+    # and run concurrently after the loop.
+    to_add: List[Question] = []
+
+    # One round trip for the ID check instead of a blocking get per question.
+    seen_ids: set = set()
+    if import_request.skip_duplicates:
+        existing = await asyncio.to_thread(
+            store.get_many, [q_data.id for q_data in import_request.questions]
+        )
+        seen_ids.update(existing)
+
+    # One timestamp per import: the batch is created together.
+    now = datetime.now()
 
     for q_data in import_request.questions:
         try:
-            # Check if question already exists (by ID)
+            # Check if question already exists (by ID), including earlier in this batch
             if import_request.skip_duplicates:
-                existing = store.get(q_data.id)
-                if existing:
+                if q_data.id in seen_ids:
                     skipped += 1
                     skipped_ids.append(q_data.id)
                     continue
+                seen_ids.add(q_data.id)
 
             # Convert to Question object
             question = Question(
@@ -194,7 +216,7 @@ async def import_questions(
                 category=q_data.category,
                 difficulty=q_data.difficulty,
                 tags=q_data.tags,
-                created_at=datetime.now(),
+                created_at=now,
                 source=q_data.source,
                 created_by=q_data.created_by,
                 media_url=q_data.media_url,
@@ -208,20 +230,26 @@ async def import_questions(
                 review_status="approved",  # Auto-approve imports
             )
 
-            # Check for semantic duplicates unless forced
-            if not import_request.force:
-                duplicates = store.find_duplicates(question.question, threshold=0.85)
-                if duplicates:
-                    # Question text is very similar to existing question
-                    skipped += 1
-                    skipped_ids.append(q_data.id)
-                    logger.info(
-                        "Skipped %s: Similar to %s", q_data.id, duplicates[0][0].id
-                    )
-                    continue
+            if import_request.force:
+                to_add.append(question)
+                continue
+
+            # Check for semantic duplicates. This stays sequential with its
+            # write so a near-copy later in the same batch is still caught.
+            duplicates = await asyncio.to_thread(
+                store.find_duplicates, question.question, threshold=0.85
+            )
+            if duplicates:
+                # Question text is very similar to existing question
+                skipped += 1
+                skipped_ids.append(q_data.id)
+                logger.info(
+                    "Skipped %s: Similar to %s", q_data.id, duplicates[0][0].id
+                )
+                continue
 
             # Add to database
-            success = store.add(question)
+            success = await asyncio.to_thread(store.add, question)
 
             if success:
                 imported += 1
@@ -234,6 +262,25 @@ async def import_questions(
             failed += 1
             failed_ids.append(q_data.id)
 
+    gate = asyncio.Semaphore(IMPORT_WRITE_CONCURRENCY)
+
+    async def _add(question: Question) -> bool:
+        async with gate:
+            return await asyncio.to_thread(store.add, question)
+
+    results = await asyncio.gather(
+        *(_add(question) for question in to_add),
+        return_exceptions=True,
+    )
+    for question, result in zip(to_add, results):
+        if result is True:
+            imported += 1
+            continue
+        if isinstance(result, Exception):
+            logger.error("Error importing question %s: %s", question.id, result)
+        failed += 1
+        failed_ids.append(question.id)
+
     return ImportQuestionsResponse(
         success=True,
         imported_count=imported,
@@ -287,6 +334,7 @@ async def backfill_sources(
 
         if store.upsert(question):
             updated += 1
+            invalidate_served_questions(request, [item.id])
         else:
             not_found_ids.append(item.id)
 
@@ -313,15 +361,24 @@ async def set_review_status(
     `review_status` instead of deleting — the read path serves only `approved`,
     and the same call with `status="approved"` puts a batch back.
 
-    Goes through `store.get` + `store.upsert` like the source backfill, so the
-    fetched Question's embedding is reused and a status flip never re-embeds.
+    Goes through `store.get_many` + `store.upsert` like the source backfill, so
+    the fetched Question's embedding is reused and a status flip never
+    re-embeds. The batch is read in one round trip and the upserts run
+    concurrently off the event loop, up to ``IMPORT_WRITE_CONCURRENCY`` at a
+    time — a serial get/upsert per ID made a 50-question archive run 100
+    blocking store calls in sequence. A write that raises is reported in
+    `failed_ids`; the rest of the batch still lands.
     """
-    updated = 0
     unchanged = 0
     not_found_ids: List[str] = []
+    failed_ids: List[str] = []
+    to_update: List[Question] = []
 
-    for question_id in payload.ids:
-        question = store.get(question_id)
+    # dict.fromkeys: a repeated ID is one question, not two writes.
+    question_ids = list(dict.fromkeys(payload.ids))
+    found = await asyncio.to_thread(store.get_many, question_ids)
+    for question_id in question_ids:
+        question = found.get(question_id)
         if question is None:
             not_found_ids.append(question_id)
             continue
@@ -329,17 +386,36 @@ async def set_review_status(
             unchanged += 1
             continue
         question.review_status = payload.status
-        if store.upsert(question):
+        to_update.append(question)
+
+    gate = asyncio.Semaphore(IMPORT_WRITE_CONCURRENCY)
+
+    async def _upsert(question: Question) -> bool:
+        async with gate:
+            return await asyncio.to_thread(store.upsert, question)
+
+    results = await asyncio.gather(
+        *(_upsert(question) for question in to_update),
+        return_exceptions=True,
+    )
+    updated = 0
+    for question, result in zip(to_update, results):
+        if result is True:
             updated += 1
+        elif isinstance(result, Exception):
+            logger.error("Error updating question %s: %s", question.id, result)
+            failed_ids.append(question.id)
         else:
-            not_found_ids.append(question_id)
+            not_found_ids.append(question.id)
+    invalidate_served_questions(request, [question.id for question in to_update])
 
     logger.info(
-        "Admin review-status update: %d → %s (%d unchanged, %d not found)",
+        "Admin review-status update: %d → %s (%d unchanged, %d not found, %d failed)",
         updated,
         payload.status,
         unchanged,
         len(not_found_ids),
+        len(failed_ids),
     )
 
     return ReviewStatusUpdateResponse(
@@ -348,6 +424,8 @@ async def set_review_status(
         unchanged_count=unchanged,
         not_found_count=len(not_found_ids),
         not_found_ids=not_found_ids,
+        failed_count=len(failed_ids),
+        failed_ids=failed_ids,
     )
 
 
@@ -398,29 +476,15 @@ async def get_question_stats(
     _: str = Depends(verify_admin_key),
 ):
 
-    # Get all questions
-    all_questions = store.get_all(limit=10000)
-
-    # Calculate statistics
-    by_difficulty = {}
-    by_topic = {}
-    by_category = {}
-
-    for q in all_questions:
-        # Count by difficulty
-        by_difficulty[q.difficulty] = by_difficulty.get(q.difficulty, 0) + 1
-
-        # Count by topic
-        by_topic[q.topic] = by_topic.get(q.topic, 0) + 1
-
-        # Count by category
-        by_category[q.category] = by_category.get(q.category, 0) + 1
+    # Tallies come from GROUP BY in the store; decoding every row (embedding
+    # included) just to count three columns also capped the totals at 10000.
+    counts = await asyncio.to_thread(store.count_by, ["difficulty", "topic", "category"])
 
     return QuestionStats(
-        total_questions=len(all_questions),
-        by_difficulty=by_difficulty,
-        by_topic=by_topic,
-        by_category=by_category,
+        total_questions=sum(counts["difficulty"].values()),
+        by_difficulty=counts["difficulty"],
+        by_topic=counts["topic"],
+        by_category=counts["category"],
     )
 
 
@@ -443,6 +507,7 @@ async def delete_question(
 
     # Delete question
     success = store.delete(question_id)
+    invalidate_served_questions(request, [question_id])
 
     if not success:
         raise HTTPException(
@@ -463,12 +463,26 @@ def get_translation_service(request: Request):
     return request.app.state.translation_service
 
 
+def invalidate_served_questions(request: Request, question_ids: List[str]) -> None:
+    """Drop admin-edited questions from the retriever's served-question cache."""
+    retriever = getattr(request.app.state, "question_retriever", None)
+    if retriever is None:
+        return
+    for question_id in question_ids:
+        retriever.invalidate(question_id)
+
+
 # ── Helper Functions ─────────────────────────────────────────────────────────
 
 
 def session_to_response(session: QuizSession) -> SessionResponse:
-    """Convert QuizSession to API response."""
-    return SessionResponse(
+    """Convert QuizSession to API response.
+
+    ``model_construct``: every value comes from the already-validated
+    ``QuizSession`` with the same field types, so re-validating them on each
+    session-touching response is pure overhead.
+    """
+    return SessionResponse.model_construct(
         session_id=session.session_id,
         mode=session.mode,
         phase=session.phase,
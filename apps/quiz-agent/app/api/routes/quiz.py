@@ -325,11 +325,11 @@ async def rate_question(
         raise HTTPException(status_code=400, detail="No question to rate")
 
     user_id = session.user_id
-    if request.participant_id:
-        for p in session.participants:
-            if p.participant_id == request.participant_id:
-                user_id = p.user_id or p.participant_id
-                break
+    participant = (
+        session.get_participant(request.participant_id) if request.participant_id else None
+    )
+    if participant:
+        user_id = participant.user_id or participant.participant_id
 
     user_id = user_id or "anonymous"
 
@@ -365,11 +365,11 @@ async def flag_question(
         raise HTTPException(status_code=400, detail="No question to flag")
 
     user_id = session.user_id
-    if body.participant_id:
-        for p in session.participants:
-            if p.participant_id == body.participant_id:
-                user_id = p.user_id or p.participant_id
-                break
+    participant = (
+        session.get_participant(body.participant_id) if body.participant_id else None
+    )
+    if participant:
+        user_id = participant.user_id or participant.participant_id
 
     user_id = user_id or "anonymous"
 
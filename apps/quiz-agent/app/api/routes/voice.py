@@ -1,6 +1,5 @@
 """Voice transcription and submission endpoints."""
 
-import asyncio
 import logging
 from difflib import SequenceMatcher
 from typing import Optional
@@ -92,7 +91,7 @@ async def transcribe_and_submit(
 
             # #133 1a: reject an out-of-step question_id here, before paying
             # OpenAI for a transcription the flow would refuse to grade anyway.
-            is_resubmission = quiz_flow.classify_submission(session, question_id)
+            quiz_flow.classify_submission(session, question_id)
 
             # Transcribe against the question this recording is FOR: a retry of a
             # lost submit carries the already-graded id, and priming Whisper with
@@ -154,29 +153,13 @@ async def transcribe_and_submit(
                     similarity * 100,
                 )
 
-            # Parallel next-question prefetch. Skipped for a re-submitted question
-            # (#133 1a): that path never advances, so the retrieval — a pgvector
-            # query plus an embedding call — would be paid for nothing.
-            next_question_task = None
-            if (
-                not is_resubmission
-                and len(session.asked_question_ids) < session.max_questions
-            ):
-                next_question_task = asyncio.create_task(
-                    question_retriever.get_next_question(session)
-                )
-
-            next_question = None
-            if next_question_task:
-                next_question = await next_question_task
-
-            # Delegate to shared quiz flow
+            # Delegate to shared quiz flow (it overlaps the next-question
+            # retrieval with grading, and skips it for a re-submission)
             flow_result = await quiz_flow.process_answer(
                 session=session,
                 answer_text=transcribed_text,
                 participant_id=participant_id,
                 include_audio=include_audio,
-                next_question=next_question,
                 submitted_question_id=question_id,
             )
 
@@ -4,8 +4,9 @@ Ported from graph.py:445-518
 """
 
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 
+import httpx
 from quiz_shared.llm import factory as llm_factory
 from quiz_shared.models.question import Question
 from quiz_shared.utils.text_normalization import normalize_text
@@ -19,14 +20,21 @@ class AnswerEvaluator:
     2. LLM path: Nuanced evaluation for partial credit
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.3):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.3,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize answer evaluator.
 
         Args:
             model: OpenAI model for evaluation
             temperature: Lower temperature for deterministic evaluation
+            http_client: Shared connection pool for the gateway client
+                (owned by the caller); default is a pool of its own
         """
-        self.client = llm_factory.openai_client(async_=True)
+        self.client = llm_factory.openai_client(async_=True, http_client=http_client)
         self.model = llm_factory.resolve_model(model)
         self.temperature = temperature
 
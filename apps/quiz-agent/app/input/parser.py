@@ -5,9 +5,11 @@ Ported from graph.py:75-356 with enhancements for rating and multiplayer.
 
 import json
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from difflib import SequenceMatcher
 
+import httpx
+
 from quiz_shared.llm import factory as llm_factory
 
 logger = logging.getLogger(__name__)
@@ -32,14 +34,21 @@ class InputParser:
             [answer: "Paris", rating: 1]
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.3):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.3,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize input parser.
 
         Args:
             model: OpenAI model for intent classification
             temperature: Lower temperature for more deterministic parsing
+            http_client: Shared connection pool for the gateway client
+                (owned by the caller); default is a pool of its own
         """
-        self.client = llm_factory.openai_client(async_=True)
+        self.client = llm_factory.openai_client(async_=True, http_client=http_client)
         self.model = llm_factory.resolve_model(model)
         self.temperature = temperature
 
@@ -23,17 +23,26 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 import os
+
+import httpx
 import sentry_sdk
 
 # Load environment variables from .env files
 try:
-    from dotenv import load_dotenv
+    from dotenv import find_dotenv, load_dotenv
 
     # Repo root is 3 levels up from app/main.py: app/ → quiz-agent/ → apps/ → repo root
     base_dir = os.path.dirname(os.path.abspath(__file__))
     repo_root = os.path.join(base_dir, "../../..")
-    load_dotenv(os.path.join(repo_root, ".env"))  # Repo root .env
-    load_dotenv()  # CWD .env (overrides if present)
+    # Repo root .env first, then the nearest .env above this file. Earlier
+    # files win (no override); the nearest one is usually the repo root's,
+    # which is then not parsed a second time.
+    for env_path in dict.fromkeys(
+        os.path.realpath(p)
+        for p in (os.path.join(repo_root, ".env"), find_dotenv())
+        if p and os.path.isfile(p)
+    ):
+        load_dotenv(env_path)
 except ImportError:
     # python-dotenv not available, skip .env loading
     pass
@@ -90,6 +99,24 @@ translation_service: TranslationService = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    """Own the shared gateway client around the service lifespan.
+
+    One keep-alive pool for the gateway-bound services (intent parsing,
+    answer evaluation, translation): every voice turn hits the same host, so
+    separate pools meant separate TLS handshakes. Same limits and redirect
+    behaviour as the SDK's own default client; per-call timeouts still apply.
+    The ``async with`` closes it however startup or shutdown ends.
+    """
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        follow_redirects=True,
+    ) as gateway_http:
+        async with _service_lifespan(app, gateway_http):
+            yield
+
+
+@asynccontextmanager
+async def _service_lifespan(app: FastAPI, gateway_http: httpx.AsyncClient):
     """Application lifespan manager.
 
     Handles startup and shutdown tasks:
@@ -182,9 +209,9 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Initializing services...")
         session_manager = SessionManager(cleanup_interval=300, sql_client=sql_client)
-        input_parser = InputParser()
+        input_parser = InputParser(http_client=gateway_http)
         question_retriever = QuestionRetriever(question_store=async_pgvector)
-        answer_evaluator = AnswerEvaluator()
+        answer_evaluator = AnswerEvaluator(http_client=gateway_http)
         # Ratings persist in SQL only (#41 D1) — no question-store writes.
         feedback_service = FeedbackService(
             sql_client=sql_client,
@@ -192,7 +219,7 @@ async def lifespan(app: FastAPI):
         )
         voice_transcriber = VoiceTranscriber()
         tts_service = TTSService()
-        translation_service = TranslationService()
+        translation_service = TranslationService(http_client=gateway_http)
         # Persistent usage tracker on the auth Postgres (#60). Without
         # DATABASE_URL (plain local dev) usage limits are simply not enforced —
         # the dependents all guard a None tracker.
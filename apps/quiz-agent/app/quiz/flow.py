@@ -98,6 +98,15 @@ class FlowResult:
     usage_limit_error: Optional[Dict[str, Any]] = None
 
 
+def _discard(task: "asyncio.Task[Any]") -> None:
+    """Cancel ``task`` if still running; retrieve its error if it already failed
+    so an unused prefetch never logs "exception was never retrieved"."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
 class QuizFlowService:
     """Processes quiz answers: parse intents, evaluate, update score, advance session."""
 
@@ -145,7 +154,8 @@ class QuizFlowService:
             answer_text: User's answer (text or transcribed voice)
             participant_id: Optional participant ID for multiplayer
             include_audio: Whether to include audio info in response
-            next_question: Pre-fetched next question (from parallel fetch in voice endpoint)
+            next_question: Already-retrieved next question. Omitted, the flow
+                retrieves it concurrently with parsing and evaluation.
             submitted_question_id: The question the client believes it is answering
                 (#133 1a). None = legacy client, always the current question. An
                 already-graded id is replayed or re-graded against that question
@@ -166,6 +176,41 @@ class QuizFlowService:
                 result=FlowResult(),
             )
 
+        # Retrieving the next question (pgvector query + query embedding) does
+        # not depend on the verdict — no intent touches what the retriever reads
+        # — so it runs alongside parse + evaluate instead of after them. Dropped
+        # when the submission ends without advancing.
+        next_question_task = None
+        if (
+            next_question is None
+            and len(session.asked_question_ids) < session.max_questions
+        ):
+            next_question_task = asyncio.create_task(
+                self.question_retriever.get_next_question(session)
+            )
+        try:
+            return await self._grade_and_advance(
+                session=session,
+                answer_text=answer_text,
+                participant_id=participant_id,
+                include_audio=include_audio,
+                next_question=next_question,
+                next_question_task=next_question_task,
+            )
+        finally:
+            if next_question_task is not None:
+                _discard(next_question_task)
+
+    async def _grade_and_advance(
+        self,
+        session: QuizSession,
+        answer_text: str,
+        participant_id: Optional[str],
+        include_audio: bool,
+        next_question: Optional[Question],
+        next_question_task: Optional["asyncio.Task[Optional[Question]]"],
+    ) -> FlowResult:
+        """First grade of the current question, then advance (``process_answer``)."""
         result = FlowResult()
         evaluated_question_id = session.current_question_id
 
@@ -248,7 +293,9 @@ class QuizFlowService:
                 return result
 
         # Get next question (use pre-fetched if available)
-        if next_question is None:
+        if next_question_task is not None:
+            next_question = await next_question_task
+        elif next_question is None:
             next_question = await self.question_retriever.get_next_question(session)
 
         if not next_question:
@@ -434,10 +481,10 @@ class QuizFlowService:
         the same targeting rule decides who is credited and who is un-credited.
         """
         if participant_id:
-            for p in session.participants:
-                if p.participant_id == participant_id:
-                    p.score += score_delta
-                    p.answered_count += answered_delta
+            participant = session.get_participant(participant_id)
+            if participant:
+                participant.score += score_delta
+                participant.answered_count += answered_delta
         elif session.participants:
             session.participants[0].score += score_delta
             session.participants[0].answered_count += answered_delta
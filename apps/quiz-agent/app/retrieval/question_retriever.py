@@ -8,7 +8,9 @@ Proper RAG Implementation:
 """
 
 import logging
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 import random
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,12 @@ from quiz_shared.utils.embeddings import generate_embedding_async, calculate_sim
 
 from ..config import get_settings
 
+# Questions kept by `QuestionRetriever.get` (LRU, per process).
+_SERVED_CACHE_SIZE = 1024
+# Seconds a cached question is trusted. Admin edits in this process call
+# `invalidate`; the TTL bounds staleness for edits made anywhere else.
+_SERVED_CACHE_TTL_S = 300.0
+
 
 class QuestionRetriever:
     """Retrieves questions using proper RAG with semantic search."""
@@ -38,6 +46,7 @@ class QuestionRetriever:
         retrieval in the process behind one blocking embedding round trip.
         """
         self._store = question_store or self._build_default_store()
+        self._served: "OrderedDict[str, Tuple[Question, float]]" = OrderedDict()
 
     @staticmethod
     def _build_default_store() -> PgvectorQuestionStore:
@@ -56,8 +65,36 @@ class QuestionRetriever:
         Application-layer callers must go through the retriever rather than
         reaching into the underlying store, so this seam stays the single
         place to add caching, telemetry, or fallbacks later.
+
+        Questions this retriever served or looked up recently come from a
+        small LRU: an answer submission, a TTS re-read and the diversity check
+        all re-read a question that was just served, and each used to be a
+        Postgres round trip. Corpus rows are read-mostly (only admin tools
+        edit them): an entry expires after ``_SERVED_CACHE_TTL_S`` and admin
+        writes drop it through `invalidate`. Callers must treat the result as
+        read-only.
         """
-        return await self._store.get(question_id)
+        cached = self._served.get(question_id)
+        if cached is not None:
+            question, stored_at = cached
+            if time.monotonic() - stored_at < _SERVED_CACHE_TTL_S:
+                self._served.move_to_end(question_id)
+                return question
+            del self._served[question_id]
+        question = await self._store.get(question_id)
+        if question is not None:
+            self._remember(question)
+        return question
+
+    def invalidate(self, question_id: str) -> None:
+        """Drop a cached question so the next `get` reads the store."""
+        self._served.pop(question_id, None)
+
+    def _remember(self, question: Question) -> None:
+        self._served[question.id] = (question, time.monotonic())
+        self._served.move_to_end(question.id)
+        if len(self._served) > _SERVED_CACHE_SIZE:
+            self._served.popitem(last=False)
 
     async def count(self, filters: Optional[dict] = None) -> int:
         """Count questions, optionally filtered by metadata."""
@@ -133,6 +170,8 @@ class QuestionRetriever:
 
         # Step 5: Select best question using semantic diversity scoring
         selected = await self._select_with_semantic_diversity(candidates, session)
+        if selected is not None:
+            self._remember(selected)
 
         return selected
 
@@ -2,7 +2,7 @@
 
 import copy
 import logging
-import uuid
+import secrets
 import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
@@ -183,7 +183,7 @@ class SessionManager:
             >>> manager = SessionManager()
             >>> session = manager.create_session(max_questions=10, difficulty="medium")
         """
-        session_id = f"sess_{uuid.uuid4().hex[:12]}"
+        session_id = f"sess_{secrets.token_hex(6)}"
 
         session = QuizSession(
             session_id=session_id,
@@ -198,7 +198,7 @@ class SessionManager:
         # For single-player, create default participant
         if mode == "single":
             participant = Participant(
-                participant_id=f"p_{uuid.uuid4().hex[:8]}",
+                participant_id=f"p_{secrets.token_hex(4)}",
                 user_id=user_id,
                 display_name=user_id or "Player",
                 is_host=True,
@@ -317,7 +317,7 @@ class SessionManager:
             return None
 
         participant = Participant(
-            participant_id=f"p_{uuid.uuid4().hex[:8]}",
+            participant_id=f"p_{secrets.token_hex(4)}",
             user_id=user_id,
             display_name=display_name,
             is_host=len(session.participants) == 0,  # First participant is host
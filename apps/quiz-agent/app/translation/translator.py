@@ -8,6 +8,7 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
+import httpx
 import sentry_sdk
 from quiz_shared.llm import factory as llm_factory
 
@@ -60,7 +61,12 @@ class TranslationService:
     OpenAI model for direct-mode setups.
     """
 
-    def __init__(self, model: str | None = None, store_url: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        store_url: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize translation service.
 
         Args:
@@ -68,8 +74,10 @@ class TranslationService:
                 var, then claude-opus-5
             store_url: SQLAlchemy URL for the durable translation store; defaults to
                 TRANSLATION_CACHE_URL env var, then sqlite under ./data (→ /data in prod)
+            http_client: shared connection pool for the gateway client (owned by
+                the caller); default is a pool of its own
         """
-        self.client = llm_factory.openai_client(async_=True)
+        self.client = llm_factory.openai_client(async_=True, http_client=http_client)
         self.model = llm_factory.resolve_model(
             model or os.getenv("TRANSLATION_MODEL", "claude-opus-5")
         )
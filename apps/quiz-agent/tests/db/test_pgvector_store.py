@@ -148,6 +148,27 @@ async def test_get_all_returns_rows_and_honours_limit(pg_store) -> None:
         await _cleanup(factory, ids)
 
 
+@pytest.mark.asyncio
+async def test_count_by_tallies_each_column_in_the_database(pg_store) -> None:
+    """count_by backs the admin stats endpoint: per-value counts straight
+    from GROUP BY, so two inserted rows move their buckets by exactly two."""
+    store, factory = pg_store
+    topic = f"count-by-{uuid.uuid4().hex[:8]}"
+    ids = [uuid.uuid4() for _ in range(2)]
+    before = await store.count_by(["difficulty", "topic"])
+    try:
+        for i, qid in enumerate(ids):
+            await store.upsert(
+                _make_question(qid, f"Tally {i}?", topic=topic, difficulty="hard")
+            )
+
+        after = await store.count_by(["difficulty", "topic"])
+        assert after["topic"][topic] == 2
+        assert after["difficulty"]["hard"] == before["difficulty"].get("hard", 0) + 2
+    finally:
+        await _cleanup(factory, ids)
+
+
 async def _seed_pack(factory) -> tuple[uuid.UUID, uuid.UUID]:
     """Insert the minimal generation_orders + question_packs parents a question's
     ``pack_id`` FK requires. Returns (pack_id, order_id); delete the order to
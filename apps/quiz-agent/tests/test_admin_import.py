@@ -0,0 +1,133 @@
+"""POST /api/v1/admin/questions/import — ID checks and writes off the event loop.
+
+The ID check reads the whole batch in one `get_many` round trip; an ID
+repeated inside the batch must still be skipped like one already stored.
+Forced imports (no similarity check) write concurrently, up to a fixed cap,
+and one failed write is reported per question instead of failing the request.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+import pytest_asyncio
+from app.api import admin as admin_routes
+from app.rate_limit import limiter
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from quiz_shared.models.question import Question
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+pytestmark = pytest.mark.asyncio
+
+_ADMIN_KEY = "super-secret-admin-key"
+
+
+class _FakeStore:
+    """In-memory stand-in for the pgvector store (get_many + add + find_duplicates)."""
+
+    def __init__(self, existing_ids: list[str]) -> None:
+        self.ids: set[str] = set(existing_ids)
+        self.get_many_calls = 0
+        self.fail_ids: set[str] = set()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def get_many(self, question_ids: list[str]) -> dict[str, Question]:
+        self.get_many_calls += 1
+        return {
+            qid: Question(
+                id=qid,
+                question="Stored?",
+                correct_answer="a",
+                topic="General",
+                category="general",
+                difficulty="medium",
+            )
+            for qid in question_ids
+            if qid in self.ids
+        }
+
+    def find_duplicates(self, question_text: str, threshold: float = 0.85):
+        return []
+
+    def add(self, question: Question) -> bool:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.01)
+            if question.id in self.fail_ids:
+                raise RuntimeError("write failed")
+            self.ids.add(question.id)
+            return True
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest_asyncio.fixture
+async def store() -> _FakeStore:
+    return _FakeStore(["stored-1"])
+
+
+@pytest_asyncio.fixture
+async def client(store, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", _ADMIN_KEY)
+    limiter.reset()
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.include_router(admin_routes.router)
+    app.state.question_store = store
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _import(client, ids: list[str], **flags):
+    body = {
+        "questions": [
+            {"id": qid, "question": f"Question {qid}?", "correct_answer": "a"}
+            for qid in ids
+        ],
+        **flags,
+    }
+    return await client.post(
+        "/api/v1/admin/questions/import",
+        json=body,
+        headers={"X-Admin-Key": _ADMIN_KEY},
+    )
+
+
+async def test_id_check_is_one_read_and_skips_in_batch_repeats(client, store):
+    response = await _import(client, ["stored-1", "new-1", "new-1", "new-2"])
+
+    body = response.json()
+    assert store.get_many_calls == 1
+    assert body["imported_count"] == 2
+    assert body["skipped_ids"] == ["stored-1", "new-1"]
+
+
+async def test_forced_import_reports_failed_writes_per_question(client, store):
+    store.fail_ids = {"new-2"}
+
+    response = await _import(client, ["new-1", "new-2", "new-3"], force=True)
+
+    body = response.json()
+    assert body["imported_count"] == 2
+    assert body["failed_ids"] == ["new-2"]
+    assert {"new-1", "new-3"} <= store.ids
+
+
+async def test_forced_import_caps_concurrent_writes(client, store, monkeypatch):
+    monkeypatch.setattr(admin_routes, "IMPORT_WRITE_CONCURRENCY", 2)
+
+    response = await _import(client, [f"new-{i}" for i in range(8)], force=True)
+
+    assert response.json()["imported_count"] == 8
+    assert store.peak <= 2
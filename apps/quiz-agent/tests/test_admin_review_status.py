@@ -15,6 +15,10 @@ review flow, not to serving.
 
 from __future__ import annotations
 
+import threading
+import time
+from unittest.mock import MagicMock
+
 import pytest
 import pytest_asyncio
 from app.api import admin as admin_routes
@@ -46,20 +50,43 @@ def _question(qid: str, status: str = "approved") -> Question:
 
 
 class _FakeStore:
-    """In-memory stand-in for the pgvector store (get + upsert only)."""
+    """In-memory stand-in for the pgvector store (get/get_many + upsert only)."""
 
     def __init__(self, questions: list[Question]) -> None:
         self._items: dict[str, Question] = {q.id: q for q in questions}
         self.upserted: list[Question] = []
+        self.get_many_calls = 0
+        self.fail_ids: set[str] = set()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
 
     def get(self, question_id: str) -> Question | None:
         stored = self._items.get(question_id)
         return stored.model_copy(deep=True) if stored else None
 
+    def get_many(self, question_ids: list[str]) -> dict[str, Question]:
+        self.get_many_calls += 1
+        return {
+            qid: self._items[qid].model_copy(deep=True)
+            for qid in question_ids
+            if qid in self._items
+        }
+
     def upsert(self, question: Question) -> bool:
-        self._items[question.id] = question
-        self.upserted.append(question)
-        return True
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.01)
+            if question.id in self.fail_ids:
+                raise RuntimeError("write failed")
+            self._items[question.id] = question
+            self.upserted.append(question)
+            return True
+        finally:
+            with self._lock:
+                self.in_flight -= 1
 
     def status_of(self, question_id: str) -> str:
         return self._items[question_id].review_status
@@ -76,7 +103,12 @@ async def store() -> _FakeStore:
 
 
 @pytest_asyncio.fixture
-async def client(store, monkeypatch):
+async def retriever() -> MagicMock:
+    return MagicMock()
+
+
+@pytest_asyncio.fixture
+async def client(store, retriever, monkeypatch):
     monkeypatch.setenv("ADMIN_API_KEY", _ADMIN_KEY)
     limiter.reset()
     app = FastAPI()
@@ -84,6 +116,7 @@ async def client(store, monkeypatch):
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     app.include_router(admin_routes.router)
     app.state.question_store = store
+    app.state.question_retriever = retriever
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
@@ -132,6 +165,16 @@ async def test_status_flip_reuses_the_existing_embedding(client, store):
     assert store.upserted[0].embedding == [0.5] * 4
 
 
+async def test_flipped_questions_leave_the_served_cache(client, store, retriever):
+    """The retriever caches served questions; an archived one must not keep
+    being answered from that cache in this process."""
+    qid = "11111111-1111-1111-1111-111111111111"
+
+    await _post(client, {"ids": [qid], "status": "archived"})
+
+    retriever.invalidate.assert_called_once_with(qid)
+
+
 async def test_already_archived_is_counted_unchanged_not_rewritten(client, store):
     """Re-running the same archive call must be a no-op, so a retry after a
     partial failure can't churn rows that are already retired."""
@@ -158,6 +201,51 @@ async def test_unknown_id_is_reported_not_fatal(client, store):
     assert store.status_of(known) == "archived"
 
 
+async def test_batch_is_read_in_one_store_call(client, store):
+    """A big archive run must not pay one store round trip per ID."""
+    ids = [
+        "11111111-1111-1111-1111-111111111111",
+        "22222222-2222-2222-2222-222222222222",
+        "does-not-exist",
+    ]
+    response = await _post(client, {"ids": ids, "status": "archived"})
+
+    assert response.json()["updated_count"] == 2
+    assert store.get_many_calls == 1
+
+
+async def test_failed_write_is_reported_not_fatal(client, store):
+    """One failing upsert must not 500 a batch whose other rows already
+    landed — the caller needs to know exactly which IDs to retry."""
+    ok, bad = (
+        "11111111-1111-1111-1111-111111111111",
+        "22222222-2222-2222-2222-222222222222",
+    )
+    store.fail_ids = {bad}
+
+    response = await _post(client, {"ids": [ok, bad], "status": "archived"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["updated_count"] == 1
+    assert body["failed_ids"] == [bad]
+    assert store.status_of(ok) == "archived"
+
+
+async def test_writes_share_the_admin_concurrency_cap(client, store, monkeypatch):
+    """The upserts share one pooled store; a big archive run must not start a
+    thread per ID at once."""
+    monkeypatch.setattr(admin_routes, "IMPORT_WRITE_CONCURRENCY", 2)
+    ids = [f"{i:08d}-0000-0000-0000-000000000000" for i in range(8)]
+    for qid in ids:
+        store._items[qid] = _question(qid)
+
+    response = await _post(client, {"ids": ids, "status": "archived"})
+
+    assert response.json()["updated_count"] == 8
+    assert store.peak <= 2
+
+
 async def test_review_flow_statuses_are_rejected(client, store):
     """This seam is for serving, not for the generation review flow — letting
     admin set `rejected`/`needs_revision` here would fork that workflow."""
@@ -8,16 +8,8 @@ answer in English. These tests encode WHY the keys matter: every locale must ans
 every result the evaluator can emit, in that locale, with the answer spoken inside it.
 """
 
-import os
-import sys
-
 import pytest
 
-# Add shared package to path
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 from app.translation.feedback_messages import (
     CORRECT_ANSWER_TEMPLATES,
     FEEDBACK_MESSAGES,
@@ -12,16 +12,10 @@ later healthy call must still be able to produce the real translation.
 import asyncio
 import os
 import sqlite3
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Add shared package to path
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 from app.translation.translator import TranslationService
 
 
@@ -0,0 +1,108 @@
+"""Next-question retrieval overlaps grading in ``process_answer``.
+
+Parse + evaluate (LLM calls) and the next-question retrieval (pgvector query +
+query embedding) are independent, so the retrieval starts before grading
+instead of after it. A submission that does not advance — no answer intent —
+must drop the in-flight retrieval rather than leave it running.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.quiz.flow import QuizFlowService
+from quiz_shared.models.phase import SessionPhase
+from quiz_shared.models.question import Question
+from quiz_shared.models.session import QuizSession
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_question(qid: str) -> Question:
+    return Question(
+        id=qid,
+        question="What is the capital of France?",
+        type="text",
+        correct_answer="Paris",
+        topic="Geography",
+        category="general",
+        difficulty="medium",
+    )
+
+
+def _make_session() -> QuizSession:
+    return QuizSession(
+        session_id="s_overlap",
+        phase=SessionPhase.ASKING,
+        current_question_id="q_current",
+        asked_question_ids=["q_current"],
+        max_questions=10,
+    )
+
+
+def _make_flow(intents, get_next_question) -> QuizFlowService:
+    input_parser = MagicMock()
+    input_parser.parse = AsyncMock(return_value=intents)
+    question_retriever = MagicMock()
+    question_retriever.get = AsyncMock(return_value=_make_question("q_current"))
+    question_retriever.get_next_question = get_next_question
+    return QuizFlowService(
+        session_manager=MagicMock(),
+        input_parser=input_parser,
+        question_retriever=question_retriever,
+        answer_evaluator=MagicMock(),
+        tts_service=None,
+        usage_tracker=None,
+        translation_service=None,
+    )
+
+
+async def test_retrieval_runs_while_the_answer_is_evaluated():
+    retrieval_started = asyncio.Event()
+
+    async def _next_question(session):
+        retrieval_started.set()
+        return _make_question("q_next")
+
+    async def _evaluate(**kwargs):
+        # Serial code would never reach the retrieval while this waits.
+        await asyncio.wait_for(retrieval_started.wait(), timeout=1)
+        return "correct", 1.0
+
+    flow = _make_flow(
+        [{"intent_type": "answer", "extracted_data": {"answer": "Paris"}}],
+        _next_question,
+    )
+    flow.answer_evaluator.evaluate = _evaluate
+    session = _make_session()
+
+    result = await flow.process_answer(session=session, answer_text="Paris")
+
+    assert result.evaluation.result == "correct"
+    assert session.current_question_id == "q_next"
+
+
+async def test_non_answer_cancels_the_inflight_retrieval():
+    cancelled = asyncio.Event()
+
+    async def _next_question(session):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def _parse(**kwargs):
+        await asyncio.sleep(0)  # a real parse is an LLM call; let the retrieval start
+        return [{"intent_type": "rating", "extracted_data": {"rating": 5}}]
+
+    flow = _make_flow([], _next_question)
+    flow.input_parser.parse = _parse
+    session = _make_session()
+
+    result = await flow.process_answer(session=session, answer_text="that was fun")
+
+    assert result.evaluation is None
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert session.current_question_id == "q_current"
@@ -117,6 +117,28 @@ def test_count_total_and_by_status(store: PendingStore):
     assert store.count(status="nonexistent") == 0
 
 
+def test_rank_and_list_after_follow_list_order(store: PendingStore):
+    """Queue position and the next row come from the store, in `list` order
+    (created_at, id breaking ties), without loading the whole queue."""
+    from datetime import datetime
+
+    same_time = datetime(2026, 1, 1, 12, 0, 0)
+    for qid in ("q_b", "q_a", "q_c"):
+        store.add(_make_question(qid=qid, created_at=same_time))
+    store.add(_make_question(qid="q_x", review_status="rejected", created_at=same_time))
+
+    assert [q.id for q in store.list(status="pending_review")] == ["q_a", "q_b", "q_c"]
+    assert store.rank("q_b", status="pending_review") == 1
+    assert store.rank("q_x", status="pending_review") is None
+    assert store.rank("missing") is None
+    assert [q.id for q in store.list_after("q_a", status="pending_review", limit=5)] == [
+        "q_b",
+        "q_c",
+    ]
+    assert store.list_after("q_c", status="pending_review") == []
+    assert store.list_after("missing") == []
+
+
 def test_in_memory_returns_copies(store: PendingStore):
     """Mutating a returned Question must not corrupt the store."""
     q = _make_question(question="original")
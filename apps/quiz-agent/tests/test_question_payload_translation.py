@@ -17,15 +17,10 @@ and a failed translation degrades to English (loudly) instead of breaking a quiz
 import asyncio
 import json
 import os
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 os.environ.setdefault("OPENAI_API_KEY", "sk-test")
 
 from app.evaluation.evaluator import AnswerEvaluator  # noqa: E402
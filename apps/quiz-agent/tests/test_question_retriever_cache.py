@@ -0,0 +1,109 @@
+"""QuestionRetriever.get serves recently served questions without a store read.
+
+An answer submission, a TTS re-read and the diversity check all look up a
+question that was just served. These tests pin that those lookups stay in
+process, that misses are not cached, and that the cache stays bounded and
+does not outlive an admin edit.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from quiz_shared.models.question import Question
+from quiz_shared.models.session import QuizSession
+
+from app.retrieval import question_retriever as retriever_module
+from app.retrieval.question_retriever import QuestionRetriever
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_question(qid: str) -> Question:
+    return Question(
+        id=qid,
+        question=f"Question {qid}?",
+        type="text",
+        correct_answer="answer",
+        topic="General",
+        category="general",
+        difficulty="medium",
+        review_status="approved",
+    )
+
+
+async def test_served_question_is_read_back_without_the_store():
+    served = _make_question("q_served")
+    store = MagicMock()
+    store.search = AsyncMock(return_value=[served])
+    store.get = AsyncMock(return_value=None)
+    retriever = QuestionRetriever(question_store=store)
+
+    selected = await retriever.get_next_question(
+        QuizSession(session_id="sess_cache", current_difficulty="medium")
+    )
+
+    assert await retriever.get(selected.id) is served
+    store.get.assert_not_awaited()
+
+
+async def test_lookups_are_cached_but_misses_are_not():
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=[_make_question("q_1"), None, None])
+    retriever = QuestionRetriever(question_store=store)
+
+    await retriever.get("q_1")
+    await retriever.get("q_1")
+    assert store.get.await_count == 1
+
+    await retriever.get("q_missing")
+    await retriever.get("q_missing")
+    assert store.get.await_count == 3
+
+
+async def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(retriever_module, "_SERVED_CACHE_SIZE", 2)
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=lambda qid: _make_question(qid))
+    retriever = QuestionRetriever(question_store=store)
+
+    await retriever.get("q_a")
+    await retriever.get("q_b")
+    await retriever.get("q_a")  # refresh q_a, so q_b is the oldest
+    await retriever.get("q_c")
+    store.get.reset_mock()
+
+    await retriever.get("q_a")
+    store.get.assert_not_awaited()
+    await retriever.get("q_b")
+    store.get.assert_awaited_once_with("q_b")
+
+
+async def test_cached_question_expires_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(retriever_module.time, "monotonic", lambda: now[0])
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=lambda qid: _make_question(qid))
+    retriever = QuestionRetriever(question_store=store)
+
+    await retriever.get("q_1")
+    now[0] += retriever_module._SERVED_CACHE_TTL_S - 1
+    await retriever.get("q_1")
+    assert store.get.await_count == 1
+
+    now[0] += 1
+    await retriever.get("q_1")
+    assert store.get.await_count == 2
+
+
+async def test_invalidate_forces_a_store_read():
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=lambda qid: _make_question(qid))
+    retriever = QuestionRetriever(question_store=store)
+
+    await retriever.get("q_1")
+    retriever.invalidate("q_1")
+    retriever.invalidate("q_never_cached")
+    await retriever.get("q_1")
+
+    assert store.get.await_count == 2
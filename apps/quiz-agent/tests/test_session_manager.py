@@ -1,16 +1,9 @@
 """Tests for SessionManager deep-copy isolation, evaluation flow, and persistence."""
 
-import sys
-import os
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-# Add shared package to path
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 from app.quiz.flow import QuizFlowService
 from app.session.manager import SessionManager
 from quiz_shared.models.phase import SessionPhase
@@ -10,16 +10,10 @@ cached (correctness), and memory stays bounded at the cap (safety).
 
 import asyncio
 import os
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Add shared package to path
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 from app.translation import translator as translator_module
 from app.translation.store import TranslationStore
 from app.translation.translator import TRANSLATION_PROMPT_VERSION, TranslationService
@@ -12,16 +12,10 @@ invariant (#69) must survive the retry-budget bump untouched.
 
 import asyncio
 import os
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Add shared package to path
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 from app.translation.translator import TranslationService
 
 
@@ -5,17 +5,11 @@ and the original English question is returned as fallback.
 """
 
 import asyncio
-import sys
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Add shared package to path
-sys.path.insert(
-    0, os.path.join(os.path.dirname(__file__), "../../../..", "packages/shared")
-)
-
 from app.translation.translator import TranslationService
 
 
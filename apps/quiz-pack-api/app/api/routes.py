@@ -1,7 +1,16 @@
 """FastAPI routes for Question Generator."""
 
+import asyncio
+import hashlib
 import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 
 from quiz_shared.models.question import Question
 from quiz_shared.llm import factory as llm_factory
@@ -11,12 +20,12 @@ from .schemas import (
     ImportRequest, ImportResponse,
     SearchResponse,
     AdvancedGenerateRequest, AdvancedGenerateResponse, AdvancedQuestionResponse,
-    ReviewRequest, ReviewResponse, PendingReviewResponse, ReviewStats,
+    ReviewRequest, ReviewResponse, BulkReviewResponse, PendingReviewResponse, ReviewStats,
     VerifyRequest, VerifyBatchRequest, VerifyResponse, VerifyBatchResponse,
     VerifyBatchItem, SourceInfo,
 )
 from ..generation.advanced_generator import AdvancedQuestionGenerator
-from ..generation.storage import QuestionStorage
+from ..generation.storage import get_question_storage
 from ..verification.fact_verifier import FactVerifier
 from .deps import require_admin
 from ..rate_limit import limiter
@@ -41,13 +50,87 @@ def _build_advanced_generator() -> AdvancedQuestionGenerator:
     )
 
 
-# Initialize services
-advanced_generator = _build_advanced_generator()
-storage = QuestionStorage()
-fact_verifier = FactVerifier()
+@lru_cache(maxsize=1)
+def get_advanced_generator() -> AdvancedQuestionGenerator:
+    """Process-wide generator, built on first use.
+
+    Building it at import time constructed several chat clients and read the
+    prompt templates even in deployments that never hit /generate (the API
+    mostly serves orders and review tooling).
+    """
+    return _build_advanced_generator()
+
+
+@lru_cache(maxsize=1)
+def get_fact_verifier() -> FactVerifier:
+    """Process-wide fact verifier, built on first /verify call."""
+    return FactVerifier()
+
+
+# Opt-in (GENERATION_CACHE_TTL) reuse of /generate/advanced responses keyed by
+# the canonical request body. In-process and bounded: it exists for dev loops
+# that re-send one payload, not as a shared production cache.
+_GENERATION_CACHE_MAX = 64
+_generation_cache: Dict[str, Tuple[float, AdvancedGenerateResponse]] = {}
+# Generations currently running, by the same key, so concurrent identical
+# requests share one pipeline run instead of each paying for it.
+_generation_inflight: Dict[str, "asyncio.Future[AdvancedGenerateResponse]"] = {}
+
+
+def _generation_cache_key(body: AdvancedGenerateRequest) -> str:
+    """Hash of the request *shape*: topic lists are order- and case-blind, so
+    re-sending the same order with its topics shuffled still hits. Category
+    order is kept — the first category selects the prompt."""
+    canonical = body.model_dump(mode="json")
+    for field in ("topics", "excluded_topics"):
+        if canonical[field]:
+            canonical[field] = sorted({t.strip().casefold() for t in canonical[field]})
+    return hashlib.sha256(
+        orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
+def _cached_generation(key: str, ttl: int) -> Optional[AdvancedGenerateResponse]:
+    entry = _generation_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, response = entry
+    if time.monotonic() - stored_at > ttl:
+        del _generation_cache[key]
+        return None
+    return response
+
+
+def _store_generation(key: str, response: AdvancedGenerateResponse) -> None:
+    _generation_cache[key] = (time.monotonic(), response)
+    while len(_generation_cache) > _GENERATION_CACHE_MAX:
+        del _generation_cache[next(iter(_generation_cache))]
+
+
+# QuestionStorage is synchronous (SQLite PendingStore), so handlers call it
+# through asyncio.to_thread — a direct call parks the event loop for every
+# disk round trip and serializes concurrent admin requests.
+storage = get_question_storage()
+
+# Create router — every /api/v1 question route is admin-gated (#65). orjson
+# encodes the list endpoints (generate/advanced, reviews/pending) ~2x faster
+# than the stdlib json path.
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["questions"],
+    dependencies=[Depends(require_admin)],
+    default_response_class=ORJSONResponse,
+)
+
 
-# Create router — every /api/v1 question route is admin-gated (#65).
-router = APIRouter(prefix="/api/v1", tags=["questions"], dependencies=[Depends(require_admin)])
+def _send(model: BaseModel) -> ORJSONResponse:
+    """Serialize an already-built response model straight to the wire.
+
+    Returning the model makes FastAPI dump it, re-validate it against
+    ``response_model`` and serialize again; returning a Response skips that
+    round trip. ``response_model`` stays on the route for the OpenAPI schema.
+    """
+    return ORJSONResponse(model.model_dump(mode="json"))
 
 
 @router.post("/generate", response_model=GenerateResponse)
@@ -64,7 +147,7 @@ async def generate_questions(request: Request, body: GenerateRequest):
     start_time = time.time()
 
     try:
-        questions = await advanced_generator.generate_questions(
+        questions = await get_advanced_generator().generate_questions(
             count=body.count,
             difficulty=body.difficulty,
             topics=body.topics,
@@ -81,10 +164,10 @@ async def generate_questions(request: Request, body: GenerateRequest):
 
         generation_time = time.time() - start_time
 
-        return GenerateResponse(
+        return _send(GenerateResponse(
             questions=question_responses,
             generation_time_seconds=round(generation_time, 2)
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Generation failed: {str(e)}")
@@ -107,10 +190,32 @@ async def generate_questions_advanced(request: Request, body: AdvancedGenerateRe
     Returns:
         Generated questions with quality metadata and statistics
     """
-    start_time = time.time()
+    cache_ttl = feature_flags.generation_cache_ttl()
+    if not cache_ttl:
+        return _send(await _advanced_generation(body))
+
+    cache_key = _generation_cache_key(body)
+    cached = _cached_generation(cache_key, cache_ttl)
+    if cached is not None:
+        return _send(cached)
+    # A same-shape request already generating is joined rather than repeated;
+    # shielded so one caller disconnecting does not cancel the others' result.
+    inflight = _generation_inflight.get(cache_key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_advanced_generation(body))
+        _generation_inflight[cache_key] = inflight
+        inflight.add_done_callback(
+            lambda _task: _generation_inflight.pop(cache_key, None)
+        )
+    response = await asyncio.shield(inflight)
+    _store_generation(cache_key, response)
+    return _send(response)
+
 
+async def _advanced_generation(body: AdvancedGenerateRequest) -> AdvancedGenerateResponse:
+    start_time = time.time()
     try:
-        questions = await advanced_generator.generate_questions(
+        questions = await get_advanced_generator().generate_questions(
             count=body.count,
             difficulty=body.difficulty,
             topics=body.topics,
@@ -163,11 +268,11 @@ async def import_questions(request: ImportRequest):
         Import summary with pending review IDs
     """
     try:
-        pending_ids: list[str] = []
-        for q_dict in request.questions:
-            question = Question.from_dict(q_dict, source=request.source)
-            if storage.add_pending(question):
-                pending_ids.append(question.id)
+        questions = [
+            Question.from_dict(q_dict, source=request.source)
+            for q_dict in request.questions
+        ]
+        pending_ids = await asyncio.to_thread(storage.add_pending_many, questions)
 
         return ImportResponse(
             imported_count=len(pending_ids),
@@ -219,7 +324,8 @@ async def search_questions(
                    "approved questions live in pgvector. Use scalar filters only.",
         )
     try:
-        questions = storage.search_questions(
+        questions = await asyncio.to_thread(
+            storage.search_questions,
             topic=topic,
             category=category,
             difficulty=difficulty,
@@ -230,10 +336,10 @@ async def search_questions(
             _question_to_response(q) for q in questions
         ]
 
-        return SearchResponse(
+        return _send(SearchResponse(
             questions=question_responses,
             total=len(questions)
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -263,7 +369,7 @@ async def delete_question(question_id: str):
     Returns:
         Success message
     """
-    success = storage.delete_question(question_id)
+    success = await asyncio.to_thread(storage.delete_question, question_id)
 
     if success:
         return {"message": "Question deleted", "question_id": question_id}
@@ -285,26 +391,63 @@ async def list_pending_reviews(limit: int = 50, offset: int = 0):
         Questions with status pending_review or needs_revision
     """
     try:
-        pending_questions = storage.list_pending(
-            status="pending_review",
-            limit=limit,
-            offset=offset,
+        pending_questions, total = await asyncio.gather(
+            storage.list_pending_shared(
+                status="pending_review",
+                limit=limit,
+                offset=offset,
+            ),
+            storage.count_pending_shared(status="pending_review"),
         )
-        total = storage.count_pending(status="pending_review")
 
         question_responses = [
             _question_to_advanced_response(q) for q in pending_questions
         ]
 
-        return PendingReviewResponse(
+        return _send(PendingReviewResponse(
             questions=question_responses,
             total=total
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list pending reviews: {str(e)}")
 
 
+# Page size for the NDJSON pending stream: small enough that one page of
+# Questions is cheap to hold, large enough to keep SQLite round trips rare.
+_PENDING_STREAM_PAGE = 100
+
+
+async def _iter_pending_ndjson(limit: Optional[int], offset: int) -> AsyncIterator[bytes]:
+    """Yield pending questions as NDJSON, one store page at a time."""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        page_size = _PENDING_STREAM_PAGE if remaining is None else min(_PENDING_STREAM_PAGE, remaining)
+        page = await asyncio.to_thread(
+            storage.list_pending, status="pending_review", limit=page_size, offset=offset
+        )
+        for question in page:
+            yield orjson.dumps(_question_to_advanced_response(question).model_dump(mode="json")) + b"\n"
+        if len(page) < page_size:
+            return
+        offset += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+
+
+@router.get("/reviews/pending/stream")
+async def stream_pending_reviews(limit: Optional[int] = None, offset: int = 0):
+    """Stream the pending-review queue as NDJSON (one question per line).
+
+    Same rows as `/reviews/pending`, but paged from the store and written as
+    they are read, so a queue of thousands after a bulk import never sits in
+    memory as one response. No `limit` = the whole queue.
+    """
+    return StreamingResponse(
+        _iter_pending_ndjson(limit, offset), media_type="application/x-ndjson"
+    )
+
+
 @router.post("/reviews/submit", response_model=ReviewResponse)
 async def submit_review(request: ReviewRequest):
     """Submit a review for a question (reject/needs revision).
@@ -313,8 +456,6 @@ async def submit_review(request: ReviewRequest):
     retired (#41 D4) — the future #42/#30 review flow promotes to pgvector.
     """
     try:
-        from datetime import datetime
-
         if request.status == "approved":
             raise HTTPException(
                 status_code=410,
@@ -323,18 +464,20 @@ async def submit_review(request: ReviewRequest):
                        "questions to pgvector.",
             )
 
-        question = storage.get_question(request.question_id)
+        question = await asyncio.to_thread(storage.get_question, request.question_id)
 
         if not question:
             raise HTTPException(status_code=404, detail="Question not found")
 
         question.reviewed_by = request.reviewer_id
-        question.reviewed_at = datetime.now()
+        # UTC-aware, matching the Postgres `reviewed_at timestamptz` column the
+        # future promote path writes, and serialized natively by orjson.
+        question.reviewed_at = datetime.now(timezone.utc)
         question.review_notes = request.review_notes
         question.quality_ratings = request.quality_ratings
 
         question.review_status = request.status
-        storage.update_question(question)
+        await asyncio.to_thread(storage.update_question, question)
 
         return ReviewResponse(
             question_id=request.question_id,
@@ -348,6 +491,61 @@ async def submit_review(request: ReviewRequest):
         raise HTTPException(status_code=500, detail=f"Review submission failed: {str(e)}")
 
 
+@router.post("/reviews/submit/bulk", response_model=BulkReviewResponse)
+async def submit_reviews_bulk(requests: List[ReviewRequest]):
+    """Submit several reviews at once (reject/needs revision).
+
+    One batched read and one write transaction for the whole list, instead of
+    a get + commit per question. Unknown IDs are reported, not fatal; an ID
+    listed twice is rejected, since only one of its reviews could land.
+    `reviewed` and `not_found` follow the request order.
+    """
+    if any(r.status == "approved" for r in requests):
+        raise HTTPException(
+            status_code=410,
+            detail="Approval retired with the ChromaDB decommission (#41). "
+                   "The future review flow (#42/#30) writes approved "
+                   "questions to pgvector.",
+        )
+    ids = [r.question_id for r in requests]
+    duplicates = sorted({qid for qid in ids if ids.count(qid) > 1})
+    if duplicates:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Question IDs reviewed more than once: {', '.join(duplicates)}",
+        )
+
+    try:
+        found = await asyncio.to_thread(storage.get_questions, ids)
+
+        reviewed_at = datetime.now(timezone.utc)
+        for r in requests:
+            question = found.get(r.question_id)
+            if question is None:
+                continue
+            question.reviewed_by = r.reviewer_id
+            question.reviewed_at = reviewed_at
+            question.review_notes = r.review_notes
+            question.quality_ratings = r.quality_ratings
+            question.review_status = r.status
+
+        if found and not await asyncio.to_thread(
+            storage.update_questions_bulk, list(found.values())
+        ):
+            raise HTTPException(status_code=500, detail="Bulk review write failed")
+
+        return BulkReviewResponse(
+            reviewed=[qid for qid in ids if qid in found],
+            not_found=[qid for qid in ids if qid not in found],
+            message=f"Reviewed {len(found)} questions",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Bulk review submission failed: {str(e)}")
+
+
 @router.get("/reviews/stats", response_model=ReviewStats)
 async def get_review_stats():
     """Get statistics about review workflow.
@@ -359,18 +557,21 @@ async def get_review_stats():
         Counts of questions by review status
     """
     try:
-        all_questions = storage.get_all_questions()
-
-        # Count by status
-        pending = sum(1 for q in all_questions if q.review_status == "pending_review")
-        approved = sum(1 for q in all_questions if q.review_status == "approved")
-        rejected = sum(1 for q in all_questions if q.review_status == "rejected")
-        needs_revision = sum(1 for q in all_questions if q.review_status == "needs_revision")
+        # Per-status COUNT(*) in the store instead of materializing every row
+        # and scanning it four times in Python (the old get_all_questions()
+        # pass also silently capped at 1000 rows).
+        pending, approved, rejected, needs_revision = await asyncio.gather(
+            *(
+                storage.count_pending_shared(status)
+                for status in ("pending_review", "approved", "rejected", "needs_revision")
+            )
+        )
 
-        # Calculate average quality score for approved questions
-        approved_questions = [q for q in all_questions if q.review_status == "approved"]
-        quality_scores = [q.calculate_quality_score() for q in approved_questions if q.quality_ratings]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else None
+        # Only approved rows are needed for the average — one filtered read.
+        avg_quality = (
+            await asyncio.to_thread(storage.average_quality, "approved", approved)
+            if approved else None
+        )
 
         return ReviewStats(
             pending_review=pending,
@@ -395,7 +596,7 @@ async def verify_question(request: Request, body: VerifyRequest):
     with confidence score and source URLs.
     """
     try:
-        result = await fact_verifier.verify(
+        result = await get_fact_verifier().verify(
             question=body.question,
             claimed_answer=body.correct_answer,
             topic=body.topic,
@@ -427,7 +628,7 @@ async def verify_batch(request: Request, body: VerifyBatchRequest):
     Each item needs: question, correct_answer, id (optional), topic (optional).
     """
     try:
-        raw_results = await fact_verifier.verify_batch(body.questions)
+        raw_results = await get_fact_verifier().verify_batch(body.questions)
 
         items = []
         verified = wrong = uncertain = 0
@@ -476,38 +677,37 @@ async def verify_batch(request: Request, body: VerifyBatchRequest):
 
 # Helper functions
 
+def _response_fields(question: Question) -> dict:
+    """Fields shared by both response shapes, read straight off the model."""
+    correct_answer = question.correct_answer
+    return {
+        "id": question.id,
+        "question": question.question,
+        "type": question.type,
+        "correct_answer": correct_answer if isinstance(correct_answer, str) else str(correct_answer),
+        "topic": question.topic,
+        "category": question.category,
+        "difficulty": question.difficulty,
+        "possible_answers": question.possible_answers,
+        "alternative_answers": question.alternative_answers,
+        "tags": question.tags,
+        "quality_score": question.calculate_avg_rating() if question.user_ratings else None,
+    }
+
+
+# `model_construct` skips validation: every field comes from an already-
+# validated `Question`, so re-validating it per item only burns CPU on large
+# search/pending/generate lists.
 def _question_to_response(question: Question) -> QuestionResponse:
     """Convert Question model to API response."""
-    return QuestionResponse(
-        id=question.id,
-        question=question.question,
-        type=question.type,
-        correct_answer=question.correct_answer if isinstance(question.correct_answer, str) else str(question.correct_answer),
-        topic=question.topic,
-        category=question.category,
-        difficulty=question.difficulty,
-        possible_answers=question.possible_answers,
-        alternative_answers=question.alternative_answers,
-        tags=question.tags,
-        quality_score=question.calculate_avg_rating() if question.user_ratings else None
-    )
+    return QuestionResponse.model_construct(**_response_fields(question))
 
 
 def _question_to_advanced_response(question: Question) -> AdvancedQuestionResponse:
     """Convert Question model to Advanced API response with review metadata."""
-    return AdvancedQuestionResponse(
-        id=question.id,
-        question=question.question,
-        type=question.type,
-        correct_answer=question.correct_answer if isinstance(question.correct_answer, str) else str(question.correct_answer),
-        topic=question.topic,
-        category=question.category,
-        difficulty=question.difficulty,
-        possible_answers=question.possible_answers,
-        alternative_answers=question.alternative_answers,
-        tags=question.tags,
-        quality_score=question.calculate_avg_rating() if question.user_ratings else None,
+    return AdvancedQuestionResponse.model_construct(
+        **_response_fields(question),
         review_status=question.review_status,
         quality_ratings=question.quality_ratings,
-        generation_metadata=question.generation_metadata.model_dump() if question.generation_metadata else None
+        generation_metadata=question.generation_metadata.model_dump() if question.generation_metadata else None,
     )
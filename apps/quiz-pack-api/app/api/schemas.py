@@ -1,7 +1,9 @@
 """Pydantic schemas for API requests/responses."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from ..generation.prompt_builder import dedupe_entries
 
 
 class GenerateRequest(BaseModel):
@@ -13,6 +15,8 @@ class GenerateRequest(BaseModel):
     type: str = Field("text", description="text or text_multichoice")
     excluded_topics: Optional[List[str]] = Field(None, description="Topics to avoid")
 
+    _dedupe_excluded_topics = field_validator("excluded_topics")(dedupe_entries)
+
 
 class ImportRequest(BaseModel):
     """Request to import questions from JSON."""
@@ -67,6 +71,8 @@ class AdvancedGenerateRequest(BaseModel):
     n_multiplier: int = Field(3, ge=1, le=5, description="Generate this many times count")
     min_quality_score: float = Field(7.0, ge=0.0, le=10.0, description="Minimum quality score")
 
+    _dedupe_excluded_topics = field_validator("excluded_topics")(dedupe_entries)
+
 
 class AdvancedQuestionResponse(QuestionResponse):
     """Response with question data including quality metadata."""
@@ -106,6 +112,13 @@ class ReviewResponse(BaseModel):
     message: str
 
 
+class BulkReviewResponse(BaseModel):
+    """Response from bulk review endpoint."""
+    reviewed: List[str]
+    not_found: List[str]
+    message: str
+
+
 class PendingReviewResponse(BaseModel):
     """Response from list pending reviews endpoint."""
     questions: List[AdvancedQuestionResponse]
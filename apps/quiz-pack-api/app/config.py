@@ -55,6 +55,10 @@ class Settings(BaseSettings):
     # processes, both init).
     sentry_dsn: Optional[str] = None
 
+    # /web admin templates ship inside the image, so Jinja's per-render
+    # mtime check is off unless JINJA_AUTO_RELOAD is set for template work.
+    jinja_auto_reload: bool = False
+
     @field_validator("storekit_environment", mode="before")
     @classmethod
     def _normalize_storekit_environment(cls, value: object) -> Optional[str]:
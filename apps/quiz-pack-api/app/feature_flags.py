@@ -249,3 +249,64 @@ def judge_models() -> list[str] | None:
         return None
     models = [m.strip() for m in raw.split(",") if m.strip()]
     return models or None
+
+
+def gen_sub_batches() -> int:
+    """How many concurrent LLM calls the closed (non-MCQ) generation slice is
+    split into.
+
+    ``1`` (default) → one call for the whole slice, as today. Values > 1 split
+    the count evenly across that many calls run together, each with a
+    disjoint slice of the source facts (same rule as the MCQ sub-batches);
+    a failed call costs only its share.
+    """
+    return _int_env("GEN_SUB_BATCHES", default=1)
+
+
+def critique_early_exit() -> bool:
+    """Stop best-of-N critique once the pairwise shortlist (``2*count``) is
+    filled with candidates scoring at least ``min_quality_score``.
+
+    ``False`` (default) → every generated candidate is judged, as today.
+    Saves up to ``(n-1)/n`` of the critique calls on easy batches, at the
+    cost of never judging (and so never selecting) the un-critiqued tail.
+    """
+    return _truthy(os.getenv("CRITIQUE_EARLY_EXIT"))
+
+
+def critique_batch_size() -> int:
+    """How many questions one critique judge call scores.
+
+    ``1`` (default) → one judge call per question, the calibrated path every
+    recorded ``critique_score`` came from. Values > 1 score that many
+    questions per call against the same rubric, trading per-call overhead
+    and repeated rubric tokens for a longer response; any question the batch
+    answer omits falls back to its own call.
+    """
+    return _int_env("CRITIQUE_BATCH_SIZE", default=1)
+
+
+def critique_structured() -> bool:
+    """Bind the single-question critique judge to a tool schema
+    (``with_structured_output(CritiqueOutput)``) instead of digging the JSON
+    verdict out of free text.
+
+    ``False`` (default) → free-text response + JSON extraction, the path every
+    recorded ``critique_score`` came from. On, a verdict missing a required
+    field fails the parse and takes the existing one-retry-then-None path
+    rather than landing half-filled.
+    """
+    return _truthy(os.getenv("CRITIQUE_STRUCTURED"))
+
+
+def generation_cache_ttl() -> int:
+    """Dev/test lever: seconds to reuse a ``/generate/advanced`` response for a
+    request of the same shape (identical apart from topic order and case).
+
+    ``0`` (default) → off: every call runs the full pipeline, since a generation
+    endpoint that hands back the same questions is wrong in production. Set
+    e.g. ``GENERATION_CACHE_TTL=86400`` on a dev box where prompt iteration
+    re-sends the same payload and each miss costs a multi-minute LLM run.
+    While on, same-shape requests that overlap share one in-flight run too.
+    """
+    return _int_env("GENERATION_CACHE_TTL", default=0, minimum=0)
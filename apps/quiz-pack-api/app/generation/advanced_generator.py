@@ -8,9 +8,15 @@ This implements:
 """
 
 import asyncio
+import copy
+import hashlib
 import json
+import logging
 import re
-from typing import List, Optional, Dict, Any, Literal
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Literal, Tuple
+import orjson
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel, Field, ValidationError
 
@@ -19,7 +25,11 @@ from quiz_shared.llm import factory as llm_factory
 import os
 
 from quiz_shared.models.question import GenerationProvenance, Question
-from .prompt_builder import PromptBuilder, STRUCTURED_MCQ_FORMAT_NOTE
+from .prompt_builder import (
+    PromptBuilder,
+    STRUCTURED_MCQ_FORMAT_NOTE,
+    render_template,
+)
 from .pattern_routing import verification_mode
 from .examples import example_corpus_path
 from ..scoring.multi_model_scorer import resolve_correct_answer
@@ -30,6 +40,8 @@ try:
 except ImportError:
     Fact = None  # sourcing package not installed
 
+logger = logging.getLogger(__name__)
+
 
 # Stable id for the current ("fun") generation pipeline, stamped on every
 # question's provenance so rows from this flow stay distinguishable from legacy
@@ -83,6 +95,52 @@ CACHE_BREAKPOINT_MARKER = "<!--CACHE_BREAKPOINT-->"
 MCQ_TARGET_FRACTION = 0.2
 
 
+@lru_cache(maxsize=8)
+def _chat_client(model: str, temperature: float):
+    """One chat client per (model, temperature) per process.
+
+    Generators are built by the API, the worker and the CLI scripts, usually
+    with the same role models; sharing the client keeps one httpx pool and
+    skips re-resolving the gateway for every instance.
+    """
+    return llm_factory.chat_openai(model, temperature=temperature)
+
+
+@lru_cache(maxsize=1)
+def _critique_prompt() -> Tuple[str, str]:
+    """(template, rubric) for the critique judge, read from disk once.
+
+    Prefers the V2 calibrated prompt. The rubric is the template minus its
+    single-question tail, for batched calls — there are no format fields above
+    the split, so it needs no brace unescaping.
+    """
+    prompts_dir = os.path.join(os.path.dirname(__file__), "..", "..", "prompts")
+    v2_path = os.path.join(prompts_dir, "question_critique_v2.md")
+    v1_path = os.path.join(prompts_dir, "question_critique.md")
+    with open(v2_path if os.path.exists(v2_path) else v1_path, "r", encoding="utf-8") as f:
+        template = f.read()
+    return template, template.split("## Question to Evaluate", 1)[0]
+
+
+# Critique verdicts kept per generator, keyed by question content + judge
+# model. Regeneration loops and re-runs re-judge unchanged questions; a hit
+# skips the LLM call. Bounded so a long-lived worker doesn't grow unbounded.
+_CRITIQUE_CACHE_MAX = 1024
+
+# Characters that matter when scanning LLM output for balanced JSON objects.
+_JSON_STRUCTURE = re.compile(r'[{}"\\]')
+
+
+def _repeat_key(stem: str, correct_answer: Any, possible_answers: Any = None) -> Tuple[str, str]:
+    """Identity of a generated question for repeat checks: the stem with
+    whitespace and case folded, plus the answer TEXT (an MCQ key letter is
+    resolved, so two MCQs sharing a generic stem and key stay distinct)."""
+    _, answer = resolve_correct_answer(
+        correct_answer, possible_answers if isinstance(possible_answers, dict) else None
+    )
+    return " ".join(stem.split()).casefold(), answer.casefold()
+
+
 # Issue #72 — per-question source attribution. Tokeniser for matching a
 # generated question back to the specific source Fact it was built from, so each
 # question cites its OWN fact's URL instead of the whole pack inheriting one
@@ -256,6 +314,24 @@ class MCQBatchOutput(BaseModel):
     questions: List[MCQQuestionItem] = Field(default_factory=list)
 
 
+class CritiqueOutput(BaseModel):
+    """Structured-output contract for one critique verdict (``CRITIQUE_STRUCTURED``).
+
+    Mirrors the JSON block in ``question_critique.md``. Only ``scores``,
+    ``overall_score`` and ``verdict`` are required — the lists and the prose
+    reasoning are telemetry, so an empty one never voids a verdict.
+    """
+
+    scores: Dict[str, float]
+    overall_score: float
+    red_flags: List[str] = Field(default_factory=list)
+    strengths: List[str] = Field(default_factory=list)
+    weaknesses: List[str] = Field(default_factory=list)
+    improvement_suggestions: List[str] = Field(default_factory=list)
+    verdict: str
+    reasoning: str = ""
+
+
 class AdvancedQuestionGenerator:
     """Multi-stage question generator with quality optimization."""
 
@@ -285,17 +361,14 @@ class AdvancedQuestionGenerator:
                 lever. ``None`` keeps ``question_generation_v3_fact_first.md``.
         """
         self.verbose = verbose
-        self.generation_llm = llm_factory.chat_openai(
-            generation_model,
-            temperature=generation_temperature,
-        )
-        self.critique_llm = llm_factory.chat_openai(
-            critique_model,
-            temperature=critique_temperature,
-        )
+        self.generation_llm = _chat_client(generation_model, generation_temperature)
+        self.critique_llm = _chat_client(critique_model, critique_temperature)
 
         self.generation_model = generation_model
         self.critique_model = critique_model
+        self._critique_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # (client, bound judge) for CRITIQUE_STRUCTURED; see _structured_judge.
+        self._structured_judge_binding: Optional[Tuple[Any, Any]] = None
         self.prompt_version = prompt_version
 
         # Load appropriate prompt template
@@ -375,16 +448,7 @@ class AdvancedQuestionGenerator:
                     "machinery would silently not fire (generation review A2)."
                 )
 
-        # Load critique prompt (prefer V2 calibrated version)
-        critique_v2_path = os.path.join(
-            current_dir, "..", "..", "prompts", "question_critique_v2.md"
-        )
-        critique_v1_path = os.path.join(
-            current_dir, "..", "..", "prompts", "question_critique.md"
-        )
-        critique_template_path = critique_v2_path if os.path.exists(critique_v2_path) else critique_v1_path
-        with open(critique_template_path, "r", encoding="utf-8") as f:
-            self.critique_template = f.read()
+        self.critique_template, self.critique_rubric = _critique_prompt()
 
     async def generate_questions(
         self,
@@ -471,10 +535,12 @@ class AdvancedQuestionGenerator:
         # unset below). The static prompt prefix stays cacheable regardless —
         # see CACHE_BREAKPOINT_MARKER, which now sits ABOVE the example
         # sections in the fact-first templates.
-        open_questions: List[Question] = []
+        # The open slice shares no state with the closed slice, so its LLM call
+        # runs alongside the closed path instead of ahead of it.
+        open_task: Optional[asyncio.Future] = None
         if open_count > 0:
-            print(f"Generating {open_count} open-shape questions...")
-            open_questions = await self._generate_batch(
+            logger.info("Generating %d open-shape questions", open_count)
+            open_task = asyncio.ensure_future(self._generate_batch(
                 count=open_count,
                 difficulty=difficulty,
                 topics=topics,
@@ -484,11 +550,54 @@ class AdvancedQuestionGenerator:
                 avoid_questions=avoid_questions,
                 user_bad_examples=user_bad_examples,
                 open_shape=True,
-            )
+            ))
             count = max(0, count - open_count)
-        if count == 0:
-            return open_questions
 
+        try:
+            closed_questions: List[Question] = []
+            if count > 0:
+                closed_questions = await self._generate_closed(
+                    count=count,
+                    difficulty=difficulty,
+                    topics=topics,
+                    categories=categories,
+                    question_type=question_type,
+                    excluded_topics=excluded_topics,
+                    avoid_questions=avoid_questions,
+                    user_bad_examples=user_bad_examples,
+                    enable_best_of_n=enable_best_of_n,
+                    n_multiplier=n_multiplier,
+                    min_quality_score=min_quality_score,
+                    source_facts=source_facts,
+                    mcq_patterns=mcq_patterns,
+                    mcq_emphasis=mcq_emphasis,
+                )
+        except BaseException:
+            if open_task is not None:
+                open_task.cancel()
+            raise
+        open_questions = await open_task if open_task is not None else []
+        return open_questions + closed_questions
+
+    async def _generate_closed(
+        self,
+        *,
+        count: int,
+        difficulty: Optional[str],
+        topics: Optional[List[str]],
+        categories: Optional[List[str]],
+        question_type: str,
+        excluded_topics: Optional[List[str]],
+        avoid_questions: Optional[List[str]],
+        user_bad_examples: Optional[List[str]],
+        enable_best_of_n: bool,
+        n_multiplier: Optional[int],
+        min_quality_score: float,
+        source_facts: Optional[list],
+        mcq_patterns: Optional[set[str]],
+        mcq_emphasis: bool,
+    ) -> List[Question]:
+        """The closed (non-open-shape) slice of ``generate_questions``."""
         # Issue #42 task 42.20 (Risk #7 escalation) — MCQ-emphasis orders
         # generate one small sub-batch per MCQ pattern instead of a single
         # large best-of-N call. Asking the generation LLM for
@@ -499,7 +608,7 @@ class AdvancedQuestionGenerator:
         # per-call counts small (the LLM actually fills them) and forces
         # coverage across every key in ``PATTERNS_TO_MCQ``.
         if mcq_emphasis and mcq_patterns:
-            closed_questions = await self._generate_mcq_sub_batches(
+            return await self._generate_mcq_sub_batches(
                 count=count,
                 difficulty=difficulty,
                 topics=topics,
@@ -511,16 +620,15 @@ class AdvancedQuestionGenerator:
                 source_facts=source_facts,
                 mcq_patterns=mcq_patterns,
             )
-            return open_questions + closed_questions
 
         if enable_best_of_n:
             # Stage 1: Generate N x count questions
             if n_multiplier is None:
                 n_multiplier = feature_flags.overgen_multiplier()
             generate_count = count * n_multiplier
-            print(f"Stage 1: Generating {generate_count} questions...")
+            logger.info("Stage 1: generating %d questions", generate_count)
 
-            raw_questions = await self._generate_batch(
+            raw_questions = await self._generate_split(
                 count=generate_count,
                 difficulty=difficulty,
                 topics=topics,
@@ -534,21 +642,18 @@ class AdvancedQuestionGenerator:
                 mcq_emphasis=mcq_emphasis,
             )
 
-            print(f"Generated {len(raw_questions)} raw questions")
+            logger.info("Generated %d raw questions", len(raw_questions))
 
             # Stage 2: Critique each question (concurrently — the critique
             # model is a frontier judge since 2026-07-30; serial calls made
             # this stage the wall-clock bottleneck).
-            print(f"Stage 2: Critiquing {len(raw_questions)} questions...")
-            critique_sem = asyncio.Semaphore(8)
-
-            async def _critique_bounded(q: Question):
-                async with critique_sem:
-                    return await self._critique_question(q)
-
-            critiques = await asyncio.gather(
-                *(_critique_bounded(q) for q in raw_questions)
-            )
+            logger.info("Stage 2: critiquing %d questions", len(raw_questions))
+            if feature_flags.critique_early_exit():
+                raw_questions, critiques = await self._critique_until_shortlisted(
+                    raw_questions, 2 * count, min_quality_score
+                )
+            else:
+                critiques = await self._critique_all(raw_questions)
 
             questions_with_scores = []
             for q, critique in zip(raw_questions, critiques):
@@ -575,7 +680,7 @@ class AdvancedQuestionGenerator:
             # Stage 3: absolute-score prefilter, then pairwise refinement
             # (2026-07-30 review, section C: judges rank pairs far better
             # than they place absolute scores).
-            print("Stage 3: Selecting best questions (pairwise refinement)...")
+            logger.info("Stage 3: selecting best questions (pairwise refinement)")
             selected_questions = await self._select_top_pairwise(
                 questions_with_scores, count
             )
@@ -584,13 +689,14 @@ class AdvancedQuestionGenerator:
             # (it warned but never acted — false confidence) was removed. The
             # real ship gate is now ScoringStage's fail-loud minimum-score drop.
             # `min_quality_score` stays on the signature: it is still accepted
-            # via the order API (app/api/routes.py → generate_questions); it is
-            # simply no longer consumed in this best-of-N selection path.
-            return open_questions + selected_questions
+            # via the order API (app/api/routes.py → generate_questions); it no
+            # longer filters this best-of-N selection — its only use is the
+            # opt-in CRITIQUE_EARLY_EXIT stopping rule in Stage 2.
+            return selected_questions
 
         else:
             # Simple generation without Best-of-N
-            closed_questions = await self._generate_batch(
+            return await self._generate_split(
                 count=count,
                 difficulty=difficulty,
                 topics=topics,
@@ -603,7 +709,59 @@ class AdvancedQuestionGenerator:
                 mcq_patterns=mcq_patterns,
                 mcq_emphasis=mcq_emphasis,
             )
-            return open_questions + closed_questions
+
+    async def _generate_split(
+        self, count: int, source_facts: Optional[list] = None, **batch_kwargs
+    ) -> List[Question]:
+        """``_generate_batch`` fanned out over ``GEN_SUB_BATCHES`` concurrent calls.
+
+        One call for the whole count (the default) decodes every question
+        serially on the provider side; K smaller calls overlap. The count is
+        split with the MCQ sub-batch remainder rule and each call gets a
+        disjoint slice of the facts (#42 task 42.28). A failed call is logged
+        and skipped so its siblings still land; if every call fails, the
+        first error is raised, as a single call would.
+
+        The calls share one prompt, so their outputs overlap: the merged list
+        is de-duplicated with ``_parse_response``'s stem+answer rule, and the
+        batch diversity check runs once on it rather than on each slice.
+        """
+        k = min(feature_flags.gen_sub_batches(), count)
+        if k <= 1:
+            return await self._generate_batch(
+                count=count, source_facts=source_facts, **batch_kwargs
+            )
+
+        base, extra = divmod(count, k)
+        sizes = [base + (1 if i < extra else 0) for i in range(k)]
+        fact_slices = (
+            self._partition_facts(source_facts, k) if source_facts else [None] * k
+        )
+        batches = await asyncio.gather(
+            *(
+                self._generate_batch(
+                    count=n, source_facts=facts, check_diversity=False, **batch_kwargs
+                )
+                for n, facts in zip(sizes, fact_slices)
+            ),
+            return_exceptions=True,
+        )
+        questions: List[Question] = []
+        failures: List[BaseException] = []
+        for batch in batches:
+            if isinstance(batch, BaseException):
+                logger.warning("Generation sub-batch failed: %r", batch)
+                failures.append(batch)
+                continue
+            questions.extend(batch)
+        if len(failures) == k:
+            raise failures[0]
+        logger.info(
+            "%d generation sub-batches produced %d questions", k, len(questions)
+        )
+        questions = self._drop_repeated_questions(questions)
+        self._check_batch_diversity(questions)
+        return questions
 
     async def _generate_mcq_sub_batches(
         self,
@@ -642,9 +800,11 @@ class AdvancedQuestionGenerator:
         # `extra` patterns absorb the remainder so the totals sum to `count`.
         base, extra = divmod(count, len(patterns))
         per_pattern = [base + (1 if i < extra else 0) for i in range(len(patterns))]
-        print(
-            f"MCQ emphasis: {count} questions across {len(patterns)} "
-            f"per-pattern sub-batches {dict(zip(patterns, per_pattern))}"
+        logger.info(
+            "MCQ emphasis: %d questions across %d per-pattern sub-batches %s",
+            count,
+            len(patterns),
+            dict(zip(patterns, per_pattern)),
         )
 
         # #42 task 42.28 — give each per-pattern sub-batch a DISJOINT slice of
@@ -680,7 +840,7 @@ class AdvancedQuestionGenerator:
                 # sub-batch failing (LLM timeout, malformed structured output)
                 # must not sink the other patterns. Drop just this sub-batch
                 # and let the siblings through.
-                print(f"MCQ sub-batch for pattern {pattern!r} failed: {exc!r}")
+                logger.warning("MCQ sub-batch for pattern %r failed: %r", pattern, exc)
                 return []
 
         # `return_exceptions=True` is a belt-and-suspenders net for the
@@ -697,7 +857,7 @@ class AdvancedQuestionGenerator:
         questions: List[Question] = [
             q for batch in batches if isinstance(batch, list) for q in batch
         ]
-        print(f"MCQ sub-batches produced {len(questions)} raw questions")
+        logger.info("MCQ sub-batches produced %d raw questions", len(questions))
 
         # #72 P4.2 (RC-7) — restore self_critique telemetry on the MCQ path.
         # The sub-batch architecture deliberately does NOT over-generate
@@ -709,8 +869,8 @@ class AdvancedQuestionGenerator:
         # observable (fun was measured in ~5 places for text, 0 for MCQ). No
         # question is dropped — ``ScoringStage`` stays the ship gate.
         if feature_flags.mcq_critique_telemetry():
-            for q in questions:
-                critique = await self._critique_question(q)
+            critiques = await self._critique_all(questions)
+            for q, critique in zip(questions, critiques):
                 if critique is None:
                     # A6: telemetry must not fabricate a score; record the miss.
                     critique = {
@@ -729,6 +889,29 @@ class AdvancedQuestionGenerator:
 
         return questions
 
+    @staticmethod
+    def _drop_repeated_questions(questions: List[Question]) -> List[Question]:
+        """Keep the first question per ``_repeat_key``, in order.
+
+        ``_parse_response`` already applies this rule within one response;
+        this applies it across the responses of ``_generate_split``, whose
+        sub-batches share a prompt and restate each other's questions.
+        """
+        seen: set[Tuple[str, str]] = set()
+        unique: List[Question] = []
+        for q in questions:
+            key = _repeat_key(q.question, q.correct_answer, q.possible_answers)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(q)
+        if len(unique) < len(questions):
+            logger.info(
+                "Dropped %d repeated question(s) across sub-batches",
+                len(questions) - len(unique),
+            )
+        return unique
+
     @staticmethod
     def _partition_facts(facts: Optional[list], n: int) -> List[Optional[list]]:
         """Split ``facts`` into ``n`` disjoint contiguous chunks (#42 task 42.28).
@@ -855,10 +1038,13 @@ class AdvancedQuestionGenerator:
         except json.JSONDecodeError as e:
             body = e.doc or ""
             around = body[max(0, e.pos - 100):e.pos + 100]
-            print(
-                f"#142 non-JSON provider response "
-                f"(len={len(body)}, pos={e.pos}): retrying once. "
-                f"Body head: {body[:300]!r} … around error: {around!r}"
+            logger.warning(
+                "#142 non-JSON provider response (len=%d, pos=%d): retrying once. "
+                "Body head: %r … around error: %r",
+                len(body),
+                e.pos,
+                body[:300],
+                around,
             )
             return await llm.ainvoke(messages)
 
@@ -876,6 +1062,7 @@ class AdvancedQuestionGenerator:
         mcq_patterns: Optional[set[str]] = None,
         mcq_emphasis: bool = False,
         open_shape: bool = False,
+        check_diversity: bool = True,
     ) -> List[Question]:
         """Generate a batch of questions.
 
@@ -887,6 +1074,8 @@ class AdvancedQuestionGenerator:
                 LLM is told to set ``reasoning.pattern_used`` to one of the
                 snake_case keys and emit ``possible_answers`` + key-letter
                 ``correct_answer`` when it picks one.
+            check_diversity: Run the batch diversity check here. Off for a
+                ``_generate_split`` slice, which checks the merged batch.
 
         Gold/anti-pattern examples are sampled fresh for THIS call (founder
         call, 2026-08: per-call rotation over within-order prompt-cache
@@ -927,6 +1116,7 @@ class AdvancedQuestionGenerator:
             use_open=use_open,
             use_fact_first=use_fact_first,
             source_facts=source_facts,
+            check_diversity=check_diversity,
         )
 
     def _build_batch_prompt(
@@ -1071,6 +1261,7 @@ class AdvancedQuestionGenerator:
         use_open: bool,
         use_fact_first: bool,
         source_facts: Optional[list] = None,
+        check_diversity: bool = True,
     ) -> List[Question]:
         """Attach provenance metadata, then dedup vs gold standard + check diversity.
 
@@ -1145,7 +1336,8 @@ class AdvancedQuestionGenerator:
         questions = self._dedup_against_gold_standard(questions)
 
         # Warn if batch lacks structural diversity
-        self._check_batch_diversity(questions)
+        if check_diversity:
+            self._check_batch_diversity(questions)
 
         return questions
 
@@ -1252,11 +1444,12 @@ class AdvancedQuestionGenerator:
                     )
                 )
             except Exception as e:
-                print(f"Error building structured MCQ question: {e}")
+                logger.warning("Error building structured MCQ question: %s", e)
 
-        print(
-            f"MCQ structured sub-batch ({pinned_pattern}) produced "
-            f"{len(questions)} questions"
+        logger.info(
+            "MCQ structured sub-batch (%s) produced %d questions",
+            pinned_pattern,
+            len(questions),
         )
         return self._finalize_questions(
             questions,
@@ -1297,23 +1490,93 @@ class AdvancedQuestionGenerator:
                 except ValidationError:
                     dropped += 1
         if dropped:
-            print(
-                f"MCQ sub-batch salvage: dropped {dropped} invalid "
-                f"question(s), kept {len(items)} valid sibling(s)"
+            logger.warning(
+                "MCQ sub-batch salvage: dropped %d invalid question(s), "
+                "kept %d valid sibling(s)",
+                dropped,
+                len(items),
             )
         return items
 
     @staticmethod
     def _strip_markdown_fences(content: str) -> str:
-        """Remove ```json ... ``` wrappers that LLMs sometimes add around JSON."""
+        """Remove ```json ... ``` wrappers that LLMs sometimes add around JSON.
+
+        A ```json block after a line of prose is unwrapped too, so the
+        whole-text fast path in ``_first_json_object`` still applies.
+        """
         content = content.strip()
         if content.startswith("```"):
             first_nl = content.find("\n")
             last_fence = content.rfind("```")
             if first_nl != -1 and last_fence > first_nl:
                 content = content[first_nl + 1:last_fence].strip()
+        elif (fence := content.find("```json")) != -1:
+            body = content.find("\n", fence)
+            close = content.find("```", body) if body != -1 else -1
+            if close != -1:
+                content = content[body + 1:close].strip()
         return content
 
+    @staticmethod
+    def _first_json_object(text: str) -> Optional[Dict[str, Any]]:
+        """First complete top-level JSON object in ``text``, or None.
+
+        Most responses are nothing but the JSON object, so ``orjson`` gets the
+        first try at the whole text. Otherwise one string-aware brace-depth
+        scan finds each balanced top-level ``{...}`` span and only those are
+        parsed: prose around the object (or a second JSON block after it) is
+        skipped, and a truncated response — whose outer object never closes —
+        is rejected without a parse attempt, instead of surfacing one of its
+        inner objects (a lone ``scores`` dict) as if it were the answer.
+        The stdlib parser is the per-span fallback for what orjson rejects
+        (NaN, over-wide ints).
+        """
+        if text.startswith("{"):
+            try:
+                obj = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                if isinstance(obj, dict):
+                    return obj
+
+        depth = 0
+        start = 0
+        in_string = False
+        escaped_until = -1
+        for match in _JSON_STRUCTURE.finditer(text):
+            pos = match.start()
+            if pos < escaped_until:
+                continue
+            ch = text[pos]
+            if in_string:
+                if ch == "\\":
+                    escaped_until = pos + 2
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                # Quotes in surrounding prose are not JSON strings.
+                in_string = depth > 0
+            elif ch == "{":
+                if depth == 0:
+                    start = pos
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                if depth == 0:
+                    span = text[start:pos + 1]
+                    try:
+                        obj = orjson.loads(span)
+                    except orjson.JSONDecodeError:
+                        try:
+                            obj = json.loads(span)
+                        except json.JSONDecodeError:
+                            continue
+                    if isinstance(obj, dict):
+                        return obj
+        return None
+
     @staticmethod
     def _jaccard_similarity(text_a: str, text_b: str) -> float:
         """Compute Jaccard word-overlap similarity between two texts."""
@@ -1342,7 +1605,7 @@ class AdvancedQuestionGenerator:
             is_copy = False
             for gold_q in gold_texts:
                 if self._jaccard_similarity(q.question, gold_q) > threshold:
-                    print(f"  Dedup: removed near-copy of gold standard: {q.question[:60]}...")
+                    logger.info("Dedup: removed near-copy of gold standard: %s...", q.question[:60])
                     is_copy = True
                     break
             if not is_copy:
@@ -1357,9 +1620,13 @@ class AdvancedQuestionGenerator:
         which_count = sum(1 for q in questions if q.question.strip().startswith("Which"))
         ratio = which_count / len(questions)
         if ratio > threshold:
-            print(
-                f"  ⚠ Diversity warning: {which_count}/{len(questions)} "
-                f"({ratio:.0%}) questions start with 'Which' (target: ≤{threshold:.0%})"
+            logger.warning(
+                "Diversity warning: %d/%d (%.0f%%) questions start with 'Which' "
+                "(target: ≤%.0f%%)",
+                which_count,
+                len(questions),
+                ratio * 100,
+                threshold * 100,
             )
 
     @staticmethod
@@ -1621,14 +1888,8 @@ Respond in JSON only:
 
     def _parse_pairwise_winner(self, content: str) -> Optional[str]:
         """'A' | 'B' from a pairwise verdict, else None (pair is skipped)."""
-        text = self._strip_markdown_fences(content)
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start == -1 or end <= start:
-            return None
-        try:
-            data = json.loads(text[start:end])
-        except json.JSONDecodeError:
+        data = self._first_json_object(self._strip_markdown_fences(content))
+        if data is None:
             return None
         winner = str(data.get("winner", "")).strip().upper()
         return winner if winner in ("A", "B") else None
@@ -1689,11 +1950,11 @@ Respond in JSON only:
                         [HumanMessage(content=prompt)]
                     )
             except Exception as exc:  # noqa: BLE001 — judge call boundary
-                print(f"Pairwise judge call failed (pair skipped): {exc!r}")
+                logger.warning("Pairwise judge call failed (pair skipped): %r", exc)
                 return None
             winner = self._parse_pairwise_winner(response.content)
             if winner is None:
-                print("Pairwise judge verdict unparseable (pair skipped)")
+                logger.warning("Pairwise judge verdict unparseable (pair skipped)")
                 return None
             return a_idx if winner == "A" else b_idx
 
@@ -1715,6 +1976,245 @@ Respond in JSON only:
         )
         return [shortlist[idx][0] for idx in ranked[:count]]
 
+    async def _critique_until_shortlisted(
+        self,
+        questions: List[Question],
+        shortlist: int,
+        min_score: float,
+    ) -> Tuple[List[Question], List[Optional[Dict[str, Any]]]]:
+        """Critique in waves of ``shortlist`` until that many clear ``min_score``.
+
+        ``CRITIQUE_EARLY_EXIT`` only. Pairwise selection only ever looks at the
+        top ``2*count`` absolute scores, so once that many candidates score at
+        or above ``min_score`` the rest cannot change the outcome enough to be
+        worth judging. Returns the critiqued prefix and its critiques; the
+        un-judged tail is dropped rather than ranked as unscored.
+        """
+        wave = max(1, shortlist)
+        critiques: List[Optional[Dict[str, Any]]] = []
+        passing = 0
+        for start in range(0, len(questions), wave):
+            batch = await self._critique_all(questions[start:start + wave])
+            critiques.extend(batch)
+            passing += sum(
+                1
+                for c in batch
+                if c is not None
+                and isinstance(c.get("overall_score"), (int, float))
+                and c["overall_score"] >= min_score
+            )
+            if passing >= shortlist:
+                break
+        if len(critiques) < len(questions):
+            logger.info(
+                "Early exit: %d candidates >= %s after %d/%d critiques",
+                passing,
+                min_score,
+                len(critiques),
+                len(questions),
+            )
+        return questions[:len(critiques)], critiques
+
+    def _critique_cache_key(self, question: Question) -> str:
+        """Hash of everything the critique prompt renders, plus the judge."""
+        _, answer_text = resolve_correct_answer(
+            question.correct_answer, question.possible_answers
+        )
+        material = "\x00".join((
+            self.critique_model,
+            question.question,
+            self._options_block(question),
+            str(answer_text),
+            question.explanation or "",
+            question.type,
+            question.difficulty,
+            question.topic,
+        ))
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def _critique_all(
+        self, questions: List[Question]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Critique ``questions`` concurrently, results in input order.
+
+        Questions judged before (same content, same judge) come from the
+        critique cache; only the rest reach the LLM. Failed (None) critiques
+        are not cached, so they are retried on the next pass.
+        """
+        keys = [self._critique_cache_key(q) for q in questions]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        misses: List[int] = []
+        for i, key in enumerate(keys):
+            hit = self._critique_cache.get(key)
+            if hit is None:
+                misses.append(i)
+            else:
+                self._critique_cache.move_to_end(key)
+                results[i] = copy.deepcopy(hit)
+
+        fresh = await self._critique_uncached([questions[i] for i in misses])
+        for i, critique in zip(misses, fresh):
+            results[i] = critique
+            if critique is not None:
+                self._critique_cache[keys[i]] = copy.deepcopy(critique)
+                self._critique_cache.move_to_end(keys[i])
+        while len(self._critique_cache) > _CRITIQUE_CACHE_MAX:
+            self._critique_cache.popitem(last=False)
+        return results
+
+    async def _critique_uncached(
+        self, questions: List[Question]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run the critique judge over ``questions``, results in input order.
+
+        The judge calls are latency-bound, so they run side by side — capped
+        at 8 in flight (same width as the pairwise duels) to stay clear of
+        provider rate limits. A call that raises yields None, like a judge
+        that failed its retry.
+        """
+        if not questions:
+            return []
+        sem = asyncio.Semaphore(8)
+        batch_size = feature_flags.critique_batch_size()
+
+        async def _bounded(q: Question) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return await self._critique_question(q)
+
+        if batch_size > 1:
+            async def _bounded_batch(
+                batch: List[Question],
+            ) -> List[Optional[Dict[str, Any]]]:
+                async with sem:
+                    by_id = await self._critique_batch(batch)
+                missing = [q for q in batch if q.id not in by_id]
+                if missing:
+                    logger.warning(
+                        "Batched critique omitted %d question(s); scoring singly",
+                        len(missing),
+                    )
+                    # Same cap as the batches: a failed batch call must not
+                    # fire all of its single critiques at once.
+                    singles = await asyncio.gather(*(_bounded(q) for q in missing))
+                    by_id.update((q.id, c) for q, c in zip(missing, singles))
+                return [by_id[q.id] for q in batch]
+
+            batches = [
+                questions[i:i + batch_size]
+                for i in range(0, len(questions), batch_size)
+            ]
+            results = await asyncio.gather(
+                *(_bounded_batch(b) for b in batches), return_exceptions=True
+            )
+            return [
+                c
+                for b, r in zip(batches, results)
+                for c in ([None] * len(b) if isinstance(r, BaseException) else r)
+            ]
+
+        results = await asyncio.gather(
+            *(_bounded(q) for q in questions), return_exceptions=True
+        )
+        return [None if isinstance(r, BaseException) else r for r in results]
+
+    @staticmethod
+    def _options_block(question: Question) -> str:
+        if question.possible_answers:
+            return " | ".join(
+                f"{str(k).lower()}) {v}"
+                for k, v in question.possible_answers.items()
+            )
+        return "(not multiple-choice)"
+
+    def _finish_critique(self, critique_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Stamp the judge model and damp uniformly inflated scores."""
+        critique_data["critique_model"] = self.critique_model
+
+        # Score normalization: if all dimensions scored >8, likely inflated
+        scores = critique_data.get("scores", {})
+        if scores and all(v > 8 for v in scores.values() if isinstance(v, (int, float))):
+            original = critique_data.get("overall_score", 0)
+            critique_data["overall_score"] = max(0, original - 0.5)
+            critique_data["score_normalized"] = True
+            critique_data["original_score"] = original
+        return critique_data
+
+    async def _critique_batch(
+        self, questions: List[Question]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Critique several questions in ONE judge call (``CRITIQUE_BATCH_SIZE``).
+
+        Same rubric as ``_critique_question``; the response is a
+        ``{"critiques": [{"id": …, <single-critique fields>}, …]}`` object.
+        Returns critiques keyed by question id — ids the judge skipped or
+        mangled are simply absent, and the caller scores those singly.
+        """
+        blocks = []
+        for n, q in enumerate(questions, 1):
+            _, answer_text = resolve_correct_answer(q.correct_answer, q.possible_answers)
+            blocks.append(
+                f"### {n}. id: {q.id}\n"
+                f"**Question:** {q.question}\n"
+                f"**Options:** {self._options_block(q)}\n"
+                f"**Correct Answer:** {answer_text}\n"
+                f"**Explanation:** {q.explanation or '(none provided)'}\n"
+                f"**Type:** {q.type}\n"
+                f"**Difficulty:** {q.difficulty}\n"
+                f"**Topic:** {q.topic}"
+            )
+        prompt = (
+            self.critique_rubric
+            + f"## Questions to Evaluate ({len(questions)})\n\n"
+            + "Score each question independently against the anchors — do not "
+            "grade them relative to each other.\n\n"
+            + "\n\n".join(blocks)
+            + "\n\n## Response Format\n\n"
+            'Return ONLY a JSON object {"critiques": [...]} with one entry per '
+            'question, each holding its "id" plus "scores" (surprise_factor, '
+            'clever_framing, clarity, factual_accuracy, answerability), '
+            '"overall_score", "red_flags", "strengths", "weaknesses", '
+            '"improvement_suggestions", "verdict" and "reasoning".\n'
+        )
+
+        try:
+            response = await self.critique_llm.ainvoke([HumanMessage(content=prompt)])
+            data = self._first_json_object(self._strip_markdown_fences(response.content))
+            if data is None:
+                logger.warning(
+                    "No JSON in batched critique response (%d questions)", len(questions)
+                )
+                return {}
+            items = data.get("critiques", [])
+        except Exception as e:  # noqa: BLE001 — judge call boundary
+            logger.warning("Batched critique failed: %s", e)
+            return {}
+
+        wanted = {q.id for q in questions}
+        out: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            if isinstance(item, dict) and item.get("id") in wanted:
+                qid = item.pop("id")
+                out[qid] = self._finish_critique(item)
+        return out
+
+    def _structured_judge(self) -> Any:
+        """``critique_llm`` bound to ``CritiqueOutput``, built once per client.
+
+        Binding the schema converts it to a tool definition; a critique run
+        makes one call per candidate, so the binding is reused rather than
+        rebuilt each time. Rebuilt only if ``critique_llm`` is swapped.
+        """
+        binding = self._structured_judge_binding
+        if binding is None or binding[0] is not self.critique_llm:
+            binding = (
+                self.critique_llm,
+                self.critique_llm.with_structured_output(
+                    CritiqueOutput, method="function_calling"
+                ),
+            )
+            self._structured_judge_binding = binding
+        return binding[1]
+
     async def _critique_question(self, question: Question) -> Optional[Dict[str, Any]]:
         """Critique a question using the LLM judge.
 
@@ -1724,17 +2224,12 @@ Respond in JSON only:
         ``overall_score: 5.0, verdict: "acceptable"``, silently ranking failed
         judgments as average; callers now handle None explicitly.
         """
-        if question.possible_answers:
-            options_block = " | ".join(
-                f"{str(k).lower()}) {v}"
-                for k, v in question.possible_answers.items()
-            )
-        else:
-            options_block = "(not multiple-choice)"
+        options_block = self._options_block(question)
         _, answer_text = resolve_correct_answer(
             question.correct_answer, question.possible_answers
         )
-        critique_prompt = self.critique_template.format(
+        critique_prompt = render_template(
+            self.critique_template,
             question=question.question,
             correct_answer=answer_text,
             options_block=options_block,
@@ -1744,36 +2239,30 @@ Respond in JSON only:
             topic=question.topic,
         )
 
+        structured = feature_flags.critique_structured()
+        judge = self._structured_judge() if structured else self.critique_llm
         for attempt in (1, 2):
             try:
-                response = await self.critique_llm.ainvoke([
-                    HumanMessage(content=critique_prompt)
-                ])
-                critique_content = self._strip_markdown_fences(response.content)
-                start = critique_content.find('{')
-                end = critique_content.rfind('}') + 1
-                if start == -1 or end <= start:
-                    print(
-                        f"No JSON in critique response (attempt {attempt}) "
-                        f"for: {question.question[:60]}..."
+                response = await judge.ainvoke([HumanMessage(content=critique_prompt)])
+                if structured:
+                    # None: the judge answered without calling the tool.
+                    critique_data = response.model_dump() if response else None
+                else:
+                    critique_data = self._first_json_object(
+                        self._strip_markdown_fences(response.content)
+                    )
+                if critique_data is None:
+                    logger.warning(
+                        "No JSON in critique response (attempt %d) for: %s...",
+                        attempt,
+                        question.question[:60],
                     )
                     continue
 
-                critique_data = json.loads(critique_content[start:end])
-                critique_data["critique_model"] = self.critique_model
-
-                # Score normalization: if all dimensions scored >8, likely inflated
-                scores = critique_data.get("scores", {})
-                if scores and all(v > 8 for v in scores.values() if isinstance(v, (int, float))):
-                    original = critique_data.get("overall_score", 0)
-                    critique_data["overall_score"] = max(0, original - 0.5)
-                    critique_data["score_normalized"] = True
-                    critique_data["original_score"] = original
-
-                return critique_data
+                return self._finish_critique(critique_data)
 
             except Exception as e:  # noqa: BLE001 — judge call boundary
-                print(f"Critique attempt {attempt} failed: {e}")
+                logger.warning("Critique attempt %d failed: %s", attempt, e)
 
         return None
 
@@ -1802,34 +2291,41 @@ Respond in JSON only:
             content = self._strip_markdown_fences(content)
 
             if self.verbose:
-                print(f"  [verbose] Raw response preview: {content[:200]}...")
-
-            # Extract JSON
-            start = content.find('{')
-            end = content.rfind('}') + 1
+                logger.info("Raw response preview: %s...", content[:200])
 
-            if start == -1 or end <= start:
-                print(f"No JSON found in response: {content[:200]}...")
+            data = self._first_json_object(content)
+            if data is None:
+                logger.warning("No JSON found in response: %s...", content[:200])
                 return []
 
-            json_str = content[start:end]
-            data = json.loads(json_str)
-
             # Handle both formats
             if "questions" in data:
                 questions_data = data["questions"]
             elif "question" in data:
                 questions_data = [data]
             else:
-                print(f"Unexpected JSON structure: {data}")
+                logger.warning("Unexpected JSON structure: %s", data)
                 return []
 
-            # Convert to Question objects
+            # Convert to Question objects. A stem+answer the model already
+            # emitted in this response is skipped before construction — it
+            # would otherwise be critiqued twice and could ship twice.
+            seen: set[tuple[str, str]] = set()
             for q_data in questions_data:
                 try:
+                    if isinstance(q_data, dict) and isinstance(q_data.get("question"), str):
+                        key = _repeat_key(
+                            q_data["question"],
+                            q_data.get("correct_answer", ""),
+                            q_data.get("possible_answers"),
+                        )
+                        if key in seen:
+                            logger.info("Skipping repeated question: %s...", q_data["question"][:60])
+                            continue
+                        seen.add(key)
                     if self.verbose:
                         has_fields = {k: k in q_data for k in ("reasoning", "self_critique", "surprise_factor")}
-                        print(f"  [verbose] Question fields: {has_fields}")
+                        logger.info("Question fields: %s", has_fields)
                     question = Question.from_dict(
                         q_data,
                         default_difficulty=default_difficulty,
@@ -1838,14 +2334,11 @@ Respond in JSON only:
                     self._check_answer_explanation_consistency(question)
                     questions.append(question)
                 except Exception as e:
-                    print(f"Error parsing question: {e}")
+                    logger.warning("Error parsing question: %s", e)
                     continue
 
-        except json.JSONDecodeError as e:
-            print(f"JSON decode error: {e}")
-            print(f"Content: {content[:500]}...")
         except Exception as e:
-            print(f"Error parsing response: {e}")
+            logger.exception("Error parsing response: %s", e)
 
         return questions
 
@@ -1855,8 +2348,10 @@ Respond in JSON only:
             return
         answer_str = str(question.correct_answer).lower().strip()
         if len(answer_str) <= 50 and answer_str not in question.explanation.lower():
-            print(
-                f"  ⚠ Answer/explanation mismatch: answer '{question.correct_answer}' "
-                f"not found in explanation for: {question.question[:80]}..."
+            logger.warning(
+                "Answer/explanation mismatch: answer %r not found in explanation "
+                "for: %s...",
+                question.correct_answer,
+                question.question[:80],
             )
 
@@ -2,6 +2,7 @@
 
 import json
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -34,6 +35,24 @@ def example_corpus_path(filename: str) -> Path:
     return path
 
 
+@lru_cache(maxsize=8)
+def _parse_corpus(path: Path, mtime_ns: int) -> list[dict]:
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_corpus(filename: str) -> list[dict]:
+    """Parsed corpus file, re-read only when the file changes.
+
+    Per-call example rotation samples the corpus on every LLM call; re-reading
+    and re-parsing the JSON each time was pure repeat work. Keyed on path +
+    mtime so an edited corpus is picked up without a restart. The returned
+    list is shared — callers filter into new lists and never mutate it.
+    """
+    path = example_corpus_path(filename)
+    return _parse_corpus(path, path.stat().st_mtime_ns)
+
+
 # Only entries the founder actually rated as gold belong in the "Gold
 # Standard" prompt section. 21/53 library entries carry ratings 5-7; showing
 # them as "9-10/10" anchored generation on mediocre exemplars (generation
@@ -92,8 +111,7 @@ def load_gold_standard(
 
     Returns formatted string suitable for prompt injection.
     """
-    with example_corpus_path("gold_standard.json").open("r", encoding="utf-8") as f:
-        all_examples = json.load(f)
+    all_examples = _load_corpus("gold_standard.json")
 
     rated_gold = [
         e for e in all_examples
@@ -198,8 +216,7 @@ def load_anti_patterns(n: int = 3) -> str:
     the concrete fix, not just the failure; entries without that triad keep
     the original BAD-only format.
     """
-    with example_corpus_path("anti_patterns.json").open("r", encoding="utf-8") as f:
-        examples = json.load(f)
+    examples = _load_corpus("anti_patterns.json")
 
     selected = random.sample(examples, min(n, len(examples)))
 
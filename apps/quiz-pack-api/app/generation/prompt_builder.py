@@ -1,7 +1,9 @@
 """Dynamic prompt builder for question generation."""
 
 import os
-from typing import List, Optional
+import string
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from quiz_shared.llm import factory as llm_factory
 
@@ -152,6 +154,72 @@ write JSON as prose. Field notes:
   convention (see THE CONTRACT)."""
 
 
+def _compile_format(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Pre-parse a ``str.format`` template into (literal, field) segments.
+
+    ``str.format`` re-parses the whole template on every call; the generation
+    and critique templates are several KB and rendered on every LLM call. Only
+    plain ``{name}`` fields are supported — a conversion or format spec fails
+    here, at compile time, rather than rendering differently from
+    ``str.format``.
+    """
+    segments: List[Tuple[str, Optional[str]]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format field {{{field}!{conversion}:{spec}}}")
+        segments.append((literal, field))
+    return segments
+
+
+def _render_format(segments: List[Tuple[str, Optional[str]]], **fields: Any) -> str:
+    """Render segments from ``_compile_format`` — same output as ``str.format``."""
+    return "".join(
+        literal if field is None else literal + str(fields[field])
+        for literal, field in segments
+    )
+
+
+@lru_cache(maxsize=32)
+def _template_segments(template: str) -> List[Tuple[str, Optional[str]]]:
+    # Keyed on the text: builders share the string object from
+    # ``_read_template``, so a hit costs an identity check.
+    return _compile_format(template)
+
+
+def render_template(template: str, **fields: Any) -> str:
+    """``template.format(**fields)`` from segments parsed once per template
+    text. Used for the generation prompts and the critique prompt alike."""
+    return _render_format(_template_segments(template), **fields)
+
+
+@lru_cache(maxsize=32)
+def _read_template(path: str) -> str:
+    """Template text, read once per path and process.
+
+    Every ``AdvancedQuestionGenerator`` builds up to four ``PromptBuilder``s.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def dedupe_entries(items: Optional[List[str]]) -> Optional[List[str]]:
+    """Strip, drop blanks and case-insensitive repeats, keeping first order.
+
+    The one rule for prompt list inputs, shared with the request schemas. The
+    list is rendered verbatim into the prompt, so it stays an ordered list
+    (prompt text must be deterministic) rather than a set; falsy passes
+    through.
+    """
+    if not items:
+        return items
+    seen: Dict[str, str] = {}
+    for item in items:
+        item = item.strip()
+        if item:
+            seen.setdefault(item.casefold(), item)
+    return list(seen.values())
+
+
 class PromptBuilder:
     """Builds question generation prompts with dynamic examples."""
 
@@ -173,8 +241,7 @@ class PromptBuilder:
 
     def _load_template(self) -> str:
         """Load prompt template from file."""
-        with open(self.template_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return _read_template(self.template_path)
 
     def build_prompt(
         self,
@@ -220,6 +287,13 @@ class PromptBuilder:
         Returns:
             Complete prompt ready for LLM
         """
+        # Repeated entries only add prompt tokens (and perturb the prompt for
+        # otherwise identical orders); keep first occurrences, in order.
+        topics = dedupe_entries(topics)
+        excluded_topics = dedupe_entries(excluded_topics)
+        avoid_questions = dedupe_entries(avoid_questions)
+        user_bad_examples = dedupe_entries(user_bad_examples)
+
         # Use dynamic sampling from the gold-standard library (raises if absent)
         if excellent_examples is None:
             excellent_examples = load_gold_standard(
@@ -239,8 +313,8 @@ class PromptBuilder:
         avoid_section = ""
         if avoid_questions:
             avoid_section = "\n\n**Do NOT repeat or rephrase these questions:**\n"
-            for q in avoid_questions[:10]:  # Limit to 10 to keep prompt reasonable
-                avoid_section += f"- {q}\n"
+            # Limit to 10 to keep prompt reasonable
+            avoid_section += "".join(f"- {q}\n" for q in avoid_questions[:10])
 
         # Build user feedback section (bad examples from users + anti-patterns)
         bad_examples_section = ""
@@ -322,7 +396,5 @@ class PromptBuilder:
         # Merge any extra template variables (e.g., facts_section for V3)
         format_vars.update(kwargs)
 
-        # Format main template
-        prompt = self.template.format(**format_vars)
-
-        return prompt
+        # Format main template (pre-parsed once per template text)
+        return render_template(self.template, **format_vars)
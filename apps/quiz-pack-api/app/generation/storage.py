@@ -7,8 +7,10 @@ the `PendingStore` used by the legacy import/review tooling. The future
 `PgvectorQuestionStore.upsert` — do NOT rebuild an approve path here.
 """
 
-from typing import List, Optional
-import uuid
+import asyncio
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from quiz_shared.models.question import Question
 from quiz_shared.database.pending_store import PendingStore, SQLitePendingStore
@@ -30,6 +32,19 @@ def _apply_simple_filters(questions: List[Question], filters: dict) -> List[Ques
     return out
 
 
+def new_pending_ids(count: int) -> List[str]:
+    """``count`` fresh ``q_<12 hex>`` pending-question ids from one
+    ``os.urandom`` read (a bulk import used to pay one uuid4 per row)."""
+    raw = os.urandom(6 * count).hex()
+    return [f"q_{raw[i:i + 12]}" for i in range(0, 12 * count, 12)]
+
+
+def _mark_pending(question: Question) -> None:
+    """Imports never arrive approved — approval is the review flow's job."""
+    if not question.review_status or question.review_status == "approved":
+        question.review_status = "pending_review"
+
+
 class QuestionStorage:
     """Fronts the pre-approval `PendingStore` for the import/review tooling."""
 
@@ -41,6 +56,7 @@ class QuestionStorage:
                 a default SQLite-backed one in `data/pending.db`)
         """
         self.pending = pending_store if pending_store is not None else SQLitePendingStore()
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
 
     def add_pending(self, question: Question) -> bool:
         """Persist a freshly imported/generated question for review.
@@ -49,11 +65,25 @@ class QuestionStorage:
         backed) review flow promotes it.
         """
         if question.id.startswith("temp_"):
-            question.id = f"q_{uuid.uuid4().hex[:12]}"
-        if not question.review_status or question.review_status == "approved":
-            question.review_status = "pending_review"
+            question.id = new_pending_ids(1)[0]
+        _mark_pending(question)
         return self.pending.upsert(question)
 
+    def add_pending_many(self, questions: List[Question]) -> List[str]:
+        """`add_pending` for a whole import in ONE pending-store transaction.
+
+        Returns the stored ids, or ``[]`` if the batch could not be written
+        (all rows land or none do).
+        """
+        temp = [q for q in questions if q.id.startswith("temp_")]
+        for question, fresh_id in zip(temp, new_pending_ids(len(temp))):
+            question.id = fresh_id
+        for question in questions:
+            _mark_pending(question)
+        if not self.pending.upsert_many(questions):
+            return []
+        return [q.id for q in questions]
+
     def search_questions(
         self,
         difficulty: Optional[str] = None,
@@ -103,6 +133,14 @@ class QuestionStorage:
         changes, and the review-then-save flow on a fresh import)."""
         return self.pending.upsert(question)
 
+    def get_questions(self, question_ids: List[str]) -> Dict[str, Question]:
+        """Get several pending questions in one read, keyed by ID."""
+        return self.pending.get_many(question_ids)
+
+    def update_questions_bulk(self, questions: List[Question]) -> bool:
+        """Upsert a batch of questions in a single pending-store transaction."""
+        return self.pending.upsert_many(questions)
+
     def get_all_questions(self, limit: int = 1000) -> List[Question]:
         """Get all pending-store questions.
 
@@ -125,3 +163,102 @@ class QuestionStorage:
 
     def count_pending(self, status: Optional[str] = "pending_review") -> int:
         return self.pending.count(status=status)
+
+    def average_quality(self, status: str = "approved", limit: int = 100) -> Optional[float]:
+        """Mean quality score over up to ``limit`` rated ``status`` questions.
+
+        Unrated rows are left out; ``None`` when none are rated. Shared by the
+        API and web stats pages so both report the same number.
+        """
+        quality_sum, quality_n = 0.0, 0
+        for q in self.pending.list(status=status, limit=limit):
+            if q.quality_ratings:
+                quality_sum += q.calculate_quality_score()
+                quality_n += 1
+        return quality_sum / quality_n if quality_n else None
+
+    def get_next_pending(
+        self, current_id: Optional[str], status: str = "pending_review"
+    ) -> Tuple[Optional[Question], int, int]:
+        """``(next_question, current_index, total)`` for a review queue.
+
+        ``current_index`` is 1-based (1 when ``current_id`` isn't queued). The
+        next question is the one after ``current_id``, wrapping to the head of
+        the queue, and never ``current_id`` itself. A count, a rank and at
+        most two short reads — the review pages used to load the first 1000
+        queued questions to find an index and a neighbour.
+        """
+        total = self.pending.count(status=status)
+        rank = self.pending.rank(current_id, status=status) if current_id else None
+        following = (
+            self.pending.list_after(current_id, status=status, limit=1)
+            if rank is not None
+            else []
+        )
+        if not following:
+            following = [
+                q for q in self.pending.list(status=status, limit=2) if q.id != current_id
+            ]
+        next_question = following[0] if following else None
+        return next_question, (rank + 1 if rank is not None else 1), total
+
+    def review_and_next(
+        self, question: Question, status: str = "pending_review"
+    ) -> Optional[Question]:
+        """Save a reviewed ``question`` and return the next one still queued.
+
+        The next row is read after the write, so a question another reviewer
+        has just taken out of the queue is never handed out again. An upsert
+        and one or two short reads — no count or rank, which only the review
+        page shows.
+        """
+        self.pending.upsert(question)
+        following = self.pending.list_after(question.id, status=status, limit=1)
+        if not following:
+            following = [
+                q for q in self.pending.list(status=status, limit=2) if q.id != question.id
+            ]
+        return following[0] if following else None
+
+    # ── Coalesced async reads ─────────────────────────────────────────────
+
+    async def _single_flight(self, key: Tuple[Any, ...], fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` in a worker thread, sharing the result with every caller
+        that asks for the same ``key`` while it is in flight.
+
+        A review dashboard polls the pending list and its count together, from
+        several tabs; identical concurrent reads collapse into one store query.
+        No wait window — a lone caller pays no extra latency. Results are
+        shared objects: callers must treat them as read-only.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(fn))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def list_pending_shared(
+        self,
+        status: Optional[str] = "pending_review",
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Question]:
+        """`list_pending` off the event loop, coalesced with identical reads."""
+        return await self._single_flight(
+            ("list", status, limit, offset),
+            lambda: self.list_pending(status=status, limit=limit, offset=offset),
+        )
+
+    async def count_pending_shared(self, status: Optional[str] = "pending_review") -> int:
+        """`count_pending` off the event loop, coalesced with identical reads."""
+        return await self._single_flight(
+            ("count", status), lambda: self.count_pending(status=status)
+        )
+
+
+@lru_cache(maxsize=1)
+def get_question_storage() -> QuestionStorage:
+    """Process-wide `QuestionStorage` shared by the API and web routers — one
+    SQLite engine (and connection pool) instead of one per router module."""
+    return QuestionStorage()
@@ -12,13 +12,22 @@ from contextlib import asynccontextmanager
 
 # Load environment variables from .env files
 try:
-    from dotenv import load_dotenv
-    # Try multiple locations: current dir, parent dirs, and project root
+    from dotenv import find_dotenv, load_dotenv
+    # Try multiple locations: project root, parent, and the nearest .env above
+    # this file. Earlier files win (no override); a file reached twice (the
+    # nearest one is usually the project root's) is parsed once.
     base_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.join(base_dir, "../../..")
-    load_dotenv(os.path.join(project_root, ".env"))  # Project root .env
-    load_dotenv(os.path.join(base_dir, "../../.env"))  # Also check parent
-    load_dotenv()  # Current directory .env (overrides others)
+    for env_path in dict.fromkeys(
+        os.path.realpath(p)
+        for p in (
+            os.path.join(project_root, ".env"),  # Project root .env
+            os.path.join(base_dir, "../../.env"),  # Also check parent
+            find_dotenv(),
+        )
+        if p and os.path.isfile(p)
+    ):
+        load_dotenv(env_path)
 except ImportError:
     # python-dotenv not available, skip .env loading
     pass
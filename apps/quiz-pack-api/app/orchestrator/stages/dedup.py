@@ -40,6 +40,7 @@ ctx.pack_id`) belongs inside the store's query implementation, not here.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -63,6 +64,9 @@ DEFAULT_IN_BATCH_JACCARD_THRESHOLD = 0.60
 # 0.39/0.46/0.52, noisiest non-dup pair 0.21 → 0.35 keeps a wide margin both
 # ways.
 DEFAULT_FACT_JACCARD_THRESHOLD = 0.35
+# Corpus lookups in flight at once. Each is an embedding round trip plus one
+# pooled Postgres query; kept under the async engine's default pool size.
+COSINE_CHECK_CONCURRENCY = 4
 
 _TOKEN_RE = re.compile(r"[a-z0-9]+")
 
@@ -84,7 +88,9 @@ class AsyncDuplicateFinder(Protocol):
     Deliberately narrower than `quiz_shared.database.question_store.
     QuestionStore`: the stage never reads or writes questions, so requiring
     the full (sync) protocol is what pushed this call onto the blocking
-    `SyncPgvectorStore` bridge in the first place.
+    `SyncPgvectorStore` bridge in the first place. A store may also offer
+    ``find_duplicates_many(texts, threshold)`` (as `PgvectorQuestionStore`
+    does) to check a whole batch in one call; the stage uses it when present.
     """
 
     async def find_duplicates(
@@ -128,8 +134,9 @@ class DedupStage:
         kept_fact_tokens: list[frozenset[str]] = []
         dropped = 0
         fact_dropped = 0
-        for q in ctx.questions:
-            if await self._is_cosine_duplicate(q):
+        cosine_dups = await self._cosine_duplicates(ctx.questions)
+        for q, is_cosine_dup in zip(ctx.questions, cosine_dups):
+            if is_cosine_dup:
                 dropped += 1
                 continue
             if self._is_jaccard_duplicate(q, gold_tokens):
@@ -188,6 +195,36 @@ class DedupStage:
             cost_cents=0,
         )
 
+    async def _cosine_duplicates(self, questions: list[Question]) -> list[bool]:
+        """Corpus-duplicate verdict per question, in order.
+
+        The corpus lookup doesn't depend on what the batch keeps, so it runs
+        up front for the whole batch: one ``find_duplicates_many`` call when
+        the store offers it (one embeddings request, one session), otherwise
+        per-question lookups overlapped up to ``COSINE_CHECK_CONCURRENCY``.
+        """
+        find_many = getattr(self._store, "find_duplicates_many", None)
+        if find_many is not None:
+            try:
+                matches = await find_many(
+                    [q.question for q in questions], threshold=self._cosine_threshold
+                )
+            except Exception:
+                # Same outage semantics as the per-question path.
+                return [False] * len(questions)
+            return [
+                any(match.id != q.id for match, _score in dups)
+                for q, dups in zip(questions, matches)
+            ]
+
+        gate = asyncio.Semaphore(COSINE_CHECK_CONCURRENCY)
+
+        async def _cosine(q: Question) -> bool:
+            async with gate:
+                return await self._is_cosine_duplicate(q)
+
+        return list(await asyncio.gather(*(_cosine(q) for q in questions)))
+
     async def _is_cosine_duplicate(self, question: Question) -> bool:
         try:
             duplicates = await self._store.find_duplicates(
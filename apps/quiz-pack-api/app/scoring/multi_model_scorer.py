@@ -48,6 +48,7 @@ import os
 import re
 from typing import Optional
 
+import orjson
 from langchain_core.messages import HumanMessage
 
 from app import feature_flags
@@ -434,21 +435,37 @@ def _response_text(response) -> str:
     return "\n".join(parts)
 
 
-def _parse_gate_v2_response(
-    text: str,
-    dim_keys: tuple[str, ...] = GATE_V2_DIMENSION_KEYS,
-) -> dict[str, tuple[float, str]]:
-    """{dim_key: (score, reasoning)} for every valid entry; {} on no-parse."""
+def _judge_json(text: str) -> Optional[dict]:
+    """The outermost ``{...}`` of a judge response, parsed; None on no-parse.
+
+    Runs once per judge x dimension x question, so the slice goes to orjson
+    first; the stdlib parser only sees what orjson rejects (NaN and friends).
+    """
     cleaned = text.strip()
     if cleaned.startswith("```"):
         cleaned = cleaned.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
     start = cleaned.find("{")
     end = cleaned.rfind("}") + 1
     if start == -1 or end <= start:
-        return {}
+        return None
+    span = cleaned[start:end]
     try:
-        data = json.loads(cleaned[start:end])
+        return orjson.loads(span)
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        return json.loads(span)
     except json.JSONDecodeError:
+        return None
+
+
+def _parse_gate_v2_response(
+    text: str,
+    dim_keys: tuple[str, ...] = GATE_V2_DIMENSION_KEYS,
+) -> dict[str, tuple[float, str]]:
+    """{dim_key: (score, reasoning)} for every valid entry; {} on no-parse."""
+    data = _judge_json(text)
+    if data is None:
         return {}
     dims = data.get("dimensions")
     if not isinstance(dims, dict):
@@ -489,16 +506,8 @@ def _format_options_block(possible_answers: Optional[dict]) -> str:
 
 def _parse_dim_response(text: str) -> Optional[tuple[float, str]]:
     """Extract (score, reasoning) from a judge response, or None."""
-    cleaned = text.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
-    start = cleaned.find("{")
-    end = cleaned.rfind("}") + 1
-    if start == -1 or end <= start:
-        return None
-    try:
-        data = json.loads(cleaned[start:end])
-    except json.JSONDecodeError:
+    data = _judge_json(text)
+    if data is None:
         return None
     score = data.get("score")
     if not isinstance(score, (int, float)):
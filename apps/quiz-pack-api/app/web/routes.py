@@ -1,7 +1,10 @@
 """Web UI routes for question management."""
 
+import asyncio
 import json
-from typing import Optional
+from typing import List, Optional
+
+import orjson
 from fastapi import APIRouter, Depends, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
@@ -10,20 +13,33 @@ from datetime import datetime
 
 from quiz_shared.models.question import Question
 from ..api.deps import require_admin
-from ..generation.storage import QuestionStorage
+from ..config import get_settings
+from ..generation.storage import get_question_storage
 
 # Setup templates
 current_dir = os.path.dirname(__file__)
 templates_dir = os.path.join(current_dir, "templates")
 templates = Jinja2Templates(directory=templates_dir)
+# Compiled templates stay in the environment's in-memory cache; without
+# auto_reload a render no longer stats the template file first.
+templates.env.auto_reload = get_settings().jinja_auto_reload
 
-# Initialize storage
-storage = QuestionStorage()
+# Initialize storage (shared with the /api/v1 router)
+storage = get_question_storage()
 
 # Create router — every /web route is admin-gated (#65).
 router = APIRouter(prefix="/web", tags=["web"], dependencies=[Depends(require_admin)])
 
 
+async def _status_counts(*statuses: Optional[str]) -> List[int]:
+    """Per-status COUNT(*) in the pending store (``None`` = every row).
+
+    The dashboards used to load up to 2000 full questions and count them in
+    Python, which also undercounted past that cap.
+    """
+    return await asyncio.gather(*(storage.count_pending_shared(s) for s in statuses))
+
+
 @router.get("/", response_class=HTMLResponse)
 async def home(
     request: Request,
@@ -38,7 +54,8 @@ async def home(
         filters["review_status"] = status
 
     # Search questions
-    questions = storage.search_questions(
+    questions = await asyncio.to_thread(
+        storage.search_questions,
         difficulty=difficulty,
         topic=topic,
         filters=filters,
@@ -51,12 +68,14 @@ async def home(
         quality_scores[q.id] = q.calculate_quality_score() if q.quality_ratings else None
 
     # Get stats
-    all_questions = storage.get_all_questions(limit=2000)
+    total, pending, approved, rejected = await _status_counts(
+        None, "pending_review", "approved", "rejected"
+    )
     stats = {
-        "total": len(all_questions),
-        "pending": sum(1 for q in all_questions if q.review_status == "pending_review"),
-        "approved": sum(1 for q in all_questions if q.review_status == "approved"),
-        "rejected": sum(1 for q in all_questions if q.review_status == "rejected"),
+        "total": total,
+        "pending": pending,
+        "approved": approved,
+        "rejected": rejected,
     }
 
     return templates.TemplateResponse("home.html", {
@@ -89,18 +108,15 @@ async def import_questions(
 ):
     """Import questions as pending review (does NOT touch ChromaDB)."""
     try:
-        data = json.loads(json_data)
+        data = orjson.loads(json_data)
 
         if "questions" in data:
             questions_data = data["questions"]
         else:
             questions_data = [data]
 
-        added = 0
-        for q_data in questions_data:
-            question = Question.from_dict(q_data, source=source)
-            if storage.add_pending(question):
-                added += 1
+        questions = [Question.from_dict(q_data, source=source) for q_data in questions_data]
+        added = len(await asyncio.to_thread(storage.add_pending_many, questions))
 
         message = f"Imported {added} questions to pending review."
         if added < len(questions_data):
@@ -132,7 +148,7 @@ async def import_questions(
 @router.get("/review", response_class=HTMLResponse)
 async def review_list(request: Request):
     """Review page - redirect to first pending question."""
-    pending = storage.list_pending(status="pending_review", limit=1)
+    pending = await asyncio.to_thread(storage.list_pending, status="pending_review", limit=1)
 
     if pending:
         return RedirectResponse(url=f"/web/review/{pending[0].id}", status_code=302)
@@ -147,14 +163,14 @@ async def review_list(request: Request):
 @router.get("/review/{question_id}", response_class=HTMLResponse)
 async def review_question(request: Request, question_id: str):
     """Review a specific question."""
-    question = storage.get_question(question_id)
+    question = await asyncio.to_thread(storage.get_question, question_id)
 
     if not question:
         return RedirectResponse(url="/web/review", status_code=302)
 
-    pending = storage.list_pending(status="pending_review", limit=1000)
-    total_pending = len(pending)
-    current_index = next((i + 1 for i, q in enumerate(pending) if q.id == question_id), 1)
+    _, current_index, total_pending = await asyncio.to_thread(
+        storage.get_next_pending, question_id
+    )
 
     return templates.TemplateResponse("review.html", {
         "request": request,
@@ -187,22 +203,11 @@ async def submit_review(
             status_code=410,
         )
 
-    question = storage.get_question(question_id)
+    question = await asyncio.to_thread(storage.get_question, question_id)
 
     if not question:
         return RedirectResponse(url="/web/review", status_code=302)
 
-    # Snapshot the queue BEFORE mutating so the redirect lands on a still-pending row.
-    all_pending = storage.list_pending(status="pending_review", limit=1000)
-
-    next_question = None
-    for i, q in enumerate(all_pending):
-        if q.id == question_id and i + 1 < len(all_pending):
-            next_question = all_pending[i + 1]
-            break
-    if not next_question:
-        next_question = next((q for q in all_pending if q.id != question_id), None)
-
     question.reviewed_by = "admin"  # TODO: Get from auth
     question.reviewed_at = datetime.now()
     question.review_notes = review_notes if review_notes else None
@@ -214,7 +219,7 @@ async def submit_review(
     }
 
     question.review_status = status
-    storage.update_question(question)
+    next_question = await asyncio.to_thread(storage.review_and_next, question)
 
     if next_question:
         return RedirectResponse(url=f"/web/review/{next_question.id}", status_code=303)
@@ -225,22 +230,19 @@ async def submit_review(
 @router.get("/stats", response_class=HTMLResponse)
 async def stats_page(request: Request):
     """Statistics page."""
-    # Get all questions
-    all_questions = storage.get_all_questions(limit=2000)
-
     # Calculate stats
-    pending = sum(1 for q in all_questions if q.review_status == "pending_review")
-    approved = sum(1 for q in all_questions if q.review_status == "approved")
-    rejected = sum(1 for q in all_questions if q.review_status == "rejected")
-    needs_revision = sum(1 for q in all_questions if q.review_status == "needs_revision")
+    total, pending, approved, rejected, needs_revision = await _status_counts(
+        None, "pending_review", "approved", "rejected", "needs_revision"
+    )
 
     # Calculate average quality score for approved questions
-    approved_questions = [q for q in all_questions if q.review_status == "approved"]
-    quality_scores = [q.calculate_quality_score() for q in approved_questions if q.quality_ratings]
-    avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else None
+    avg_quality = (
+        await asyncio.to_thread(storage.average_quality, "approved", approved)
+        if approved else None
+    )
 
     stats = {
-        "total": len(all_questions),
+        "total": total,
         "pending_review": pending,
         "approved": approved,
         "rejected": rejected,
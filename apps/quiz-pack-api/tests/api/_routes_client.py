@@ -0,0 +1,72 @@
+"""Shared wiring for the tests that drive `app.api.routes` (the /api/v1
+review and generation endpoints) without a database.
+
+Each of those modules used to carry its own copy of the question factory and
+the client setup: the module-level `storage` swapped for an in-memory pending
+store, a bare `FastAPI()` with the router included, and settings pinned to a
+known admin key regardless of the developer's .env.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+from quiz_shared.database.pending_store import PendingStore
+from quiz_shared.models.question import Question
+
+from app.api import routes as routes_module
+from app.api.deps import get_settings
+from app.config import Settings
+from app.generation.storage import QuestionStorage
+from app.rate_limit import limiter
+
+ADMIN_KEY = {"X-Admin-Key": "testkey"}
+
+
+def pending_question(
+    qid: str, status: str = "pending_review", ratings: Optional[dict] = None
+) -> Question:
+    return Question(
+        id=qid,
+        question=f"{qid}?",
+        correct_answer="answer",
+        topic="General",
+        category="general",
+        difficulty="medium",
+        review_status=status,
+        quality_ratings=ratings,
+    )
+
+
+@asynccontextmanager
+async def routes_client(
+    monkeypatch: pytest.MonkeyPatch,
+    store: Optional[PendingStore] = None,
+    *,
+    rate_limited: bool = False,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client for a minimal app serving `routes_module.router`.
+
+    `store` replaces the pending store behind the routes' `storage`;
+    `rate_limited` wires the slowapi limiter for the endpoints that use it.
+    """
+    if store is not None:
+        monkeypatch.setattr(routes_module, "storage", QuestionStorage(pending_store=store))
+    app = FastAPI()
+    if rate_limited:
+        limiter.reset()
+        app.state.limiter = limiter
+        app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.include_router(routes_module.router)
+    app.dependency_overrides[get_settings] = lambda: Settings(admin_api_key="testkey")
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
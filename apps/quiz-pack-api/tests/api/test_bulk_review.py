@@ -0,0 +1,105 @@
+"""POST /api/v1/reviews/submit/bulk — several reviews, one pending-store write.
+
+Pins that the batch lands in a single `upsert_many`, that unknown IDs are
+reported rather than failing the batch, that results follow the request order,
+that an ID listed twice is rejected, and that approval stays retired.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+from quiz_shared.database.pending_store import InMemoryPendingStore
+
+from tests.api._routes_client import ADMIN_KEY, pending_question, routes_client
+
+_RATINGS = {"surprise_factor": 3, "clarity": 4, "universal_appeal": 3, "creativity": 2}
+
+
+class _CountingPendingStore(InMemoryPendingStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.upsert_many_calls = 0
+
+    def upsert_many(self, questions):
+        self.upsert_many_calls += 1
+        return super().upsert_many(questions)
+
+    def get_many(self, question_ids):
+        # Storage order, not request order — what a SQL `IN (...)` read returns.
+        wanted = set(question_ids)
+        return {qid: q.model_copy(deep=True) for qid, q in self._items.items() if qid in wanted}
+
+
+def _review(qid: str, status: str = "rejected") -> dict:
+    return {"question_id": qid, "status": status, "quality_ratings": _RATINGS}
+
+
+async def _post(monkeypatch, store: InMemoryPendingStore, body: list) -> httpx.Response:
+    async with routes_client(monkeypatch, store) as client:
+        return await client.post("/api/v1/reviews/submit/bulk", json=body, headers=ADMIN_KEY)
+
+
+async def test_batch_lands_in_one_write(monkeypatch) -> None:
+    store = _CountingPendingStore()
+    store.upsert(pending_question("q_a"))
+    store.upsert(pending_question("q_b"))
+
+    resp = await _post(
+        monkeypatch,
+        store,
+        [_review("q_a"), _review("q_b", "needs_revision"), _review("q_missing")],
+    )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert sorted(body["reviewed"]) == ["q_a", "q_b"]
+    assert body["not_found"] == ["q_missing"]
+    assert store.upsert_many_calls == 1
+    assert store.get("q_a").review_status == "rejected"
+    assert store.get("q_b").review_status == "needs_revision"
+    assert store.get("q_a").reviewed_at == store.get("q_b").reviewed_at
+
+
+async def test_results_follow_request_order(monkeypatch) -> None:
+    store = _CountingPendingStore()
+    for qid in ("q_a", "q_b", "q_c"):
+        store.upsert(pending_question(qid))
+
+    resp = await _post(
+        monkeypatch,
+        store,
+        [_review("q_c"), _review("q_missing"), _review("q_a"), _review("q_gone")],
+    )
+
+    body = resp.json()
+    assert body["reviewed"] == ["q_c", "q_a"]
+    assert body["not_found"] == ["q_missing", "q_gone"]
+
+
+async def test_duplicate_ids_are_rejected_before_any_write(monkeypatch) -> None:
+    store = _CountingPendingStore()
+    store.upsert(pending_question("q_a"))
+    store.upsert(pending_question("q_b"))
+
+    resp = await _post(
+        monkeypatch,
+        store,
+        [_review("q_a"), _review("q_b"), _review("q_a", "needs_revision")],
+    )
+
+    assert resp.status_code == 422
+    assert "q_a" in resp.json()["detail"]
+    assert store.upsert_many_calls == 0
+    assert store.get("q_a").review_status == "pending_review"
+
+
+async def test_approval_in_batch_is_gone(monkeypatch) -> None:
+    store = _CountingPendingStore()
+    store.upsert(pending_question("q_a"))
+
+    resp = await _post(monkeypatch, store, [_review("q_a"), _review("q_a", "approved")])
+
+    assert resp.status_code == 410
+    assert store.upsert_many_calls == 0
+    assert store.get("q_a").review_status == "pending_review"
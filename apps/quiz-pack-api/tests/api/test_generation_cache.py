@@ -0,0 +1,121 @@
+"""Opt-in response reuse on `/generate/advanced` (GENERATION_CACHE_TTL).
+
+A generation endpoint that hands back the same questions is wrong in
+production, so the cache must be OFF unless the env asks for it. When a dev box
+turns it on, a body with the same shape (topic lists compared order- and
+case-blind) must skip the multi-minute pipeline, and any other change must
+still run it. Identical bodies arriving while one is still generating share
+that run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+import pytest_asyncio
+
+from app.api import routes as routes_module
+from tests.api._routes_client import ADMIN_KEY, routes_client
+
+
+@pytest_asyncio.fixture
+async def calls(monkeypatch) -> list[dict]:
+    recorded: list[dict] = []
+
+    async def _fake_generate(**kwargs):
+        recorded.append(kwargs)
+        return []
+
+    monkeypatch.setattr(routes_module.get_advanced_generator(), "generate_questions", _fake_generate)
+    monkeypatch.setattr(routes_module, "_generation_cache", {})
+    monkeypatch.setattr(routes_module, "_generation_inflight", {})
+    return recorded
+
+
+@pytest_asyncio.fixture
+async def client(calls, monkeypatch) -> AsyncIterator[httpx.AsyncClient]:
+    async with routes_client(monkeypatch, rate_limited=True) as ac:
+        yield ac
+
+
+async def _generate(client, body: dict) -> httpx.Response:
+    return await client.post("/api/v1/generate/advanced", json=body, headers=ADMIN_KEY)
+
+
+async def test_cache_is_off_by_default(client, calls, monkeypatch) -> None:
+    monkeypatch.delenv("GENERATION_CACHE_TTL", raising=False)
+
+    await _generate(client, {"count": 3})
+    await _generate(client, {"count": 3})
+
+    assert len(calls) == 2
+
+
+async def test_identical_body_reuses_response_when_enabled(client, calls, monkeypatch) -> None:
+    monkeypatch.setenv("GENERATION_CACHE_TTL", "3600")
+
+    first = await _generate(client, {"count": 3, "topics": ["Space"]})
+    second = await _generate(client, {"topics": ["Space"], "count": 3})
+
+    assert second.json() == first.json()
+    assert len(calls) == 1
+
+
+async def test_changed_body_still_generates(client, calls, monkeypatch) -> None:
+    monkeypatch.setenv("GENERATION_CACHE_TTL", "3600")
+
+    await _generate(client, {"count": 3})
+    await _generate(client, {"count": 4})
+
+    assert len(calls) == 2
+
+
+async def test_excluded_topics_are_deduped_at_the_boundary(client, calls, monkeypatch) -> None:
+    """Repeats and blanks are dropped before they reach the prompt (order kept),
+    so bodies that differ only by them also share a cache entry."""
+    monkeypatch.setenv("GENERATION_CACHE_TTL", "3600")
+
+    await _generate(client, {"count": 3, "excluded_topics": [" Sports", "Music", "sports", ""]})
+    await _generate(client, {"count": 3, "excluded_topics": ["Sports", "Music"]})
+
+    assert len(calls) == 1
+    assert calls[0]["excluded_topics"] == ["Sports", "Music"]
+
+
+async def test_topic_order_and_case_share_an_entry(client, calls, monkeypatch) -> None:
+    monkeypatch.setenv("GENERATION_CACHE_TTL", "3600")
+
+    await _generate(client, {"count": 3, "topics": ["Space", "History"]})
+    await _generate(client, {"count": 3, "topics": ["history", "Space"]})
+    # Category order selects the prompt, so it still keys separately.
+    await _generate(client, {"count": 3, "categories": ["adults", "children"]})
+    await _generate(client, {"count": 3, "categories": ["children", "adults"]})
+
+    assert len(calls) == 3
+
+
+async def test_concurrent_identical_bodies_share_one_run(client, calls, monkeypatch) -> None:
+    monkeypatch.setenv("GENERATION_CACHE_TTL", "3600")
+    release = asyncio.Event()
+
+    async def _slow_generate(**kwargs):
+        calls.append(kwargs)
+        await release.wait()
+        return []
+
+    monkeypatch.setattr(
+        routes_module.get_advanced_generator(), "generate_questions", _slow_generate
+    )
+    pending = [
+        asyncio.create_task(_generate(client, {"count": 3, "topics": t}))
+        for t in (["Space", "History"], ["history", "space"])
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    first, second = await asyncio.gather(*pending)
+
+    assert first.status_code == second.status_code == 200
+    assert len(calls) == 1
+    assert routes_module._generation_inflight == {}
@@ -35,7 +35,7 @@ async def client(monkeypatch) -> AsyncIterator[httpx.AsyncClient]:
     async def _no_llm(**kwargs):
         return []
 
-    monkeypatch.setattr(routes_module.advanced_generator, "generate_questions", _no_llm)
+    monkeypatch.setattr(routes_module.get_advanced_generator(), "generate_questions", _no_llm)
     limiter.reset()  # shared module singleton — clear any prior test's window
 
     app = FastAPI()
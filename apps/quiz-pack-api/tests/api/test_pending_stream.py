@@ -0,0 +1,68 @@
+"""GET /api/v1/reviews/pending/stream — the pending queue as NDJSON.
+
+After a bulk import the queue runs to thousands of rows; the stream pages the
+store and writes rows as they are read instead of materializing the whole
+queue as one JSON document. These pin that it still yields exactly the queue
+(every page, only `pending_review`, honoring limit/offset) in the same row
+shape as `/reviews/pending`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import AsyncIterator
+
+import httpx
+import pytest_asyncio
+
+from quiz_shared.database.pending_store import InMemoryPendingStore
+
+from tests.api._routes_client import ADMIN_KEY, pending_question, routes_client
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch) -> AsyncIterator[httpx.AsyncClient]:
+    store = InMemoryPendingStore()
+    for n in range(250):
+        store.upsert(pending_question(f"q_{n:04d}"))
+    store.upsert(pending_question("q_0999", status="rejected"))
+    async with routes_client(monkeypatch, store) as ac:
+        yield ac
+
+
+async def _lines(client, **params) -> list[dict]:
+    resp = await client.get("/api/v1/reviews/pending/stream", params=params, headers=ADMIN_KEY)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+async def test_stream_yields_every_page_of_the_pending_queue(client) -> None:
+    rows = await _lines(client)
+
+    assert len(rows) == 250  # spans three store pages
+    assert all(r["review_status"] == "pending_review" for r in rows)
+    assert rows[0]["id"] == "q_0000" and rows[0]["correct_answer"] == "answer"
+
+
+async def test_stream_honors_limit_and_offset(client) -> None:
+    rows = await _lines(client, limit=120, offset=10)
+
+    assert [r["id"] for r in rows] == [f"q_{n:04d}" for n in range(10, 130)]
+
+
+async def test_paged_list_matches_stream_rows_and_keeps_its_schema(client) -> None:
+    """`/reviews/pending` skips FastAPI's response re-validation; the body must
+    still be the documented `PendingReviewResponse` shape."""
+    resp = await client.get("/api/v1/reviews/pending", params={"limit": 3}, headers=ADMIN_KEY)
+    assert resp.status_code == 200
+    body = resp.json()
+
+    assert body["total"] == 250
+    assert body["questions"] == await _lines(client, limit=3)
+
+    schema = (await client.get("/openapi.json")).json()
+    ok = schema["paths"]["/api/v1/reviews/pending"]["get"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"]["$ref"].endswith(
+        "/PendingReviewResponse"
+    )
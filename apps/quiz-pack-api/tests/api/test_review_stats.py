@@ -0,0 +1,52 @@
+"""GET /api/v1/reviews/stats — per-status counts + approved quality average.
+
+Counts come from per-status store queries and the average from one pass over
+the rated approved rows only; these pin that the numbers still match what a
+reviewer would count by hand.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from quiz_shared.database.pending_store import InMemoryPendingStore
+from quiz_shared.models.question import Question
+
+from tests.api._routes_client import ADMIN_KEY, pending_question, routes_client
+
+
+async def _stats(monkeypatch, questions: list[Question]) -> dict:
+    store = InMemoryPendingStore()
+    for q in questions:
+        store.upsert(q)
+    async with routes_client(monkeypatch, store) as client:
+        resp = await client.get("/api/v1/reviews/stats", headers=ADMIN_KEY)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+async def test_counts_each_status_and_averages_approved_only(monkeypatch) -> None:
+    stats = await _stats(
+        monkeypatch,
+        [
+            pending_question("p1", "pending_review", {"clarity": 1}),
+            pending_question("p2", "pending_review"),
+            pending_question("r1", "rejected"),
+            pending_question("n1", "needs_revision"),
+            pending_question("a1", "approved", {"clarity": 4, "creativity": 5}),  # 4.5
+            pending_question("a2", "approved", {"clarity": 3}),  # 3.0
+            pending_question("a3", "approved"),  # unrated — excluded from the mean
+        ],
+    )
+
+    assert stats["pending_review"] == 2
+    assert stats["rejected"] == 1
+    assert stats["needs_revision"] == 1
+    assert stats["approved"] == 3
+    assert stats["avg_quality_score"] == pytest.approx(3.75)
+
+
+async def test_no_rated_approved_rows_means_no_average(monkeypatch) -> None:
+    stats = await _stats(monkeypatch, [pending_question("p1", "pending_review", {"clarity": 5})])
+
+    assert stats["avg_quality_score"] is None
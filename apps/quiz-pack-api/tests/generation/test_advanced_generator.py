@@ -26,6 +26,8 @@ Why these scenarios:
 
 from __future__ import annotations
 
+import asyncio
+import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -387,6 +389,33 @@ async def test_open_count_generates_through_open_prompt_with_headline_answer() -
     assert "Open / Logical Branch" in prompt_text
 
 
+@pytest.mark.asyncio
+async def test_open_slice_generates_alongside_closed_slice() -> None:
+    """The open and closed slices are independent LLM calls: both must be in
+    flight together, and the result keeps open-first order."""
+    import asyncio
+
+    both_started = asyncio.Event()
+    started = 0
+
+    async def _fake_batch(*, count, open_shape=False, **_kwargs):
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return _fake_mcq_questions(count, "open" if open_shape else "closed")
+
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen._generate_batch = AsyncMock(side_effect=_fake_batch)
+
+    questions = await gen.generate_questions(
+        count=3, open_count=1, enable_best_of_n=False, categories=["general"]
+    )
+
+    assert [q.id for q in questions] == ["q_open_0", "q_closed_0", "q_closed_1"]
+
+
 @pytest.mark.asyncio
 async def test_open_mechanism_keeps_factual_pipeline() -> None:
     fake_ainvoke = AsyncMock(return_value=_llm_response(_OPEN_MECHANISM_RESPONSE))
@@ -934,6 +963,350 @@ async def test_mcq_critique_telemetry_dormant_when_flag_off(
     assert all(q.generation_metadata.critique_score is None for q in questions)
 
 
+@pytest.mark.asyncio
+async def test_critique_all_runs_judges_concurrently_in_order() -> None:
+    """The critique judge is latency-bound: calls must overlap (capped at the
+    semaphore width), results must come back in input order, and a judge call
+    that raises must read as an unscored None rather than sink the batch."""
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def _judge(q):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if q.id.endswith("_3"):
+            raise RuntimeError("judge exploded")
+        return {"overall_score": float(q.id.rsplit("_", 1)[1])}
+
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen._critique_question = _judge
+    questions = _fake_mcq_questions(12, "alpha")
+
+    critiques = await gen._critique_all(questions)
+
+    assert peak == 8
+    assert critiques[3] is None
+    assert [c["overall_score"] for i, c in enumerate(critiques) if i != 3] == [
+        float(i) for i in range(12) if i != 3
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_split_fans_out_with_disjoint_facts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """GEN_SUB_BATCHES: the count is spread across concurrent calls, each with
+    its own slice of facts; a failed call drops only its share."""
+    monkeypatch.setenv("GEN_SUB_BATCHES", "3")
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    calls = []
+
+    async def fake_batch(*, count, source_facts, check_diversity, **kwargs):
+        calls.append((count, source_facts, check_diversity))
+        if count == 2 and source_facts == ["f5", "f6"]:
+            raise RuntimeError("provider timeout")
+        return _fake_mcq_questions(count, source_facts[0])
+
+    gen._generate_batch = fake_batch
+
+    questions = await gen._generate_split(
+        count=7, source_facts=["f1", "f2", "f3", "f4", "f5", "f6"], difficulty="easy"
+    )
+
+    assert calls == [
+        (3, ["f1", "f2"], False),
+        (2, ["f3", "f4"], False),
+        (2, ["f5", "f6"], False),
+    ]
+    assert len(questions) == 5
+
+
+@pytest.mark.asyncio
+async def test_generate_split_dedupes_and_checks_the_merged_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Sub-batches share a prompt, so a stem repeated across them is kept once
+    and the diversity check sees the merged batch, not each slice."""
+    monkeypatch.setenv("GEN_SUB_BATCHES", "2")
+    gen = _make_generator_with_fake_llm(AsyncMock())
+
+    async def fake_batch(*, count, **kwargs):
+        return _fake_mcq_questions(count, "alpha")
+
+    gen._generate_batch = fake_batch
+    checked = []
+    monkeypatch.setattr(
+        gen, "_check_batch_diversity", lambda qs: checked.append(len(qs))
+    )
+
+    questions = await gen._generate_split(count=4, difficulty="easy")
+
+    assert [q.question for q in questions] == [
+        "Is fact 0 about alpha true?",
+        "Is fact 1 about alpha true?",
+    ]
+    assert checked == [2]
+
+
+@pytest.mark.asyncio
+async def test_generate_split_raises_when_every_sub_batch_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GEN_SUB_BATCHES", "2")
+    gen = _make_generator_with_fake_llm(AsyncMock())
+
+    async def fake_batch(**kwargs):
+        raise RuntimeError("provider timeout")
+
+    gen._generate_batch = fake_batch
+
+    with pytest.raises(RuntimeError, match="provider timeout"):
+        await gen._generate_split(count=4, difficulty="easy")
+
+
+@pytest.mark.asyncio
+async def test_critique_cache_skips_rejudging_unchanged_questions() -> None:
+    """A regeneration pass re-judges the questions it kept: unchanged content
+    must come from the cache, edited content and failed critiques must not."""
+    questions = _fake_mcq_questions(3, "alpha")
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen._critique_question = AsyncMock(
+        side_effect=[{"overall_score": 7.0}, None, {"overall_score": 5.0}]
+    )
+
+    first = await gen._critique_all(questions)
+    assert [c and c["overall_score"] for c in first] == [7.0, None, 5.0]
+
+    gen._critique_question = AsyncMock(return_value={"overall_score": 4.0})
+    questions[2].question = "An edited stem?"
+    second = await gen._critique_all(questions)
+
+    # q0 cached; q1 failed last time so it is retried; q2 changed so re-judged.
+    assert [c["overall_score"] for c in second] == [7.0, 4.0, 4.0]
+    assert gen._critique_question.await_count == 2
+    second[0]["overall_score"] = 0.0  # callers can't corrupt the cached copy
+    assert (await gen._critique_all(questions[:1]))[0]["overall_score"] == 7.0
+
+
+@pytest.mark.asyncio
+async def test_structured_critique_reads_the_tool_call_not_the_prose(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """CRITIQUE_STRUCTURED: the verdict comes from the bound schema; a
+    response with no tool call takes the retry path, never a guessed score."""
+    from app.generation.advanced_generator import CritiqueOutput
+
+    monkeypatch.setenv("CRITIQUE_STRUCTURED", "1")
+    verdict = CritiqueOutput(
+        scores={"clarity": 9, "surprise_factor": 9},
+        overall_score=8.0,
+        verdict="good",
+    )
+    judge = SimpleNamespace(ainvoke=AsyncMock(side_effect=[None, verdict]))
+    bound = []
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen.critique_llm = SimpleNamespace(
+        with_structured_output=lambda schema, **kw: bound.append((schema, kw)) or judge
+    )
+
+    critique = await gen._critique_question(_fake_mcq_questions(1, "alpha")[0])
+
+    assert bound == [(CritiqueOutput, {"method": "function_calling"})]
+    assert judge.ainvoke.await_count == 2
+    # Same post-processing as the free-text path (inflation damping, model stamp).
+    assert critique["overall_score"] == 7.5
+    assert critique["score_normalized"] is True
+    assert critique["critique_model"] == gen.critique_model
+
+    # The schema binding is built once and reused by later critiques.
+    judge.ainvoke = AsyncMock(return_value=verdict)
+    await gen._critique_question(_fake_mcq_questions(2, "beta")[1])
+    judge.ainvoke.assert_awaited_once()
+    assert len(bound) == 1
+
+
+@pytest.mark.asyncio
+async def test_early_exit_stops_critiquing_once_shortlist_clears_threshold() -> None:
+    """CRITIQUE_EARLY_EXIT: waves of ``shortlist`` are judged until that many
+    candidates reach ``min_score``; later waves are never sent to the judge."""
+    questions = _fake_mcq_questions(9, "alpha")
+    scores = iter([8.0, 5.0, 7.5, 9.0, 7.0, 6.0, 9.9, 9.9, 9.9])
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen._critique_question = AsyncMock(
+        side_effect=lambda q: {"overall_score": next(scores)}
+    )
+
+    kept, critiques = await gen._critique_until_shortlisted(questions, 3, 7.0)
+
+    # Wave 1: 8.0, 5.0, 7.5 → 2 passing; wave 2: 9.0, 7.0, 6.0 → 4 ≥ 3, stop.
+    assert [q.id for q in kept] == [q.id for q in questions[:6]]
+    assert len(critiques) == 6
+    assert gen._critique_question.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_batched_critique_scores_k_questions_per_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``CRITIQUE_BATCH_SIZE`` > 1: one judge call scores a whole chunk, the
+    results map back by id in input order, and a question the batch answer
+    drops is re-scored on its own rather than left unscored."""
+    monkeypatch.setenv("CRITIQUE_BATCH_SIZE", "5")
+    questions = _fake_mcq_questions(7, "alpha")
+
+    async def _judge(messages):
+        prompt = messages[0].content
+        ids = [q.id for q in questions if f"id: {q.id}\n" in prompt]
+        critiques = [
+            {"id": qid, "overall_score": float(qid.rsplit("_", 1)[1]), "verdict": "good"}
+            for qid in ids
+            if qid != "q_alpha_2"  # the judge "forgets" one
+        ]
+        return _llm_response(json.dumps({"critiques": critiques}))
+
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen.critique_llm = SimpleNamespace(ainvoke=AsyncMock(side_effect=_judge))
+    gen._critique_question = AsyncMock(return_value={"overall_score": 6.0})
+
+    critiques = await gen._critique_all(questions)
+
+    assert gen.critique_llm.ainvoke.await_count == 2  # ceil(7 / 5)
+    gen._critique_question.assert_awaited_once_with(questions[2])
+    assert [c["overall_score"] for c in critiques] == [0.0, 1.0, 6.0, 3.0, 4.0, 5.0, 6.0]
+    assert critiques[0]["critique_model"] == gen.critique_model
+    assert "id" not in critiques[0]
+
+
+@pytest.mark.asyncio
+async def test_batched_critique_fallback_stays_under_the_concurrency_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed batch call re-scores each question singly; those single
+    critiques share the batch semaphore instead of all firing at once."""
+    monkeypatch.setenv("CRITIQUE_BATCH_SIZE", "10")
+    questions = _fake_mcq_questions(30, "alpha")
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    gen.critique_llm = SimpleNamespace(
+        ainvoke=AsyncMock(side_effect=RuntimeError("judge down"))
+    )
+    running = peak = 0
+
+    async def _single(question):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return {"overall_score": 6.0}
+
+    gen._critique_question = _single
+
+    critiques = await gen._critique_all(questions)
+
+    assert [c["overall_score"] for c in critiques] == [6.0] * 30
+    assert peak <= 8
+
+
+def test_parse_response_skips_repeated_questions() -> None:
+    """The same stem + answer twice in one response is built (and later
+    critiqued) once; a different answer to a similar stem is kept."""
+    gen = _make_generator_with_fake_llm(AsyncMock())
+    content = json.dumps({"questions": [
+        {"question": "Which planet spins backwards?", "correct_answer": "Venus"},
+        {"question": "which planet  spins backwards?", "correct_answer": "venus"},
+        {"question": "Which planet spins backwards?", "correct_answer": "Uranus"},
+    ]})
+
+    questions = gen._parse_response(content)
+
+    assert [q.correct_answer for q in questions] == ["Venus", "Uranus"]
+
+
+def test_drop_repeated_questions_matches_stem_and_answer() -> None:
+    """Across sub-batches the rule is ``_parse_response``'s: stem (whitespace
+    and case folded) plus answer text. A shared generic stem with a different
+    answer — or a different option behind the same MCQ key — is a distinct
+    question and stays."""
+    from quiz_shared.models.question import Question
+
+    def q(qid: str, stem: str, answer: str, options: dict | None = None) -> Question:
+        return Question(
+            id=qid, question=stem, correct_answer=answer, topic="Space",
+            category="general", difficulty="medium",
+            type="text_multichoice" if options else "text",
+            possible_answers=options,
+        )
+
+    kept = AdvancedQuestionGenerator._drop_repeated_questions([
+        q("a", "Which planet spins backwards?", "Venus"),
+        q("b", "which  planet spins BACKWARDS?", "venus"),
+        q("c", "Which planet spins backwards?", "Uranus"),
+        q("d", "Which of these is true?", "a", {"a": "Venus is hot", "b": "Mars is wet"}),
+        q("e", "Which of these is true?", "a", {"a": "Saturn floats", "b": "Pluto is big"}),
+        q("f", "Which of these is true?", "b", {"a": "Pluto is big", "b": "Venus is hot"}),
+    ])
+
+    assert [k.id for k in kept] == ["a", "c", "d", "e"]
+
+
+def test_parse_response_reports_through_module_logger(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Parse failures go to the module logger (silenceable by level), not
+    stdout."""
+    gen = _make_generator_with_fake_llm(AsyncMock())
+
+    with caplog.at_level("WARNING", logger="app.generation.advanced_generator"):
+        assert gen._parse_response("no json here") == []
+
+    assert any("No JSON found in response" in r.message for r in caplog.records)
+
+
+def test_first_json_object_tolerates_prose_and_trailing_blocks() -> None:
+    """Judge/generator output often wraps the JSON in prose; the parse must
+    take the first complete object, not the first-``{``-to-last-``}`` slice."""
+    parse = AdvancedQuestionGenerator._first_json_object
+
+    assert parse('Verdict: {"winner": "A"} (also considered {"winner": "B"})') == {
+        "winner": "A"
+    }
+    assert parse('Set {x} aside. {"overall_score": 6.5}') == {"overall_score": 6.5}
+    assert parse("[1, 2] no object here") is None
+    assert parse("") is None
+    # Whole-text fast path, and the stdlib fallback for what orjson rejects.
+    assert parse('{"questions": [{"q": "\u00e9"}]}') == {"questions": [{"q": "é"}]}
+    nan = parse('{"overall_score": NaN}')["overall_score"]
+    assert nan != nan
+
+
+def test_first_json_object_rejects_truncated_output() -> None:
+    """A response cut off mid-object has no balanced top-level span; the
+    parse must return None rather than one of the object's inner dicts."""
+    parse = AdvancedQuestionGenerator._first_json_object
+
+    assert parse('{"scores": {"clarity": 8}, "overall_sc') is None
+    assert parse('Here you go: {"questions": [{"question": "Q1"}, {"quest') is None
+    # Braces and escaped quotes inside strings don't move the depth count.
+    assert parse('{"q": "a \\"{brace\\" here}", "n": 1} tail') == {
+        "q": 'a "{brace" here}',
+        "n": 1,
+    }
+
+
+def test_strip_markdown_fences_unwraps_a_block_after_prose() -> None:
+    strip = AdvancedQuestionGenerator._strip_markdown_fences
+
+    assert strip('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert strip('Here you go:\n```json\n{"a": 1}\n```\nEnjoy!') == '{"a": 1}'
+    # An unterminated fence is left for the brace scan to judge.
+    assert strip('Here:\n```json\n{"a": 1') == 'Here:\n```json\n{"a": 1'
+
+
 def test_partition_facts_handles_none_and_short_inputs() -> None:
     """#42 task 42.28 — the partition helper degrades gracefully.
 
@@ -1068,3 +1441,26 @@ async def test_generate_batch_second_non_json_failure_propagates() -> None:
 
     # Bounded: exactly one retry, never a loop.
     assert fake_ainvoke.await_count == 2
+
+
+def test_precompiled_critique_template_renders_like_str_format() -> None:
+    """The critique prompt is rendered from pre-parsed segments; the output
+    must be byte-identical to ``str.format`` (including ``{{``/``}}`` escapes
+    in the JSON response example)."""
+    from app.generation.advanced_generator import _critique_prompt
+    from app.generation.prompt_builder import _compile_format, render_template
+
+    fields = dict(
+        question="Q?",
+        correct_answer="A",
+        options_block="(not multiple-choice)",
+        explanation="E",
+        question_type="text",
+        difficulty="easy",
+        topic="T",
+    )
+    template = _critique_prompt()[0]
+    assert render_template(template, **fields) == template.format(**fields)
+
+    with pytest.raises(ValueError):
+        _compile_format("{score:.2f}")
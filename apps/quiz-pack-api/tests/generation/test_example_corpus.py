@@ -304,3 +304,27 @@ def test_load_anti_patterns_keeps_legacy_format_without_fixed_fields(
     assert "FIXED (same fact, done right)" not in rendered
     assert "Why the fix works" not in rendered
     assert "UNSALVAGEABLE" in rendered
+
+
+def test_corpus_is_parsed_once_until_the_file_changes(tmp_path, monkeypatch) -> None:
+    """Per-call example rotation samples the corpus on every LLM call; the
+    JSON must be parsed once, yet an edited corpus must still be picked up."""
+    import os
+
+    path = tmp_path / "anti_patterns.json"
+    bad = {"question": "What is the capital of France?", "answer": "Paris", "why_bad": "rote"}
+    path.write_text(json.dumps([bad]), encoding="utf-8")
+    monkeypatch.setattr(examples, "example_corpus_path", lambda filename: tmp_path / filename)
+    loads = []
+    real_load = examples.json.load
+    monkeypatch.setattr(examples.json, "load", lambda f: loads.append(1) or real_load(f))
+
+    assert "capital of France" in load_anti_patterns(n=1)
+    assert "capital of France" in load_anti_patterns(n=1)
+    assert len(loads) == 1
+
+    path.write_text(json.dumps([{**bad, "question": "Who wrote Hamlet?"}]), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "Who wrote Hamlet?" in load_anti_patterns(n=1)
+    assert len(loads) == 2
@@ -262,6 +262,26 @@ async def test_pairwise_unparseable_verdicts_fall_back_to_absolute_order():
     assert [q.question for q in selected] == ["Q0?", "Q1?"]
 
 
+@pytest.mark.asyncio
+async def test_absolute_order_is_stable_and_unscored_sorts_last():
+    """With no more candidates than ``count`` no duel runs: the result is the
+    absolute order, ties keep generation order, and a failed critique (None)
+    lands behind every scored candidate."""
+    gen = _make_generator()
+    candidates = [
+        (_question(question="Unscored?"), None),
+        (_question(question="Tie first?"), 7.0),
+        (_question(question="Best?"), 9.0),
+        (_question(question="Tie second?"), 7.0),
+    ]
+
+    selected = await gen._select_top_pairwise(candidates, count=4)
+
+    assert [q.question for q in selected] == [
+        "Best?", "Tie first?", "Tie second?", "Unscored?"
+    ]
+
+
 # --- B: gold rating filter + cache breakpoint ---------------------------------
 
 
@@ -338,6 +358,39 @@ def test_cache_breakpoint_now_precedes_the_example_sections(template_name):
     assert breakpoint_index < examples_index < source_facts_index
 
 
+@pytest.mark.parametrize(
+    "template_name",
+    [
+        "question_generation_v2_cot.md",
+        "question_generation_v3_fact_first.md",
+        "question_generation_v4_fact_first.md",
+        "question_generation_v5_free.md",
+        "question_generation_v6_free.md",
+        "question_generation_v6_guarded.md",
+        "question_generation_entertainment.md",
+    ],
+)
+def test_cacheable_prefix_carries_no_per_order_fields(template_name):
+    """The static half is shared across orders only if nothing order-specific
+    (count, topics, avoid list, classification…) renders above the breakpoint.
+    Only the model-keyed process header and the deployment-level flag sections
+    may vary there."""
+    import string
+    from pathlib import Path
+
+    import app.generation.advanced_generator as adv_mod
+
+    prompt_path = (
+        Path(adv_mod.__file__).resolve().parents[2] / "prompts" / template_name
+    )
+    static = prompt_path.read_text(encoding="utf-8").split(CACHE_BREAKPOINT_MARKER)[0]
+    fields = {
+        name for _, name, _, _ in string.Formatter().parse(static) if name is not None
+    }
+
+    assert fields <= {"process_header", "escape_hatch_section", "craft_guards_section"}
+
+
 def test_build_batch_prompt_resamples_examples_on_every_call(monkeypatch):
     """Founder call, 2026-08: per-call example rotation over within-order
     prompt-cache stability. `_build_batch_prompt` must NOT pin one sample and
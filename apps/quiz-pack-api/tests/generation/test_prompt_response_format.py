@@ -86,3 +86,53 @@ def test_entertainment_prompt_renders_absolute_phrasing_rule():
     )
     assert "Absolute phrasing" in rendered
     assert "anchor every dated fact to an explicit year" in rendered
+
+
+@pytest.mark.parametrize(
+    "prompt_file",
+    PROMPTS + ["question_generation.md", "question_generation_open.md"],
+)
+def test_precompiled_render_matches_str_format(prompt_file):
+    """PromptBuilder renders from pre-parsed segments instead of calling
+    ``.format()`` per prompt; the output must stay byte-identical, escaped
+    ``{{``/``}}`` in the JSON examples included."""
+    import string
+
+    from app.generation.prompt_builder import _compile_format, _render_format
+
+    template = (PROMPTS_DIR / prompt_file).read_text(encoding="utf-8")
+    fields = {
+        name: f"<{name}>"
+        for _, name, _, _ in string.Formatter().parse(template)
+        if name is not None
+    }
+    assert _render_format(_compile_format(template), **fields) == template.format(
+        **fields
+    )
+
+
+def test_repeated_list_inputs_render_once():
+    """Repeated topics / avoid-questions only cost prompt tokens; each entry
+    renders once, first occurrence first, and the avoid cap counts distinct
+    questions. Repeats are matched like the request schemas match them:
+    stripped and case-insensitive."""
+    from app.generation.prompt_builder import PromptBuilder
+
+    avoid = ["Q0", "Q0"] + [f"Q{i}" for i in range(1, 12)]
+    prompt = PromptBuilder(
+        str(PROMPTS_DIR / "question_generation_v3_fact_first.md")
+    ).build_prompt(
+        count=10,
+        topics=["Space", "History", "space "],
+        excluded_topics=["Sports", " sports", ""],
+        avoid_questions=avoid,
+        categories=["general"],
+        facts_section="FACT: test fact",
+        excellent_examples="",
+        anti_examples="",
+    )
+
+    assert "**Preferred Topics:** Space, History\n" in prompt
+    assert "**Avoid Topics:** Sports\n" in prompt
+    assert prompt.count("- Q0\n") == 1
+    assert "- Q9\n" in prompt and "- Q10\n" not in prompt
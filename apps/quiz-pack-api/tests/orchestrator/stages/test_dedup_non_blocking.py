@@ -168,3 +168,78 @@ async def test_hung_dedup_store_fails_loud_with_named_stage(monkeypatch) -> None
     assert "dedup" in str(excinfo.value)
     failed = [info for _kind, step, info in sink.events if step == "failed"]
     assert failed and "dedup" in str(failed[0])
+
+
+@pytest.mark.asyncio
+async def test_corpus_lookups_overlap_up_to_the_concurrency_cap(monkeypatch) -> None:
+    """Each question's corpus lookup is independent of what the batch keeps,
+    so they run together (bounded) rather than one round trip after another;
+    the in-batch checks still see the questions in their original order."""
+    from app.orchestrator.stages import dedup as dedup_module
+
+    monkeypatch.setattr(dedup_module, "COSINE_CHECK_CONCURRENCY", 2)
+    in_flight = peak = 0
+
+    class _CountingStore:
+        async def find_duplicates(
+            self, question_text: str, threshold: float = 0.85
+        ) -> list[tuple[Question, float]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+    questions = [
+        _stub_question(0, "What is the capital of France?"),
+        _stub_question(1, "Which river flows through Cairo?"),
+        _stub_question(2, "What is the capital of France?"),
+        _stub_question(3, "How many moons does Mars have?"),
+    ]
+    ctx = _make_ctx(questions)
+
+    result = await DedupStage(_CountingStore(), gold_standard_path=None).run(
+        ctx, _NullSink()
+    )
+
+    assert peak == 2
+    assert [q.id for q in ctx.questions] == ["q_0", "q_1", "q_3"]
+    assert result.info["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_capable_store_is_queried_once_for_the_whole_batch() -> None:
+    """A store offering `find_duplicates_many` gets ONE call for the batch;
+    self-matches are still excluded by id."""
+    seen = _stub_question(99, "Who painted the Mona Lisa?")
+
+    class _BatchStore:
+        def __init__(self) -> None:
+            self.batch_calls: list[list[str]] = []
+
+        async def find_duplicates(self, question_text: str, threshold: float = 0.85):
+            raise AssertionError("per-question lookup used despite batch method")
+
+        async def find_duplicates_many(
+            self, question_texts: list[str], threshold: float = 0.85
+        ) -> list[list[tuple[Question, float]]]:
+            self.batch_calls.append(list(question_texts))
+            return [
+                [(seen, 0.97)] if "Mona Lisa" in text else []
+                for text in question_texts
+            ]
+
+    store = _BatchStore()
+    questions = [
+        _stub_question(0, "Who painted the Mona Lisa?"),
+        _stub_question(1, "Which river flows through Cairo?"),
+        seen,
+    ]
+    ctx = _make_ctx(questions)
+
+    result = await DedupStage(store, gold_standard_path=None).run(ctx, _NullSink())
+
+    assert len(store.batch_calls) == 1
+    assert [q.id for q in ctx.questions] == ["q_1", "q_99"]
+    assert result.info["dropped"] == 1
@@ -378,6 +378,21 @@ def test_parse_gate_v2_response_respects_dim_subset() -> None:
     assert set(parsed) == {"clever_framing", "answerability"}
 
 
+def test_judge_json_handles_fences_prose_and_nan() -> None:
+    """One extraction for every judge parser: fenced, prose-wrapped and
+    orjson-rejected (NaN) payloads all parse; no object → None."""
+    from app.scoring.multi_model_scorer import _judge_json, _parse_dim_response
+
+    assert _judge_json('```json\n{"score": 8, "reasoning": "ok"}\n```') == {
+        "score": 8,
+        "reasoning": "ok",
+    }
+    assert _judge_json('Verdict: {"score": 7} done')["score"] == 7
+    assert _judge_json('{"score": NaN}')["score"] != _judge_json('{"score": NaN}')["score"]
+    assert _judge_json("no json") is None
+    assert _parse_dim_response("{broken") is None
+
+
 def test_response_text_extracts_bedrock_content_blocks() -> None:
     """Bedrock Converse reasoning judges (R1/gpt-oss) return typed blocks;
     chain-of-thought must not reach the JSON parser — only text blocks do."""
@@ -43,6 +43,11 @@ def test_dormant_flags_stay_off_by_default(monkeypatch: pytest.MonkeyPatch) -> N
         "VETO_SHADOW",
         "EXPIRY_CLASSIFICATION",
         "MCQ_CRITIQUE_TELEMETRY",
+        "CRITIQUE_BATCH_SIZE",
+        "GEN_SUB_BATCHES",
+        "CRITIQUE_EARLY_EXIT",
+        "CRITIQUE_STRUCTURED",
+        "GENERATION_CACHE_TTL",
     ):
         monkeypatch.delenv(var, raising=False)
 
@@ -51,6 +56,11 @@ def test_dormant_flags_stay_off_by_default(monkeypatch: pytest.MonkeyPatch) -> N
     assert feature_flags.veto_shadow() is False
     assert feature_flags.expiry_classification() is False
     assert feature_flags.mcq_critique_telemetry() is False
+    assert feature_flags.critique_batch_size() == 1
+    assert feature_flags.gen_sub_batches() == 1
+    assert feature_flags.critique_early_exit() is False
+    assert feature_flags.critique_structured() is False
+    assert feature_flags.generation_cache_ttl() == 0
 
 
 def test_quality_safeguards_default_on(monkeypatch: pytest.MonkeyPatch) -> None:
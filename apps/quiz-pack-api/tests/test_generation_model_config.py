@@ -57,3 +57,18 @@ def test_critique_model_override_reaches_generator(
 
     assert gen.generation_model == llm_factory.GEN  # untouched fallback
     assert gen.critique_model == "claude-haiku-4-5"
+
+
+def test_generators_share_chat_clients_per_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The API, worker and scripts each build a generator; same role models
+    must reuse one client rather than each opening its own pool."""
+    monkeypatch.delenv("GENERATION_MODEL", raising=False)
+    monkeypatch.delenv("CRITIQUE_MODEL", raising=False)
+
+    a, b = _build_advanced_generator(), _build_advanced_generator()
+
+    assert a.generation_llm is b.generation_llm
+    assert a.critique_llm is b.critique_llm
+    assert a.critique_template is b.critique_template
+    # Prompt templates are read once per file, not once per generator.
+    assert a.prompt_builder.template is b.prompt_builder.template
@@ -208,6 +208,17 @@ def test_openai_client_timeout_is_overridable(monkeypatch):
     assert client.timeout.read == 300.0
 
 
+def test_openai_clients_can_share_one_connection_pool(monkeypatch):
+    """A caller-owned pool is reused as-is; the bounded timeout still applies."""
+    import httpx
+
+    pool = httpx.AsyncClient()
+    first = factory.openai_client(async_=True, http_client=pool)
+    second = factory.openai_client(async_=True, http_client=pool)
+    assert first._client is pool and second._client is pool
+    assert first.timeout == factory.DEFAULT_TIMEOUT
+
+
 def test_chat_openai_defaults_to_generation_timeout(monkeypatch):
     """#139: LangChain's own default is an explicit ``timeout=None``, which
     disables httpx timeouts entirely — a stalled generation/critique/scoring
@@ -10,12 +10,14 @@ Uses `InMemoryPendingStore` so the test stays hermetic — no on-disk state.
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from quiz_shared.database.pending_store import InMemoryPendingStore
+from quiz_shared.database.pending_store import InMemoryPendingStore, SQLitePendingStore
 from quiz_shared.models.question import Question
 
-from app.generation.storage import QuestionStorage
+from app.generation.storage import QuestionStorage, new_pending_ids
 
 
 def _make_question(qid: str = "q_001", **overrides) -> Question:
@@ -111,3 +113,156 @@ def test_get_all_returns_every_pending_status(storage: QuestionStorage):
 
     ids = {q.id for q in storage.get_all_questions()}
     assert ids == {"p1", "r1"}
+
+
+def test_count_pending_counts_each_status(storage: QuestionStorage):
+    """`/reviews/stats` counts per status in the store rather than scanning
+    every row in Python — each status count must be exact on its own."""
+    storage.pending.upsert(_make_question(qid="p1", review_status="pending_review"))
+    storage.pending.upsert(_make_question(qid="p2", review_status="pending_review"))
+    storage.pending.upsert(_make_question(qid="r1", review_status="rejected"))
+
+    assert storage.count_pending("pending_review") == 2
+    assert storage.count_pending("rejected") == 1
+    assert storage.count_pending("needs_revision") == 0
+    assert storage.count_pending(None) == 3
+
+
+def test_update_questions_bulk_writes_whole_batch(tmp_path):
+    """Bulk review writes every row in one SQLite transaction — existing rows
+    are updated, unseen ones inserted, and a batch read returns only known IDs."""
+    storage = QuestionStorage(
+        pending_store=SQLitePendingStore(f"sqlite:///{tmp_path}/pending.db")
+    )
+    storage.add_pending(_make_question(qid="q_a"))
+    storage.add_pending(_make_question(qid="q_b"))
+    found = storage.get_questions(["q_a", "q_b", "q_missing"])
+    assert sorted(found) == ["q_a", "q_b"]
+
+    for q in found.values():
+        q.review_status = "rejected"
+    fresh = _make_question(qid="q_c", review_status="needs_revision")
+    assert storage.update_questions_bulk([*found.values(), fresh]) is True
+
+    assert storage.count_pending("rejected") == 2
+    assert storage.count_pending("needs_revision") == 1
+    assert storage.count_pending("pending_review") == 0
+
+
+class _CountingPendingStore(InMemoryPendingStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.list_calls = 0
+
+    def list(self, status=None, limit=100, offset=0):
+        self.list_calls += 1
+        return super().list(status=status, limit=limit, offset=offset)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_pending_reads_share_one_query():
+    """A polling dashboard hits the pending list from several tabs at once —
+    identical in-flight reads must collapse into one store query."""
+    store = _CountingPendingStore()
+    store.upsert(_make_question(qid="p1"))
+    storage = QuestionStorage(pending_store=store)
+
+    results = await asyncio.gather(
+        *(storage.list_pending_shared(limit=10) for _ in range(5))
+    )
+
+    assert all([q.id for q in r] == ["p1"] for r in results)
+    assert store.list_calls == 1
+
+    # Once settled, the next read goes back to the store (no stale cache).
+    await storage.list_pending_shared(limit=10)
+    assert store.list_calls == 2
+
+
+def test_new_pending_ids_are_distinct_q_ids():
+    ids = new_pending_ids(500)
+    assert len(set(ids)) == 500
+    assert all(i.startswith("q_") and len(i) == 14 for i in ids)
+
+
+def test_web_dashboard_counts_come_from_the_store(storage, monkeypatch) -> None:
+    """The /web home and stats pages count per status in the store instead of
+    loading (at most 2000) full rows to count in Python."""
+    from app.web import routes as web_routes
+
+    for i, status in enumerate(["pending_review", "pending_review", "rejected"]):
+        storage.add_pending(_make_question(f"q_{i:03d}", review_status=status))
+    monkeypatch.setattr(web_routes, "storage", storage)
+
+    counts = asyncio.run(web_routes._status_counts(None, "pending_review", "rejected"))
+
+    assert counts == [3, 2, 1]
+
+
+def test_get_next_pending_reads_neighbours_not_the_queue(storage) -> None:
+    """Review pages get (next, 1-based index, total) without listing the
+    queue; the next question wraps to the head and is never the current one."""
+    from datetime import datetime, timedelta
+
+    start = datetime(2026, 1, 1)
+    for i in range(3):
+        storage.add_pending(
+            _make_question(f"q_{i:03d}", created_at=start + timedelta(minutes=i))
+        )
+
+    nxt, index, total = storage.get_next_pending("q_001")
+    assert (nxt.id, index, total) == ("q_002", 2, 3)
+    nxt, index, _ = storage.get_next_pending("q_002")
+    assert (nxt.id, index) == ("q_000", 3)
+    nxt, index, _ = storage.get_next_pending("unknown")
+    assert (nxt.id, index) == ("q_000", 1)
+
+
+def test_review_and_next_saves_then_reads_the_next_queued(storage) -> None:
+    """Submitting a review writes the question and returns the row after it,
+    wrapping to the head; the reviewed question itself is never returned."""
+    from datetime import datetime, timedelta
+
+    start = datetime(2026, 1, 1)
+    for i in range(3):
+        storage.add_pending(
+            _make_question(f"q_{i:03d}", created_at=start + timedelta(minutes=i))
+        )
+
+    reviewed = storage.get_question("q_001")
+    reviewed.review_status = "rejected"
+    assert storage.review_and_next(reviewed).id == "q_002"
+    assert storage.get_question("q_001").review_status == "rejected"
+
+    last = storage.get_question("q_002")
+    last.review_status = "needs_revision"
+    assert storage.review_and_next(last).id == "q_000"
+
+    only = storage.get_question("q_000")
+    only.review_status = "rejected"
+    assert storage.review_and_next(only) is None
+
+
+def test_add_pending_many_writes_one_batch(storage) -> None:
+    """An import is one upsert_many transaction, with temp ids replaced and
+    statuses normalized exactly as add_pending does per row."""
+    batches: list[list[str]] = []
+    upsert_many = storage.pending.upsert_many
+
+    def _record(questions):
+        questions = list(questions)
+        batches.append([q.id for q in questions])
+        return upsert_many(questions)
+
+    storage.pending.upsert_many = _record
+    storage.pending.upsert = lambda q: pytest.fail("per-row write")
+    questions = [
+        Question.from_dict({"question": "Q1?", "correct_answer": "A"}),
+        _make_question("q_keep", review_status="approved"),
+    ]
+
+    ids = storage.add_pending_many(questions)
+
+    assert len(batches) == 1 and batches[0] == ids
+    assert ids[0].startswith("q_") and ids[1] == "q_keep"
+    assert storage.get_question("q_keep").review_status == "pending_review"
@@ -7,6 +7,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'packages/shared'))
 
 from quiz_shared.database.chroma_client import ChromaDBClient
 
+# Chunk writes so a large collection never goes out as one giant RPC
+UPDATE_BATCH_SIZE = 1000
+
 def main():
     print("=" * 60)
     print("Approving Quiz-Agent Database Questions")
@@ -15,41 +18,36 @@ def main():
     db_path = "./apps/quiz-agent/data/chromadb"
     client = ChromaDBClient(persist_directory=db_path)
 
-    # Get all questions
-    all_questions = client.collection.get()
+    # Only ids are needed — skip fetching documents/metadatas entirely
+    all_ids = client.collection.get(include=[])['ids']
 
-    if not all_questions or not all_questions['ids']:
+    if not all_ids:
         print("\n⚠️  No questions found in database!")
         return
 
-    total = len(all_questions['ids'])
+    total = len(all_ids)
     print(f"\nFound {total} questions")
 
-    # Update review status to 'approved' for all questions
+    # Update review status to 'approved' for all questions. Chroma merges
+    # metadata keys on update, so only review_status needs to be sent.
     print("\nApproving questions...")
 
-    updated_metadatas = []
-    for metadata in all_questions['metadatas']:
-        # Create a copy and update review_status
-        updated_meta = metadata.copy()
-        updated_meta['review_status'] = 'approved'
-        updated_metadatas.append(updated_meta)
-
-    # Update all questions at once
-    client.collection.update(
-        ids=all_questions['ids'],
-        metadatas=updated_metadatas
-    )
+    for start in range(0, total, UPDATE_BATCH_SIZE):
+        batch_ids = all_ids[start:start + UPDATE_BATCH_SIZE]
+        client.collection.update(
+            ids=batch_ids,
+            metadatas=[{'review_status': 'approved'} for _ in batch_ids]
+        )
 
     print(f"✓ Approved all {total} questions!")
 
     # Verify
-    updated_questions = client.collection.get()
-    approved_count = sum(1 for meta in updated_questions['metadatas']
-                        if meta.get('review_status') == 'approved')
+    approved_count = len(client.collection.get(
+        where={'review_status': 'approved'}, include=[]
+    )['ids'])
 
     print(f"\nVerification:")
-    print(f"  Total questions: {len(updated_questions['ids'])}")
+    print(f"  Total questions: {client.collection.count()}")
     print(f"  Approved: {approved_count}")
 
     if approved_count == total:
@@ -15,9 +15,9 @@ from __future__ import annotations
 import logging
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, Iterable, List, Optional, Protocol
 
-from sqlalchemy import Column, DateTime, String, Text, create_engine
+from sqlalchemy import Column, DateTime, String, Text, and_, create_engine, or_
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from ..models.question import Question
@@ -33,11 +33,15 @@ class PendingStore(Protocol):
     - Keeping `add` and `upsert` distinct: `add` errors on existing ID,
       `upsert` always writes
     - Filtering by `review_status` in `list`/`count`
+    - One queue order everywhere — oldest first, id breaking ties — so
+      `rank`/`list_after` agree with `list` without loading the queue
     """
 
     def add(self, question: Question) -> bool: ...
     def upsert(self, question: Question) -> bool: ...
+    def upsert_many(self, questions: Iterable[Question]) -> bool: ...
     def get(self, question_id: str) -> Optional[Question]: ...
+    def get_many(self, question_ids: Iterable[str]) -> Dict[str, Question]: ...
     def delete(self, question_id: str) -> bool: ...
     def list(
         self,
@@ -46,6 +50,10 @@ class PendingStore(Protocol):
         offset: int = 0,
     ) -> List[Question]: ...
     def count(self, status: Optional[str] = None) -> int: ...
+    def rank(self, question_id: str, status: Optional[str] = None) -> Optional[int]: ...
+    def list_after(
+        self, question_id: str, status: Optional[str] = None, limit: int = 1
+    ) -> List[Question]: ...
 
 
 # ── SQLite adapter ─────────────────────────────────────────────────────────
@@ -152,6 +160,53 @@ class SQLitePendingStore:
         finally:
             session.close()
 
+    def upsert_many(self, questions: Iterable[Question]) -> bool:
+        """Upsert a batch in ONE transaction — all rows land or none do.
+
+        A bulk review used to pay a session + commit (an fsync) per question.
+        """
+        questions = list(questions)
+        if not questions:
+            return True
+        session = self._session()
+        try:
+            now = datetime.now()
+            existing = {
+                row.id: row
+                for row in session.query(_PendingQuestionDB).filter(
+                    _PendingQuestionDB.id.in_([q.id for q in questions])
+                )
+            }
+            for question in questions:
+                row = existing.get(question.id)
+                if row is not None:
+                    row.data_json = question.model_dump_json()
+                    row.review_status = question.review_status
+                    row.updated_at = now
+                else:
+                    row = _PendingQuestionDB(
+                        id=question.id,
+                        data_json=question.model_dump_json(),
+                        review_status=question.review_status,
+                        created_at=question.created_at or now,
+                        updated_at=now,
+                    )
+                    session.add(row)
+                    existing[question.id] = row
+            session.commit()
+            return True
+        except Exception as e:
+            logger.error(
+                "Error bulk-upserting %d pending questions: %s",
+                len(questions),
+                e,
+                exc_info=True,
+            )
+            session.rollback()
+            return False
+        finally:
+            session.close()
+
     def delete(self, question_id: str) -> bool:
         session = self._session()
         try:
@@ -183,6 +238,26 @@ class SQLitePendingStore:
         finally:
             session.close()
 
+    def get_many(self, question_ids: Iterable[str]) -> Dict[str, Question]:
+        """Fetch several rows in one ``WHERE id IN (...)`` query; unknown ids
+        are simply absent from the result."""
+        ids = list(question_ids)
+        if not ids:
+            return {}
+        session = self._session()
+        try:
+            rows = (
+                session.query(_PendingQuestionDB)
+                .filter(_PendingQuestionDB.id.in_(ids))
+                .all()
+            )
+            return {r.id: Question.model_validate_json(r.data_json) for r in rows}
+        except Exception as e:
+            logger.error("Error getting %d pending questions: %s", len(ids), e)
+            return {}
+        finally:
+            session.close()
+
     def list(
         self,
         status: Optional[str] = None,
@@ -195,7 +270,9 @@ class SQLitePendingStore:
             if status is not None:
                 query = query.filter(_PendingQuestionDB.review_status == status)
             rows = (
-                query.order_by(_PendingQuestionDB.created_at.asc())
+                query.order_by(
+                    _PendingQuestionDB.created_at.asc(), _PendingQuestionDB.id.asc()
+                )
                 .offset(offset)
                 .limit(limit)
                 .all()
@@ -220,6 +297,64 @@ class SQLitePendingStore:
         finally:
             session.close()
 
+    def rank(self, question_id: str, status: Optional[str] = None) -> Optional[int]:
+        """0-based position of ``question_id`` in ``list(status)`` order, or
+        None when it isn't in that queue. One COUNT, no rows loaded."""
+        session = self._session()
+        try:
+            row = session.get(_PendingQuestionDB, question_id)
+            if row is None or (status is not None and row.review_status != status):
+                return None
+            query = session.query(_PendingQuestionDB).filter(_before(row))
+            if status is not None:
+                query = query.filter(_PendingQuestionDB.review_status == status)
+            return query.count()
+        except Exception as e:
+            logger.error("Error ranking pending question %s: %s", question_id, e)
+            return None
+        finally:
+            session.close()
+
+    def list_after(
+        self, question_id: str, status: Optional[str] = None, limit: int = 1
+    ) -> List[Question]:
+        """Up to ``limit`` questions following ``question_id`` in ``list(status)``
+        order; empty when it is last or unknown."""
+        session = self._session()
+        try:
+            row = session.get(_PendingQuestionDB, question_id)
+            if row is None:
+                return []
+            query = session.query(_PendingQuestionDB).filter(
+                ~_before(row), _PendingQuestionDB.id != row.id
+            )
+            if status is not None:
+                query = query.filter(_PendingQuestionDB.review_status == status)
+            rows = (
+                query.order_by(
+                    _PendingQuestionDB.created_at.asc(), _PendingQuestionDB.id.asc()
+                )
+                .limit(limit)
+                .all()
+            )
+            return [Question.model_validate_json(r.data_json) for r in rows]
+        except Exception as e:
+            logger.error("Error listing after pending question %s: %s", question_id, e)
+            return []
+        finally:
+            session.close()
+
+
+def _before(row: _PendingQuestionDB):
+    """Rows ahead of ``row`` in queue order (created_at, then id)."""
+    return or_(
+        _PendingQuestionDB.created_at < row.created_at,
+        and_(
+            _PendingQuestionDB.created_at == row.created_at,
+            _PendingQuestionDB.id < row.id,
+        ),
+    )
+
 
 # ── In-memory adapter (tests) ──────────────────────────────────────────────
 
@@ -241,10 +376,22 @@ class InMemoryPendingStore:
         self._items[question.id] = question.model_copy(deep=True)
         return True
 
+    def upsert_many(self, questions: Iterable[Question]) -> bool:
+        for question in questions:
+            self._items[question.id] = question.model_copy(deep=True)
+        return True
+
     def get(self, question_id: str) -> Optional[Question]:
         item = self._items.get(question_id)
         return item.model_copy(deep=True) if item else None
 
+    def get_many(self, question_ids: Iterable[str]) -> Dict[str, Question]:
+        return {
+            qid: self._items[qid].model_copy(deep=True)
+            for qid in question_ids
+            if qid in self._items
+        }
+
     def delete(self, question_id: str) -> bool:
         return self._items.pop(question_id, None) is not None
 
@@ -254,11 +401,7 @@ class InMemoryPendingStore:
         limit: int = 100,
         offset: int = 0,
     ) -> List[Question]:
-        items = list(self._items.values())
-        if status is not None:
-            items = [q for q in items if q.review_status == status]
-        items.sort(key=lambda q: q.created_at)
-        sliced = items[offset : offset + limit]
+        sliced = self._queue(status)[offset : offset + limit]
         return [q.model_copy(deep=True) for q in sliced]
 
     def count(self, status: Optional[str] = None) -> int:
@@ -266,6 +409,27 @@ class InMemoryPendingStore:
             return len(self._items)
         return sum(1 for q in self._items.values() if q.review_status == status)
 
+    def rank(self, question_id: str, status: Optional[str] = None) -> Optional[int]:
+        ids = [q.id for q in self._queue(status)]
+        return ids.index(question_id) if question_id in ids else None
+
+    def list_after(
+        self, question_id: str, status: Optional[str] = None, limit: int = 1
+    ) -> List[Question]:
+        current = self._items.get(question_id)
+        if current is None:
+            return []
+        key = (current.created_at, current.id)
+        following = [q for q in self._queue(status) if (q.created_at, q.id) > key]
+        return [q.model_copy(deep=True) for q in following[:limit]]
+
+    def _queue(self, status: Optional[str]) -> List[Question]:
+        items = [
+            q for q in self._items.values() if status is None or q.review_status == status
+        ]
+        items.sort(key=lambda q: (q.created_at, q.id))
+        return items
+
 
 __all__ = [
     "PendingStore",
@@ -23,6 +23,7 @@ Design notes
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 import uuid
@@ -42,6 +43,7 @@ from sqlalchemy import (
     delete,
     func,
     select,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -49,7 +51,7 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ..models.question import GenerationProvenance, Question
-from ..utils.embeddings import generate_embedding_async
+from ..utils.embeddings import generate_embedding_async, generate_embeddings_async
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +69,13 @@ Embedder = Callable[[str], Union[List[float], Awaitable[List[float]]]]
 # covers the admin/write callers sharing this engine.
 DEFAULT_STATEMENT_TIMEOUT_MS = 5_000
 
+# The embedding index is ivfflat with ``lists = 100`` (alembic 1c5e0fa7b3d4).
+# At the default ``ivfflat.probes = 1`` a query scans ONE list — ~1% of the
+# corpus — so a true near-duplicate in another list is silently missed. A
+# dedup verdict must be exact: probing every list makes the index scan visit
+# every row (a flat scan), which is cheap at this corpus size.
+_EXACT_IVFFLAT_PROBES = 100
+
 # Minimal mirror of the `questions` table managed by quiz-pack-api alembic.
 # Only the columns the voice-quiz read path needs are declared; INSERTs
 # rely on Postgres defaults / nullable columns for everything else.
@@ -235,6 +244,28 @@ class PgvectorQuestionStore:
             row = result.mappings().first()
             return _row_to_question(row) if row else None
 
+    async def get_many(self, question_ids: List[str]) -> Dict[str, Question]:
+        """Fetch several questions in one ``WHERE id IN (...)`` round trip.
+
+        Keyed by the caller's ID string; unknown or non-UUID IDs are simply
+        absent from the result (same contract as ``get`` returning None).
+        """
+        wanted: Dict[uuid.UUID, str] = {}
+        for question_id in question_ids:
+            qid = _coerce_uuid(question_id)
+            if qid is not None:
+                wanted.setdefault(qid, question_id)
+        if not wanted:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(questions_table).where(questions_table.c.id.in_(list(wanted)))
+            )
+            return {
+                wanted[row["id"]]: _row_to_question(row)
+                for row in result.mappings().all()
+            }
+
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         stmt = select(func.count()).select_from(questions_table)
         for clause in _build_where(filters or {}):
@@ -243,6 +274,23 @@ class PgvectorQuestionStore:
             result = await session.execute(stmt)
             return int(result.scalar_one())
 
+    async def count_by(self, columns: List[str]) -> Dict[str, Dict[str, int]]:
+        """Row counts per distinct value of each of ``columns``.
+
+        One ``GROUP BY`` per column in a single session — the stats endpoint
+        needs only these tallies, not every row (and its embedding) decoded
+        into a ``Question``.
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        async with self._session_factory() as session:
+            for name in columns:
+                col = questions_table.c[name]
+                result = await session.execute(
+                    select(col, func.count()).group_by(col)
+                )
+                counts[name] = {str(value): int(n) for value, n in result.all()}
+        return counts
+
     async def get_all(self, limit: int = 1000) -> List[Question]:
         async with self._session_factory() as session:
             result = await session.execute(select(questions_table).limit(limit))
@@ -297,22 +345,56 @@ class PgvectorQuestionStore:
 
         Mirrors ``search``'s ``cosine_distance`` ordering but also selects the
         distance so the similarity (``1 - distance``) can be recovered for the
-        ``(Question, score)`` tuples ``DedupStage`` expects. Self-matches are
+        ``(Question, score)`` tuples ``DedupStage`` expects. The scan is exact
+        (every ivfflat list probed) — an approximate miss here is a duplicate
+        shipped to a paying customer. Self-matches are
         **not** filtered here — the text-only signature carries no id — so a
         question already in the store is returned; ``DedupStage`` excludes the
         self-match by id, keeping a re-run idempotent.
         """
         query_embedding = await self._embed(question_text)
-        distance = questions_table.c.embedding.cosine_distance(query_embedding)
         async with self._session_factory() as session:
-            stmt = (
-                select(questions_table, distance.label("distance"))
-                .where(questions_table.c.embedding.is_not(None))
-                .order_by(distance)
-                .limit(10)
+            # Transaction-scoped: the pooled connection keeps default probes
+            # for the (recall-tolerant) serve-path search.
+            await session.execute(
+                text(f"SET LOCAL ivfflat.probes = {_EXACT_IVFFLAT_PROBES}")
             )
-            result = await session.execute(stmt)
-            rows = result.mappings().all()
+            return await self._nearest_above(session, query_embedding, threshold)
+
+    async def find_duplicates_many(
+        self, question_texts: List[str], threshold: float = 0.85
+    ) -> List[List[Tuple[Question, float]]]:
+        """Batch ``find_duplicates``: one result list per text, in order.
+
+        A generated batch is checked with ONE embeddings request and one
+        session (one exact-probes ``SET LOCAL``) instead of a round trip of
+        each per question. Same exact scan and self-match semantics.
+        """
+        if not question_texts:
+            return []
+        embeddings = await self._embed_many(question_texts)
+        async with self._session_factory() as session:
+            await session.execute(
+                text(f"SET LOCAL ivfflat.probes = {_EXACT_IVFFLAT_PROBES}")
+            )
+            return [
+                await self._nearest_above(session, embedding, threshold)
+                for embedding in embeddings
+            ]
+
+    async def _nearest_above(
+        self, session: AsyncSession, embedding: List[float], threshold: float
+    ) -> List[Tuple[Question, float]]:
+        """Top-10 nearest rows to ``embedding`` with similarity >= threshold."""
+        distance = questions_table.c.embedding.cosine_distance(embedding)
+        stmt = (
+            select(questions_table, distance.label("distance"))
+            .where(questions_table.c.embedding.is_not(None))
+            .order_by(distance)
+            .limit(10)
+        )
+        result = await session.execute(stmt)
+        rows = result.mappings().all()
 
         duplicates: List[Tuple[Question, float]] = []
         for row in rows:
@@ -330,6 +412,13 @@ class PgvectorQuestionStore:
             return await result
         return result
 
+    async def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed ``texts`` in order — one batched request for the default
+        gateway embedder, otherwise the configured embedder per text."""
+        if self._embedder is generate_embedding_async:
+            return await generate_embeddings_async(texts)
+        return list(await asyncio.gather(*(self._embed(t) for t in texts)))
+
     async def _embedding_for(self, question: Question) -> Optional[List[float]]:
         if question.embedding is not None:
             return list(question.embedding)
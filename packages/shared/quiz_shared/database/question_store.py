@@ -27,6 +27,7 @@ class QuestionStore(Protocol):
     def add(self, question: Question) -> bool: ...
     def upsert(self, question: Question) -> bool: ...
     def get(self, question_id: str) -> Optional[Question]: ...
+    def get_many(self, question_ids: List[str]) -> Dict[str, Question]: ...
     def delete(self, question_id: str) -> bool: ...
     def search(
         self,
@@ -36,6 +37,7 @@ class QuestionStore(Protocol):
         excluded_ids: Optional[List[str]] = None,
     ) -> List[Question]: ...
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int: ...
+    def count_by(self, columns: List[str]) -> Dict[str, Dict[str, int]]: ...
     def get_all(self, limit: int = 1000) -> List[Question]: ...
     def find_duplicates(
         self, question_text: str, threshold: float = 0.85
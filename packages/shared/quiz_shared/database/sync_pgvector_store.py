@@ -90,8 +90,8 @@ class SyncPgvectorStore:
     """Sync facade over `PgvectorQuestionStore`.
 
     Exposes the read-path methods `QuestionRetriever` uses (`get`, `count`,
-    `search`), `find_duplicates`, and the write surface
-    (`add`, `upsert`, `delete`) plus `get_all` for the admin/feedback callers
+    `search`), `get_many`, `find_duplicates`, and the write surface
+    (`add`, `upsert`, `delete`) plus `get_all`/`count_by` for the admin/feedback callers
     that #41 moves off ChromaDB (D3).
     """
 
@@ -119,6 +119,9 @@ class SyncPgvectorStore:
     def get(self, question_id: str) -> Optional[Question]:
         return self._run(self._async.get(question_id))
 
+    def get_many(self, question_ids: List[str]) -> Dict[str, Question]:
+        return self._run(self._async.get_many(question_ids))
+
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         return self._run(self._async.count(filters=filters))
 
@@ -138,6 +141,9 @@ class SyncPgvectorStore:
             )
         )
 
+    def count_by(self, columns: List[str]) -> Dict[str, Dict[str, int]]:
+        return self._run(self._async.count_by(columns))
+
     def get_all(self, limit: int = 1000) -> List[Question]:
         return self._run(self._async.get_all(limit=limit))
 
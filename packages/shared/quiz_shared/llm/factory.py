@@ -293,6 +293,7 @@ def openai_client(
     async_: bool = False,
     direct: bool = False,
     timeout: Union[httpx.Timeout, float, None] = DEFAULT_TIMEOUT,
+    http_client: Union[httpx.Client, httpx.AsyncClient, None] = None,
 ) -> Union[OpenAI, AsyncOpenAI]:
     """Native OpenAI-SDK client pointed at the active gateway (or forced direct).
 
@@ -301,10 +302,16 @@ def openai_client(
     (~30s) so the voice hot path never inherits the SDK's 600s default; call
     sites that legitimately run long (offline generation) should pass
     ``GENERATION_TIMEOUT`` or another explicit override.
+
+    ``http_client`` lets several clients share one connection pool (the
+    owner closes it); ``timeout`` still applies per request. ``None`` gives
+    each client its own pool, as before.
     """
     base_url, api_key = _base_url_and_key(direct)
     cls = AsyncOpenAI if async_ else OpenAI
-    return cls(api_key=api_key, base_url=base_url, timeout=timeout)
+    return cls(
+        api_key=api_key, base_url=base_url, timeout=timeout, http_client=http_client
+    )
 
 
 def _chat_bedrock(model_id: str, **kwargs):
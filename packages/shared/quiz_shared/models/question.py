@@ -1,6 +1,7 @@
 """Question model with support for multiple question types."""
 
-import uuid
+import itertools
+import time
 from datetime import datetime
 from typing import Dict, List, Literal, Optional, Union, Any
 from typing_extensions import NotRequired, TypedDict
@@ -14,6 +15,13 @@ from pydantic import (
 )
 
 
+# Placeholder ids for payloads without one. They only need to be unique within
+# this process (storage and the generation stage swap them for real ids before
+# anything persists), so a counter does instead of a uuid4 per row.
+_TEMP_ID_EPOCH = f"{int(time.time()):08x}"
+_temp_id_counter = itertools.count()
+
+
 QuestionType = Literal["text", "text_multichoice", "audio", "image", "video"]
 _ALLOWED_QUESTION_TYPES: frozenset[str] = frozenset(
     {"text", "text_multichoice", "audio", "image", "video"}
@@ -305,7 +313,11 @@ class Question(BaseModel):
             default_difficulty: Fallback difficulty
             default_category: Fallback category
         """
-        question_id = data.get("id", f"temp_{uuid.uuid4().hex[:8]}")
+        question_id = (
+            data["id"]
+            if "id" in data
+            else f"temp_{_TEMP_ID_EPOCH}_{next(_temp_id_counter):x}"
+        )
 
         # Extract V2 CoT fields
         reasoning = data.get("reasoning", {})
@@ -328,31 +340,35 @@ class Question(BaseModel):
             if "self_critique_reasoning" in data:
                 self_critique["reasoning"] = data["self_critique_reasoning"]
 
-        # Build generation metadata
-        generation_metadata: Optional[Dict[str, Any]] = None
-        quality_ratings: Optional[Dict[str, int]] = None
-
-        if reasoning or self_critique:
-            generation_metadata = {}
-            if reasoning:
-                generation_metadata["reasoning"] = reasoning
-            if self_critique:
-                generation_metadata["self_critique"] = self_critique
-                generation_metadata["ai_score"] = self_critique.get("overall_score", 0)
-                generation_metadata["ai_reasoning"] = self_critique.get("reasoning", "")
-                quality_ratings = {
-                    "surprise_factor": self_critique.get("surprise_factor", 0),
-                    "universal_appeal": self_critique.get("universal_appeal", 0),
-                    "clever_framing": self_critique.get("clever_framing", 0),
-                    "educational_value": self_critique.get("educational_value", 0),
-                    "answerability": self_critique.get("answerability", 0),
-                }
-
-        # Use explicitly provided generation_metadata/quality_ratings if present
-        if "generation_metadata" in data and data["generation_metadata"]:
-            generation_metadata = data["generation_metadata"]
-        if "quality_ratings" in data and data["quality_ratings"]:
-            quality_ratings = data["quality_ratings"]
+        # Explicitly provided generation_metadata/quality_ratings win; only
+        # derive them from the CoT fields when the caller didn't supply them,
+        # so the derived dicts aren't built just to be thrown away.
+        generation_metadata: Optional[Dict[str, Any]] = (
+            data.get("generation_metadata") or None
+        )
+        quality_ratings: Optional[Dict[str, int]] = data.get("quality_ratings") or None
+
+        if generation_metadata is None and (reasoning or self_critique):
+            generation_metadata = {
+                **({"reasoning": reasoning} if reasoning else {}),
+                **(
+                    {
+                        "self_critique": self_critique,
+                        "ai_score": self_critique.get("overall_score", 0),
+                        "ai_reasoning": self_critique.get("reasoning", ""),
+                    }
+                    if self_critique
+                    else {}
+                ),
+            }
+        if quality_ratings is None and self_critique:
+            quality_ratings = {
+                "surprise_factor": self_critique.get("surprise_factor", 0),
+                "universal_appeal": self_critique.get("universal_appeal", 0),
+                "clever_framing": self_critique.get("clever_framing", 0),
+                "educational_value": self_critique.get("educational_value", 0),
+                "answerability": self_critique.get("answerability", 0),
+            }
 
         # Issue #46 task 46.B4c — the open/lateral-puzzle prompt
         # (question_generation_open.md) may emit `correct_answer: null`, but the
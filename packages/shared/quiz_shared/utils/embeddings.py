@@ -1,8 +1,11 @@
 """Embedding generation and similarity utilities for RAG."""
 
-import numpy as np
+import hashlib
+from collections import OrderedDict
 from typing import List, Optional
 
+import numpy as np
+
 from quiz_shared.llm import factory as llm_factory
 
 # Module-level cached clients to avoid creating a new instance per call.
@@ -10,6 +13,32 @@ from quiz_shared.llm import factory as llm_factory
 _openai_client = None
 _async_openai_client = None
 
+# Bounded LRU of gateway embeddings keyed by sha256(model + text). Duplicate
+# checks and diversity scoring re-embed the same question text over and over;
+# a hit replaces an embedding round trip with a hash + dict lookup. Each entry
+# is a ~1536-float list (tens of KB as Python floats), hence the modest bound.
+EMBEDDING_CACHE_SIZE = 512
+_embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+
+def _cache_key(model: str, text: str) -> bytes:
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).digest()
+
+
+def _cache_get(key: bytes) -> Optional[List[float]]:
+    cached = _embedding_cache.get(key)
+    if cached is None:
+        return None
+    _embedding_cache.move_to_end(key)
+    return list(cached)  # callers may mutate; never hand out the cached list
+
+
+def _cache_put(key: bytes, embedding: List[float]) -> None:
+    _embedding_cache[key] = list(embedding)
+    _embedding_cache.move_to_end(key)
+    while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
+
 
 def _get_openai_client(api_key: Optional[str] = None):
     """Get or create a cached embeddings client, routed through the gateway."""
@@ -54,6 +83,11 @@ def generate_embedding(
         >>> len(embedding)
         1536
     """
+    # Explicit key bypasses the cache too (testing / alternate keys).
+    key = None if api_key else _cache_key(model, text)
+    if key is not None and (cached := _cache_get(key)) is not None:
+        return cached
+
     client = _get_openai_client(api_key)
 
     # An explicit key forces canonical OpenAI, so the model id is used as-is;
@@ -62,7 +96,10 @@ def generate_embedding(
     resolved = model if api_key else llm_factory.resolve_model(model)
     response = client.embeddings.create(model=resolved, input=text)
 
-    return response.data[0].embedding
+    embedding = response.data[0].embedding
+    if key is not None:
+        _cache_put(key, embedding)
+    return embedding
 
 
 async def generate_embedding_async(
@@ -75,12 +112,49 @@ async def generate_embedding_async(
     embeds on every question lookup, so a blocking call there caps the whole
     process at roughly one retrieval per embedding round trip; the synchronous
     function stays for the synchronous callers (worker dedup, admin, scripts).
+    Both share the same LRU cache.
     """
+    key = None if api_key else _cache_key(model, text)
+    if key is not None and (cached := _cache_get(key)) is not None:
+        return cached
+
     client = _get_async_openai_client(api_key)
     resolved = model if api_key else llm_factory.resolve_model(model)
     response = await client.embeddings.create(model=resolved, input=text)
 
-    return response.data[0].embedding
+    embedding = response.data[0].embedding
+    if key is not None:
+        _cache_put(key, embedding)
+    return embedding
+
+
+async def generate_embeddings_async(
+    texts: List[str], model: str = "text-embedding-3-small"
+) -> List[List[float]]:
+    """Embed several texts, in order, with ONE embeddings request for the misses.
+
+    Cache hits are served locally; the rest go out as a single batched
+    ``input=[...]`` call instead of one round trip per text. Same gateway,
+    model resolution and cache as :func:`generate_embedding_async`.
+    """
+    keys = [_cache_key(model, t) for t in texts]
+    result: List[Optional[List[float]]] = [_cache_get(k) for k in keys]
+    # One request slot per distinct missing text; repeats share its vector.
+    missing = list(dict.fromkeys(t for t, v in zip(texts, result) if v is None))
+    if missing:
+        client = _get_async_openai_client()
+        response = await client.embeddings.create(
+            model=llm_factory.resolve_model(model), input=missing
+        )
+        fetched = {}
+        for item in sorted(response.data, key=lambda d: d.index):
+            text = missing[item.index]
+            fetched[text] = item.embedding
+            _cache_put(_cache_key(model, text), item.embedding)
+        result = [
+            v if v is not None else list(fetched[t]) for t, v in zip(texts, result)
+        ]
+    return result
 
 
 def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> float:
@@ -140,12 +214,17 @@ def is_duplicate(
 
     question_embedding = generate_embedding(question_text)
 
-    similarities = [
-        calculate_similarity(question_embedding, existing_emb)
-        for existing_emb in existing_embeddings
-    ]
-
-    max_similarity = max(similarities)
+    # One contiguous float32 matrix and a single GEMV instead of N pairwise
+    # float64 round trips through calculate_similarity. float32 halves the
+    # bytes streamed per row at ~1e-7 cosine error — far below any threshold
+    # margin; int8 (~1e-2) is not, so it is deliberately not used here.
+    matrix = np.asarray(existing_embeddings, dtype=np.float32)
+    query = np.asarray(question_embedding, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    dots = matrix @ query
+    similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+
+    max_similarity = float(similarities.max())
     is_dup = max_similarity >= threshold
 
     return is_dup, max_similarity
@@ -0,0 +1,99 @@
+"""Embedding LRU cache: repeated text must not re-hit the embeddings API.
+
+Duplicate checks and diversity scoring embed the same question text again and
+again; each miss is a paid network round trip. The cache is keyed on
+(model, text), bounded, and must never hand out its own list — a caller that
+mutates the returned vector would otherwise corrupt every later hit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from quiz_shared.utils import embeddings
+
+
+class _FakeEmbeddings:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def create(self, model: str, input: str):
+        self.calls.append((model, input))
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(input)), 1.0])])
+
+
+@pytest.fixture
+def fake(monkeypatch) -> _FakeEmbeddings:
+    fake = _FakeEmbeddings()
+    monkeypatch.setattr(
+        embeddings, "_get_openai_client", lambda api_key=None: SimpleNamespace(embeddings=fake)
+    )
+    monkeypatch.setattr(embeddings.llm_factory, "resolve_model", lambda model: model)
+    monkeypatch.setattr(embeddings, "_embedding_cache", embeddings.OrderedDict())
+    return fake
+
+
+def test_repeated_text_is_embedded_once(fake) -> None:
+    first = embeddings.generate_embedding("What is the capital of France?")
+    second = embeddings.generate_embedding("What is the capital of France?")
+
+    assert first == second
+    assert len(fake.calls) == 1
+
+
+def test_cache_is_keyed_on_model(fake) -> None:
+    embeddings.generate_embedding("same text", model="text-embedding-3-small")
+    embeddings.generate_embedding("same text", model="text-embedding-3-large")
+
+    assert len(fake.calls) == 2
+
+
+def test_returned_vector_is_a_copy(fake) -> None:
+    embeddings.generate_embedding("mutate me").append(99.0)
+
+    assert embeddings.generate_embedding("mutate me") == [9.0, 1.0]
+
+
+def test_cache_evicts_least_recently_used(fake, monkeypatch) -> None:
+    monkeypatch.setattr(embeddings, "EMBEDDING_CACHE_SIZE", 2)
+    embeddings.generate_embedding("a")
+    embeddings.generate_embedding("b")
+    embeddings.generate_embedding("a")  # refresh "a"
+    embeddings.generate_embedding("c")  # evicts "b"
+    fake.calls.clear()
+
+    embeddings.generate_embedding("a")
+    embeddings.generate_embedding("b")
+
+    assert [text for _, text in fake.calls] == ["b"]
+
+
+def test_batch_embeds_only_misses_in_one_request(fake, monkeypatch) -> None:
+    batch_calls: list[list[str]] = []
+
+    class _AsyncFakeEmbeddings:
+        async def create(self, model: str, input: list[str]):
+            batch_calls.append(list(input))
+            return SimpleNamespace(
+                data=[
+                    SimpleNamespace(index=i, embedding=[float(len(text)), 1.0])
+                    for i, text in enumerate(input)
+                ]
+            )
+
+    monkeypatch.setattr(
+        embeddings,
+        "_get_async_openai_client",
+        lambda api_key=None: SimpleNamespace(embeddings=_AsyncFakeEmbeddings()),
+    )
+    embeddings.generate_embedding("cached")
+
+    vectors = asyncio.run(
+        embeddings.generate_embeddings_async(["ab", "cached", "abc", "ab"])
+    )
+
+    assert vectors == [[2.0, 1.0], [6.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+    assert batch_calls == [["ab", "abc"]]
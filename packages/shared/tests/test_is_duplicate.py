@@ -0,0 +1,37 @@
+"""``is_duplicate`` scores a question against many stored embeddings at once.
+
+The vectorized float32 scan must agree with the pairwise
+``calculate_similarity`` it replaced — a dedup verdict that flips because of
+the arithmetic change would silently ship (or drop) a question.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from quiz_shared.utils import embeddings
+
+
+@pytest.fixture
+def query_vec(monkeypatch) -> list[float]:
+    vec = [1.0, 2.0, 0.0, 3.0]
+    monkeypatch.setattr(embeddings, "generate_embedding", lambda text: vec)
+    return vec
+
+
+def test_matches_pairwise_cosine(query_vec) -> None:
+    rng = np.random.default_rng(0)
+    existing = rng.normal(size=(50, 4)).tolist() + [[2.0, 4.0, 0.0, 6.0]]
+
+    is_dup, score = embeddings.is_duplicate("q", existing, threshold=0.85)
+
+    expected = max(embeddings.calculate_similarity(query_vec, e) for e in existing)
+    assert score == pytest.approx(expected, abs=1e-6)
+    assert is_dup is True  # the scaled copy is cosine 1.0
+
+
+def test_zero_vector_scores_zero_not_nan(query_vec) -> None:
+    is_dup, score = embeddings.is_duplicate("q", [[0.0, 0.0, 0.0, 0.0]])
+
+    assert (is_dup, score) == (False, 0.0)
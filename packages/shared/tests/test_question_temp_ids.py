@@ -0,0 +1,17 @@
+"""Placeholder ids minted by ``Question.from_dict`` for id-less payloads."""
+
+from quiz_shared.models.question import Question
+
+
+def _payload(n: int) -> dict:
+    return {"question": f"Q{n}?", "correct_answer": "A", "topic": "T"}
+
+
+def test_temp_ids_are_unique_and_recognisable():
+    ids = [Question.from_dict(_payload(n)).id for n in range(1000)]
+    assert len(set(ids)) == 1000
+    assert all(i.startswith("temp_") for i in ids)
+
+
+def test_payload_id_is_kept():
+    assert Question.from_dict({**_payload(0), "id": "q_given"}).id == "q_given"